@@ -0,0 +1,82 @@
+"""
+Compare the size and encode/decode time of the object (dict) form written
+by `dataclass_encoder` against the positional (array) form written by
+`dataclass_array_encoder`, with and without a schema header.
+"""
+import dataclasses
+import json
+from timeit import timeit
+
+from ducktools.jsonkit import (
+    dataclass_encoder,
+    dataclass_decoder,
+    dataclass_array_encoder,
+    dataclass_array_decoder,
+    dataclass_schema,
+)
+
+
+ITERATIONS = 50
+
+
+@dataclasses.dataclass
+class Member:
+    id: int
+    active: bool
+
+
+@dataclasses.dataclass
+class Object:
+    id: int
+    name: str
+    members: list[Member]
+
+
+objects_as_dataclass = [
+    Object(i, str(i) * 3, [Member(j, True) for j in range(0, 10)])
+    for i in range(100000, 102000)
+]
+
+hint = list[Object]
+schema = dataclass_schema(hint)
+
+dict_encode = dataclass_encoder(hint)
+dict_decode = dataclass_decoder(hint)
+array_encode = dataclass_array_encoder(hint)
+array_decode = dataclass_array_decoder(hint)
+schema_decode = dataclass_array_decoder(hint, schema)
+
+
+def array_encode_with_schema(o):
+    return f'{{"schema": {json.dumps(schema)}, "data": {array_encode(o)}}}'
+
+
+def array_decode_with_schema(s):
+    message = json.loads(s)
+    return dataclass_array_decoder(hint, message["schema"])(message["data"])
+
+
+dict_json = dict_encode(objects_as_dataclass)
+array_json = array_encode(objects_as_dataclass)
+schema_json = array_encode_with_schema(objects_as_dataclass)
+
+assert (
+    objects_as_dataclass
+    == dict_decode(json.loads(dict_json))
+    == array_decode(json.loads(array_json))
+    == array_decode_with_schema(schema_json)
+)
+
+methods = [
+    ("object", dict_encode, lambda s: dict_decode(json.loads(s)), dict_json),
+    ("array", array_encode, lambda s: array_decode(json.loads(s)), array_json),
+    ("array + schema", array_encode_with_schema, array_decode_with_schema, schema_json),
+]
+
+print("| Method         | Size /KiB | Encode /s | Decode /s |")
+print("| -------------- | --------- | --------- | --------- |")
+for name, encode, decode, data in methods:
+    size = len(data) / 1024
+    time_encode = timeit(lambda: encode(objects_as_dataclass), number=ITERATIONS)
+    time_decode = timeit(lambda: decode(data), number=ITERATIONS)
+    print(f"| {name:<14} |  {size:7.1f}  |  {time_encode:.3f}    |  {time_decode:.3f}    |")
@@ -6,6 +6,8 @@ import attrs
 from attrs import define
 import cattrs.preconf.json
 
+from ducktools.jsonkit import attrs_default
+
 
 ITERATIONS = 20
 
@@ -88,13 +90,25 @@ def exec_serialize(o):
     return json.dumps(o, default=exec_default)
 
 
+def jsonkit_serialize(o):
+    return json.dumps(o, default=attrs_default)
+
+
 attrs_basic = attrs_unstructure(objects_as_dataclass)
 attrs_norecurse = attrs_nonrecursive_default(objects_as_dataclass)
 cattrs_result = cattrs_serialize(objects_as_dataclass)
 basic_result = basic_serialize(objects_as_dataclass)
 exec_result = exec_serialize(objects_as_dataclass)
-
-assert attrs_basic == attrs_norecurse == cattrs_result == basic_result == exec_result
+jsonkit_result = jsonkit_serialize(objects_as_dataclass)
+
+assert (
+    attrs_basic
+    == attrs_norecurse
+    == cattrs_result
+    == basic_result
+    == exec_result
+    == jsonkit_result
+)
 
 recurse_time = timeit(
     lambda: attrs_unstructure(objects_as_dataclass),
@@ -121,4 +135,16 @@ exec_time = timeit(
     number=ITERATIONS
 )
 
-print(recurse_time, norecurse_time, cattrs_time, basic_time, exec_time)
+jsonkit_time = timeit(
+    lambda: jsonkit_serialize(objects_as_dataclass),
+    number=ITERATIONS
+)
+
+print("| Method           | Time /s | Time /attrs_default |")
+print("| ---------------- | ------- | ------------------- |")
+print(f"| attrs asdict     |  {recurse_time:.3f}  |  {recurse_time/jsonkit_time:5.1f} |")
+print(f"| asdict norecurse |  {norecurse_time:.3f}  |  {norecurse_time/jsonkit_time:5.1f} |")
+print(f"| cattrs           |  {cattrs_time:.3f}  |  {cattrs_time/jsonkit_time:5.1f} |")
+print(f"| basic asdict     |  {basic_time:.3f}  |  {basic_time/jsonkit_time:5.1f} |")
+print(f"| exec asdict      |  {exec_time:.3f}  |  {exec_time/jsonkit_time:5.1f} |")
+print(f"| attrs_default    |  {jsonkit_time:.3f}  |  {jsonkit_time/jsonkit_time:5.1f} |")
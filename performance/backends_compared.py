@@ -0,0 +1,80 @@
+"""
+Compare `json.dumps` against the `dumps` facade with each installed backend,
+using the same 'default' function for dataclasses.
+"""
+import dataclasses
+import json
+from timeit import timeit
+
+from ducktools.jsonkit import available_backends, dataclass_default, dumps
+
+
+ITERATIONS = 100
+
+
+@dataclasses.dataclass
+class Member:
+    id: int
+    active: bool
+
+
+@dataclasses.dataclass
+class Object:
+    id: int
+    name: str
+    members: list[Member]
+
+
+objects_as_dataclass = [
+    Object(i, str(i) * 3, [Member(j, True) for j in range(0, 10)])
+    for i in range(100000, 102000)
+]
+
+expected = json.loads(json.dumps(objects_as_dataclass, default=dataclass_default))
+
+print("| Method                    | str /s | bytes /s |")
+print("| ------------------------- | ------ | -------- |")
+
+time_str = timeit(
+    lambda: json.dumps(objects_as_dataclass, default=dataclass_default),
+    number=ITERATIONS,
+)
+time_bytes = timeit(
+    lambda: json.dumps(objects_as_dataclass, default=dataclass_default).encode(),
+    number=ITERATIONS,
+)
+print(f"| json.dumps                |  {time_str:.3f} |  {time_bytes:.3f}   |")
+
+runs = [(backend, False) for backend in available_backends()]
+runs += [(backend, True) for backend in available_backends() if backend != "json"]
+
+for backend, strict in runs:
+    result = dumps(
+        objects_as_dataclass,
+        default=dataclass_default,
+        backend=backend,
+        strict=strict,
+    )
+    assert json.loads(result) == expected
+
+    time_str = timeit(
+        lambda: dumps(
+            objects_as_dataclass,
+            default=dataclass_default,
+            backend=backend,
+            strict=strict,
+        ),
+        number=ITERATIONS,
+    )
+    time_bytes = timeit(
+        lambda: dumps(
+            objects_as_dataclass,
+            default=dataclass_default,
+            backend=backend,
+            as_bytes=True,
+            strict=strict,
+        ),
+        number=ITERATIONS,
+    )
+    name = f"dumps ({backend}, strict)" if strict else f"dumps ({backend})"
+    print(f"| {name:<25} |  {time_str:.3f} |  {time_bytes:.3f}   |")
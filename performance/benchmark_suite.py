@@ -0,0 +1,342 @@
+"""
+Benchmark every 'default' strategy across a range of payload shapes.
+
+For each strategy and payload `json.dumps(payload, default=strategy)` is timed
+repeatedly to give throughput and latency percentiles, then run once under
+tracemalloc for the peak memory.
+
+Results can be saved as JSON and compared against a saved baseline, any
+result with a median latency more than `--threshold` slower than the baseline
+is reported as a regression and the script exits with status 1.
+
+Usage:
+    python performance/benchmark_suite.py --save baseline.json
+    python performance/benchmark_suite.py --compare baseline.json
+    python performance/benchmark_suite.py --strategies dataclass field --payloads huge
+"""
+import argparse
+import dataclasses
+import json
+import platform
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from time import perf_counter
+
+from ducktools.jsonkit import (
+    JSONRegister,
+    __version__,
+    dataclass_default,
+    field_default,
+    merge_defaults,
+    method_default,
+)
+
+
+# PAYLOADS #
+
+def _with_asdict(cls):
+    # Give each class a method for method_default
+    names = tuple(f.name for f in dataclasses.fields(cls))
+
+    def asdict(self):
+        return {name: getattr(self, name) for name in names}
+
+    cls.asdict = asdict
+    return cls
+
+
+@_with_asdict
+@dataclasses.dataclass
+class Member:
+    id: int
+    active: bool
+
+
+@_with_asdict
+@dataclasses.dataclass
+class Object:
+    id: int
+    name: str
+    members: list[Member]
+
+
+Wide = _with_asdict(
+    dataclasses.make_dataclass(
+        "Wide",
+        [(f"field_{i}", int if i % 2 else str) for i in range(50)],
+    )
+)
+
+
+@_with_asdict
+@dataclasses.dataclass
+class Node:
+    value: int
+    child: "Node | None" = None
+
+
+CLASSES = [Member, Object, Wide, Node]
+
+
+def make_small():
+    return Object(1, "one", [Member(i, True) for i in range(3)])
+
+
+def make_wide():
+    return [
+        Wide(*(j if j % 2 else str(j) for j in range(50)))
+        for _ in range(200)
+    ]
+
+
+def make_deep():
+    # Many short chains of nested objects
+    chains = []
+    for _ in range(50):
+        node = None
+        for depth in range(100):
+            node = Node(depth, node)
+        chains.append(node)
+    return chains
+
+
+def make_huge():
+    return [
+        Object(i, str(i) * 3, [Member(j, True) for j in range(10)])
+        for i in range(20_000)
+    ]
+
+
+PAYLOADS = {
+    "small": make_small,
+    "wide": make_wide,
+    "deep": make_deep,
+    "huge": make_huge,
+}
+
+
+# STRATEGIES #
+
+def make_register():
+    register = JSONRegister()
+    for cls in CLASSES:
+        register.register(cls, cls.asdict)
+    return register.default
+
+
+def make_merge():
+    # The dataclass default only sees the objects the first default rejects
+    def never(o):
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+    return merge_defaults(never, dataclass_default)
+
+
+def make_method():
+    return method_default("asdict")
+
+
+def make_field():
+    methods = {
+        cls: field_default(tuple(f.name for f in dataclasses.fields(cls)))
+        for cls in CLASSES
+    }
+
+    def default(o):
+        return methods[type(o)](o)
+
+    return default
+
+
+def make_dataclass():
+    return dataclass_default
+
+
+STRATEGIES = {
+    "register": make_register,
+    "merge": make_merge,
+    "method": make_method,
+    "field": make_field,
+    "dataclass": make_dataclass,
+}
+
+
+# MEASUREMENT #
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
+
+def calibrate(func, min_time):
+    # Number of calls needed for one sample to take at least min_time
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = perf_counter() - start
+        if elapsed >= min_time:
+            return number
+        number *= 2
+
+
+def measure(payload, default, samples, min_time):
+    def func():
+        return json.dumps(payload, default=default)
+
+    size = len(func().encode("utf-8"))
+    number = calibrate(func, min_time)
+
+    latencies = []
+    for _ in range(samples):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        latencies.append((perf_counter() - start) / number)
+    latencies.sort()
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = percentile(latencies, 0.5)
+    return {
+        "calls_per_sample": number,
+        "samples": samples,
+        "output_bytes": size,
+        "ops_per_s": 1 / median,
+        "mb_per_s": size / median / 1e6,
+        "p50_ms": median * 1000,
+        "p90_ms": percentile(latencies, 0.9) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "min_ms": latencies[0] * 1000,
+        "peak_kib": peak / 1024,
+    }
+
+
+def run(strategies, payloads, samples, min_time):
+    results = {}
+    for payload_name in payloads:
+        payload = PAYLOADS[payload_name]()
+        expected = None
+        for strategy_name in strategies:
+            default = STRATEGIES[strategy_name]()
+
+            output = json.dumps(payload, default=default)
+            if expected is None:
+                expected = output
+            elif output != expected:
+                raise AssertionError(
+                    f"{strategy_name} output differs for the {payload_name} payload"
+                )
+
+            key = f"{strategy_name}/{payload_name}"
+            results[key] = measure(payload, default, samples, min_time)
+            print(f"  {key}", file=sys.stderr)
+    return results
+
+
+# REPORTING #
+
+def print_table(results):
+    print("| Benchmark            | ops/s      | MB/s    | p50 /ms  | p90 /ms  | p99 /ms  | Peak /KiB  |")
+    print("| -------------------- | ---------- | ------- | -------- | -------- | -------- | ---------- |")
+    for key, r in results.items():
+        print(
+            f"| {key:<20} | {r['ops_per_s']:10.1f} | {r['mb_per_s']:7.1f} "
+            f"| {r['p50_ms']:8.3f} | {r['p90_ms']:8.3f} | {r['p99_ms']:8.3f} "
+            f"| {r['peak_kib']:10.1f} |"
+        )
+
+
+def compare(results, baseline, threshold):
+    """
+    Print the change in median latency against a baseline.
+
+    :return: list of benchmark names that regressed by more than threshold
+    """
+    regressions = []
+    print()
+    if baseline["meta"]["python"] != sys.version:
+        print(f"Warning: baseline was run on Python {baseline['meta']['python']}")
+        print()
+    print("| Benchmark            | Baseline p50 /ms | p50 /ms  | Change  | Status     |")
+    print("| -------------------- | ---------------- | -------- | ------- | ---------- |")
+    for key, r in results.items():
+        try:
+            old = baseline["results"][key]["p50_ms"]
+        except KeyError:
+            print(f"| {key:<20} | {'-':>16} | {r['p50_ms']:8.3f} | {'-':>7} | new        |")
+            continue
+
+        change = r["p50_ms"] / old - 1
+        if change > threshold:
+            status = "REGRESSION"
+            regressions.append(key)
+        elif change < -threshold:
+            status = "faster"
+        else:
+            status = ""
+        print(
+            f"| {key:<20} | {old:16.3f} | {r['p50_ms']:8.3f} "
+            f"| {change:+7.1%} | {status:<10} |"
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--strategies", nargs="+", choices=list(STRATEGIES), default=list(STRATEGIES)
+    )
+    parser.add_argument(
+        "--payloads", nargs="+", choices=list(PAYLOADS), default=list(PAYLOADS)
+    )
+    parser.add_argument("--samples", type=int, default=20, help="timed samples per benchmark")
+    parser.add_argument(
+        "--min-time", type=float, default=0.01, help="minimum seconds per sample"
+    )
+    parser.add_argument("--save", help="save results as JSON to this path")
+    parser.add_argument("--compare", help="compare against results saved with --save")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="fractional slowdown in median latency reported as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.strategies, args.payloads, args.samples, args.min_time)
+    print_table(results)
+
+    if args.save:
+        data = {
+            "meta": {
+                "jsonkit_version": __version__,
+                "python": sys.version,
+                "platform": platform.platform(),
+                "date": datetime.now(timezone.utc).isoformat(),
+                "samples": args.samples,
+                "min_time": args.min_time,
+            },
+            "results": results,
+        }
+        with open(args.save, "w") as f:
+            json.dump(data, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
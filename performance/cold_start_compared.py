@@ -0,0 +1,85 @@
+"""
+Compare the cost of generating serializers in a fresh process.
+
+Each mode runs in a new subprocess that defines CLASS_COUNT dataclasses and
+serializes one instance of each:
+
+* lazy: serializers are generated during the first serialization
+* precompile: serializers are generated by `precompile` before serializing
+* disk cache: as precompile but loading code stored by an earlier process
+"""
+import subprocess
+import sys
+import tempfile
+
+
+CLASS_COUNT = 500
+FIELD_COUNT = 12
+
+
+def run_mode(mode, cache_dir):
+    import dataclasses
+    import json
+    from time import perf_counter
+
+    from ducktools.jsonkit import dataclass_default, precompile, set_code_cache_dir
+
+    classes = [
+        dataclasses.make_dataclass(
+            f"Example{i}",
+            [(f"field_{i}_{j}", int) for j in range(FIELD_COUNT)],
+        )
+        for i in range(CLASS_COUNT)
+    ]
+    instances = [cls(*range(FIELD_COUNT)) for cls in classes]
+
+    if mode == "disk":
+        set_code_cache_dir(cache_dir)
+
+    start = perf_counter()
+    if mode != "lazy":
+        precompile(classes)
+    boot = perf_counter() - start
+
+    start = perf_counter()
+    for inst in instances:
+        json.dumps(inst, default=dataclass_default)
+    first_requests = perf_counter() - start
+
+    print(f"{boot} {first_requests}")
+
+
+def measure(mode, cache_dir):
+    result = subprocess.run(
+        [sys.executable, __file__, mode, cache_dir],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    boot, first_requests = (float(v) for v in result.stdout.split())
+    return boot, first_requests
+
+
+def main():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Fill the disk cache
+        measure("disk", cache_dir)
+
+        print(f"{CLASS_COUNT} dataclasses with {FIELD_COUNT} fields")
+        print()
+        print("| Mode       | Boot /ms | First requests /ms |")
+        print("| ---------- | -------- | ------------------ |")
+        for name, mode in [
+            ("lazy", "lazy"),
+            ("precompile", "precompile"),
+            ("disk cache", "disk"),
+        ]:
+            boot, first_requests = measure(mode, cache_dir)
+            print(f"| {name:<10} | {boot * 1000:8.1f} | {first_requests * 1000:18.1f} |")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        run_mode(sys.argv[1], sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,128 @@
+"""
+Compare methods of converting JSON back into the dataclasses used in
+dataclass_serializers_compared.py.
+
+cattrs is only timed if it is installed.
+"""
+from timeit import timeit
+
+import dataclasses
+
+import json
+
+from ducktools.jsonkit import (
+    dataclass_default,
+    dataclass_decoder,
+    dataclass_object_hook,
+)
+
+try:
+    import cattrs
+except ImportError:
+    cattrs = None
+
+
+ITERATIONS = 100
+
+
+# DATA INPUT #
+
+@dataclasses.dataclass
+class Member:
+    id: int
+    active: bool
+
+
+@dataclasses.dataclass
+class Object:
+    id: int
+    name: str
+    members: list[Member]
+
+
+objects_as_dataclass = [
+    Object(i, str(i) * 3, [Member(j, True) for j in range(0, 10)])
+    for i in range(100000, 102000)
+]
+
+objects_json = json.dumps(objects_as_dataclass, default=dataclass_default)
+
+
+# DECODERS #
+
+def handwritten_decode(data):
+    return [
+        Object(
+            id=item["id"],
+            name=item["name"],
+            members=[Member(id=m["id"], active=m["active"]) for m in item["members"]],
+        )
+        for item in data
+    ]
+
+
+def inspecting_hook(d):
+    # Inspect the keys of every dictionary to find the class
+    if "members" in d:
+        return Object(**d)
+    if "active" in d:
+        return Member(**d)
+    return d
+
+
+generated_decode = dataclass_decoder(list[Object])
+generated_hook = dataclass_object_hook(list[Object])
+
+
+result_handwritten = handwritten_decode(json.loads(objects_json))
+result_hook = json.loads(objects_json, object_hook=inspecting_hook)
+result_generated = generated_decode(json.loads(objects_json))
+result_generated_hook = json.loads(objects_json, object_hook=generated_hook)
+
+assert (
+    objects_as_dataclass
+    == result_handwritten
+    == result_hook
+    == result_generated
+    == result_generated_hook
+)
+
+if cattrs is not None:
+    converter = cattrs.Converter()
+    result_cattrs = converter.structure(json.loads(objects_json), list[Object])
+    assert result_cattrs == objects_as_dataclass
+
+
+time_handwritten = timeit(
+    lambda: handwritten_decode(json.loads(objects_json)),
+    number=ITERATIONS,
+)
+
+time_hook = timeit(
+    lambda: json.loads(objects_json, object_hook=inspecting_hook),
+    number=ITERATIONS,
+)
+
+time_generated = timeit(
+    lambda: generated_decode(json.loads(objects_json)),
+    number=ITERATIONS,
+)
+
+time_generated_hook = timeit(
+    lambda: json.loads(objects_json, object_hook=generated_hook),
+    number=ITERATIONS,
+)
+
+print("| Method             | Time /s | Time /generated |")
+print("| ------------------ | ------- | --------------- |")
+print(f"| handwritten        |  {time_handwritten:.3f}  |  {time_handwritten/time_generated:5.1f} |")
+print(f"| inspecting hook    |  {time_hook:.3f}  |  {time_hook/time_generated:5.1f} |")
+print(f"| generated hook     |  {time_generated_hook:.3f}  |  {time_generated_hook/time_generated:5.1f} |")
+print(f"| generated decoder  |  {time_generated:.3f}  |  {time_generated/time_generated:5.1f} |")
+
+if cattrs is not None:
+    time_cattrs = timeit(
+        lambda: converter.structure(json.loads(objects_json), list[Object]),
+        number=ITERATIONS,
+    )
+    print(f"| cattrs structure   |  {time_cattrs:.3f}  |  {time_cattrs/time_generated:5.1f} |")
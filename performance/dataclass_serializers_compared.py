@@ -10,7 +10,7 @@ import dataclasses
 
 import json
 
-from ducktools.jsonkit import dataclass_default
+from ducktools.jsonkit import dataclass_default, dataclass_encoder
 
 
 ITERATIONS = 100
@@ -55,8 +55,11 @@ result_naive = json.dumps(objects_as_dataclass, default=naive_default)
 result_simple = json.dumps(objects_as_dataclass, default=old_dc_default)
 result_cache = json.dumps(objects_as_dataclass, default=dataclass_default)
 
+objects_encoder = dataclass_encoder(list[Object])
+result_emitter = objects_encoder(objects_as_dataclass)
+
 # Check they all output the same thing
-assert result_naive == result_simple == result_cache
+assert result_naive == result_simple == result_cache == result_emitter
 
 time_naive = timeit(
     lambda: json.dumps(objects_as_dataclass, default=naive_default),
@@ -73,9 +76,15 @@ time_cache = timeit(
     number=ITERATIONS,
 )
 
+time_emitter = timeit(
+    lambda: objects_encoder(objects_as_dataclass),
+    number=ITERATIONS,
+)
+
 
 print("| Method           | Time /s | Time /cache |")
 print("| ---------------- | ------- | ----------- |")
 print(f"| json asdict      |  {time_naive:.3f}  |  {time_naive/time_cache:5.1f} |")
 print(f"| json simple      |  {time_simple:.3f}  |  {time_simple/time_cache:5.1f} |")
 print(f"| json cached      |  {time_cache:.3f}  |  {time_cache/time_cache:5.1f} |")
+print(f"| direct emitter   |  {time_emitter:.3f}  |  {time_emitter/time_cache:5.1f} |")
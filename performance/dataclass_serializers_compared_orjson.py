@@ -13,7 +13,7 @@ import orjson
 # import ujson
 # import rapidjson
 
-from ducktools.jsonkit import dataclass_default
+from ducktools.jsonkit import dataclass_default, dataclass_encoder
 
 
 ITERATIONS = 100
@@ -54,8 +54,11 @@ result_naive = json.dumps(objects_as_dataclass, default=naive_default)
 result_simple = json.dumps(objects_as_dataclass, default=old_dc_default)
 result_cache = json.dumps(objects_as_dataclass, default=dataclass_default)
 
+objects_encoder = dataclass_encoder(list[Object])
+result_emitter = objects_encoder(objects_as_dataclass)
+
 # Check they all output the same thing
-assert result_naive == result_simple == result_cache
+assert result_naive == result_simple == result_cache == result_emitter
 
 orjson_naive = orjson.dumps(objects_as_dataclass, option=orjson.OPT_PASSTHROUGH_DATACLASS, default=naive_default)
 orjson_simple = orjson.dumps(objects_as_dataclass, option=orjson.OPT_PASSTHROUGH_DATACLASS, default=old_dc_default)
@@ -79,6 +82,11 @@ time_cache = timeit(
     number=ITERATIONS,
 )
 
+time_emitter = timeit(
+    lambda: objects_encoder(objects_as_dataclass),
+    number=ITERATIONS,
+)
+
 time_orjson_naive = timeit(
     lambda: orjson.dumps(
         objects_as_dataclass,
@@ -126,6 +134,7 @@ print("| ---------------- | ------- | ------------------- |")
 print(f"| json asdict      |  {time_naive:.3f}  |  {time_naive/time_orjson:5.1f} |")
 print(f"| json simple      |  {time_simple:.3f}  |  {time_simple/time_orjson:5.1f} |")
 print(f"| json cached      |  {time_cache:.3f}  |  {time_cache/time_orjson:5.1f} |")
+print(f"| direct emitter   |  {time_emitter:.3f}  |  {time_emitter/time_orjson:5.1f} |")
 print(f"| orjson asdict    |  {time_orjson_naive:.3f}  |  {time_orjson_naive/time_orjson:5.1f} |")
 print(f"| orjson simple    |  {time_orjson_simple:.3f}  |  {time_orjson_simple/time_orjson:5.1f} |")
 print(f"| orjson cached    |  {time_orjson_cache:.3f}  |  {time_orjson_cache/time_orjson:5.1f} |")
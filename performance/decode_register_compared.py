@@ -0,0 +1,89 @@
+"""
+Compare decoding tagged dictionaries with a hand written if-chain
+object_hook against JSONDecodeRegister.
+
+Most of the dictionaries in the data are untagged and should be passed
+through, the rest use one of 10 tags.
+"""
+import json
+from decimal import Decimal
+from timeit import repeat
+
+from ducktools.jsonkit import JSONDecodeRegister
+
+
+ITERATIONS = 5
+REPEATS = 5
+TAGS = [f"Type{i}" for i in range(10)]
+
+
+def make_row(i):
+    return {
+        "id": i,
+        "name": f"row_{i}",
+        "meta": {"created": "2024-01-01", "source": "benchmark"},
+        "value": {"cls": TAGS[i % len(TAGS)], "value": str(i / 100)},
+    }
+
+
+text = json.dumps([make_row(i) for i in range(20_000)])
+
+
+def chain_hook(d):
+    # Only tagged dictionaries have the key
+    if "cls" not in d:
+        return d
+    cls = d["cls"]
+    if cls == "Type0":
+        return Decimal(d["value"])
+    if cls == "Type1":
+        return Decimal(d["value"])
+    if cls == "Type2":
+        return Decimal(d["value"])
+    if cls == "Type3":
+        return Decimal(d["value"])
+    if cls == "Type4":
+        return Decimal(d["value"])
+    if cls == "Type5":
+        return Decimal(d["value"])
+    if cls == "Type6":
+        return Decimal(d["value"])
+    if cls == "Type7":
+        return Decimal(d["value"])
+    if cls == "Type8":
+        return Decimal(d["value"])
+    if cls == "Type9":
+        return Decimal(d["value"])
+    return d
+
+
+def structure_decimal(d):
+    return Decimal(d["value"])
+
+
+register = JSONDecodeRegister()
+for tag in TAGS:
+    register.register(tag, structure_decimal)
+frozen = register.freeze()
+
+result = json.loads(text, object_hook=chain_hook)
+assert (
+    result
+    == json.loads(text, object_hook=register.object_hook)
+    == json.loads(text, object_hook=frozen)
+)
+
+methods = [
+    ("no hook", None),
+    ("if chain", chain_hook),
+    ("register", register.object_hook),
+    ("frozen", frozen),
+]
+
+print("| Method           | Time /s |")
+print("| ---------------- | ------- |")
+for name, hook in methods:
+    elapsed = min(
+        repeat(lambda: json.loads(text, object_hook=hook), number=ITERATIONS, repeat=REPEATS)
+    )
+    print(f"| {name:<16} |  {elapsed:.3f}  |")
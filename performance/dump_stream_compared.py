@@ -0,0 +1,70 @@
+"""
+Compare writing a large number of dataclass rows to a file with `json.dump`
+on a materialised list against `dump_stream` on a generator.
+
+Peak memory is measured with tracemalloc and includes building the list
+for the `json` methods.
+"""
+import dataclasses
+import json
+import os
+import tracemalloc
+from time import perf_counter
+
+from ducktools.jsonkit import dataclass_default, dump_stream
+
+
+ROWS = 200_000
+
+
+@dataclasses.dataclass
+class Row:
+    id: int
+    name: str
+    active: bool
+    score: float
+
+
+def make_rows():
+    for i in range(ROWS):
+        yield Row(i, str(i) * 3, i % 2 == 0, i / 7)
+
+
+def json_dump(fp):
+    json.dump(list(make_rows()), fp, default=dataclass_default)
+
+
+def json_dumps(fp):
+    fp.write(json.dumps(list(make_rows()), default=dataclass_default))
+
+
+def stream_dump(fp):
+    dump_stream(make_rows(), fp, default=dataclass_default)
+
+
+def measure(func):
+    # Time and memory are measured separately as tracemalloc slows allocation
+    with open(os.devnull, "w") as fp:
+        start = perf_counter()
+        func(fp)
+        elapsed = perf_counter() - start
+
+        tracemalloc.start()
+        func(fp)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+
+# Warm the dataclass_default cache
+json.dumps(next(make_rows()), default=dataclass_default)
+
+print("| Method           | Time /s | Peak /MiB |")
+print("| ---------------- | ------- | --------- |")
+for name, func in [
+    ("json dump list", json_dump),
+    ("json dumps list", json_dumps),
+    ("dump_stream", stream_dump),
+]:
+    elapsed, peak = measure(func)
+    print(f"| {name:<16} |  {elapsed:.3f}  |  {peak:7.1f}  |")
@@ -0,0 +1,89 @@
+"""
+Measure how long the event loop is blocked while serializing a large list
+of dataclasses with `json.dumps` compared to `encode_async` with different
+time budgets.
+
+A ticker task records the gaps between the times it gets control.
+"""
+import asyncio
+import dataclasses
+import json
+from time import perf_counter
+
+from ducktools.jsonkit import dataclass_default, encode_async
+
+
+ROWS = 200_000
+TIME_BUDGETS = [0.001, 0.005, 0.020]
+
+
+@dataclasses.dataclass
+class Row:
+    id: int
+    name: str
+    active: bool
+    score: float
+
+
+class NullWriter:
+    def write(self, data):
+        pass
+
+    async def drain(self):
+        pass
+
+
+rows = [Row(i, str(i) * 3, i % 2 == 0, i / 7) for i in range(ROWS)]
+
+
+async def measure(encode):
+    gaps = []
+    done = False
+
+    async def ticker():
+        last = perf_counter()
+        while not done:
+            await asyncio.sleep(0)
+            now = perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+
+    start = perf_counter()
+    await encode()
+    total = perf_counter() - start
+
+    done = True
+    await task
+    gaps.sort()
+    return total, gaps[-1], gaps[int(len(gaps) * 0.99)]
+
+
+async def dumps():
+    NullWriter().write(json.dumps(rows, default=dataclass_default).encode("utf-8"))
+
+
+def encode_async_budget(budget):
+    async def encode():
+        await encode_async(rows, NullWriter(), default=dataclass_default, time_budget=budget)
+    return encode
+
+
+async def main():
+    print("| Method               | Total /s | Max block /ms | p99 block /ms |")
+    print("| -------------------- | -------- | ------------- | ------------- |")
+    methods = [("json dumps", dumps)] + [
+        (f"encode_async {budget * 1000:g}ms", encode_async_budget(budget))
+        for budget in TIME_BUDGETS
+    ]
+    for name, encode in methods:
+        total, max_gap, p99 = await measure(encode)
+        print(
+            f"| {name:<20} |  {total:.3f}   |  {max_gap * 1000:8.1f}     "
+            f"|  {p99 * 1000:8.1f}     |"
+        )
+
+
+asyncio.run(main())
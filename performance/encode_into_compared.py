@@ -0,0 +1,73 @@
+"""
+Compare producing UTF-8 JSON for a large response with `json.dumps().encode()`
+against `encode_into` writing into a bytearray and into a binary file.
+
+Peak memory is measured with tracemalloc and excludes the data being encoded.
+The bytearray holds the whole output so is at least the size of the result.
+"""
+import dataclasses
+import json
+import os
+import tracemalloc
+from time import perf_counter
+
+from ducktools.jsonkit import dataclass_default, encode_into
+
+
+ROWS = 200_000
+
+
+@dataclasses.dataclass
+class Row:
+    id: int
+    name: str
+    active: bool
+    score: float
+
+
+rows = [Row(i, str(i) * 3, i % 2 == 0, i / 7) for i in range(ROWS)]
+payload = {"count": ROWS, "rows": rows}
+
+
+def dumps_encode(fp):
+    return json.dumps(payload, default=dataclass_default).encode("utf-8")
+
+
+def into_bytearray(fp):
+    buffer = bytearray()
+    encode_into(payload, buffer, default=dataclass_default)
+    return buffer
+
+
+def into_file(fp):
+    encode_into(payload, fp, default=dataclass_default)
+
+
+def measure(func):
+    # Time and memory are measured separately as tracemalloc slows allocation
+    with open(os.devnull, "wb") as fp:
+        start = perf_counter()
+        func(fp)
+        elapsed = perf_counter() - start
+
+        tracemalloc.start()
+        func(fp)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+
+assert dumps_encode(None) == into_bytearray(None)
+
+size = len(dumps_encode(None)) / (1024 * 1024)
+print(f"Output size: {size:.1f} MiB")
+print()
+print("| Method             | Time /s | Peak /MiB |")
+print("| ------------------ | ------- | --------- |")
+for name, func in [
+    ("dumps().encode()", dumps_encode),
+    ("encode_into buffer", into_bytearray),
+    ("encode_into file", into_file),
+]:
+    elapsed, peak = measure(func)
+    print(f"| {name:<18} |  {elapsed:.3f}  |  {peak:7.1f}  |")
@@ -0,0 +1,93 @@
+"""
+Check the import time of ducktools.jsonkit against a budget.
+
+Runs `python -X importtime -c "import ducktools.jsonkit"` in a subprocess
+several times and takes the fastest cumulative time for the package, so
+one slow run does not cause a failure. Bytecode writing is enabled and a
+first run is discarded so the times do not include compiling the source.
+
+Exits with status 1 if the import time is over budget.
+
+Usage: python performance/import_time.py [budget_us]
+"""
+import os
+import subprocess
+import sys
+
+
+MODULE = "ducktools.jsonkit"
+BUDGET_US = 3_000
+RUNS = 10
+
+# Modules that should only be imported when the features using them are used
+DEFERRED_MODULES = [
+    "ducktools.classbuilder",
+    "ducktools.jsonkit._caching_tools",
+    "ducktools.jsonkit._register",
+    "dataclasses",
+    "json",
+]
+
+
+def parse_importtime(stderr):
+    """
+    Parse `-X importtime` output into {module: (self_us, cumulative_us)}
+    """
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # Header line
+        times[fields[2].strip()] = (self_us, cumulative_us)
+    return times
+
+
+def measure():
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return parse_importtime(result.stderr)
+
+
+def main():
+    budget = int(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_US
+
+    measure()  # Write bytecode caches
+    runs = [measure() for _ in range(RUNS)]
+    best = min(runs, key=lambda times: times[MODULE][1])
+
+    print("| Module | Self /us | Cumulative /us |")
+    print("| ------ | -------- | -------------- |")
+    for name, (self_us, cumulative_us) in best.items():
+        if name.startswith("ducktools"):
+            print(f"| {name} | {self_us} | {cumulative_us} |")
+
+    failed = False
+
+    eager = [name for name in DEFERRED_MODULES if name in best]
+    if eager:
+        print(f"\nFAIL: modules imported eagerly: {', '.join(eager)}")
+        failed = True
+
+    cumulative = best[MODULE][1]
+    if cumulative > budget:
+        print(f"\nFAIL: import of {MODULE} took {cumulative}us, budget {budget}us")
+        failed = True
+    else:
+        print(f"\nOK: import of {MODULE} took {cumulative}us, budget {budget}us")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
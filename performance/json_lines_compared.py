@@ -0,0 +1,49 @@
+"""
+Compare writing JSON Lines by calling `dumps` for each record against
+JSONLinesWriter, which reuses one encoder and writes in large chunks.
+"""
+import dataclasses
+import io
+import json
+from timeit import timeit
+
+from ducktools.jsonkit import JSONLinesWriter, dataclass_default
+
+
+ITERATIONS = 10
+
+
+@dataclasses.dataclass
+class Event:
+    id: int
+    kind: str
+    source: str
+    value: float
+
+
+events = [Event(i, "update", f"sensor_{i % 50}", i / 3) for i in range(100_000)]
+
+
+def dumps_per_record():
+    fp = io.StringIO()
+    for event in events:
+        fp.write(json.dumps(event, default=dataclass_default) + "\n")
+    return fp.getvalue()
+
+
+def lines_writer():
+    fp = io.StringIO()
+    with JSONLinesWriter(fp, default=dataclass_default) as writer:
+        writer.write_many(events)
+    return fp.getvalue()
+
+
+assert dumps_per_record() == lines_writer()
+
+time_dumps = timeit(dumps_per_record, number=ITERATIONS)
+time_writer = timeit(lines_writer, number=ITERATIONS)
+
+print("| Method           | Time /s | Time /writer |")
+print("| ---------------- | ------- | ------------ |")
+print(f"| dumps per record |  {time_dumps:.3f}  |  {time_dumps/time_writer:5.1f} |")
+print(f"| JSONLinesWriter  |  {time_writer:.3f}  |  {time_writer/time_writer:5.1f} |")
@@ -0,0 +1,126 @@
+"""
+Compare the peak RSS of reading a large JSON array of rows with `json.load`
+against iterating over it with `load_stream`.
+
+Each method runs in a fresh subprocess as peak RSS can only grow, the best
+time and highest peak of `REPEATS` runs are shown. The 'baseline' method
+only imports the modules and opens the file.
+Unix only as it uses the resource module.
+"""
+import dataclasses
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+from ducktools.jsonkit import dataclass_decoder, dataclass_default, dump_stream, load_stream
+
+
+ROWS = 1_000_000
+REPEATS = 3
+
+
+@dataclasses.dataclass
+class Row:
+    id: int
+    name: str
+    active: bool
+    score: float
+
+
+def make_rows():
+    for i in range(ROWS):
+        yield Row(i, str(i) * 3, i % 2 == 0, i / 7)
+
+
+def baseline(fp):
+    return 0
+
+
+def json_load(fp):
+    return len(json.load(fp))
+
+
+def json_load_decoder(fp):
+    return len(dataclass_decoder(list[Row])(json.load(fp)))
+
+
+def stream(fp):
+    count = 0
+    for _ in load_stream(fp):
+        count += 1
+    return count
+
+
+def stream_decoder(fp):
+    count = 0
+    for _ in load_stream(fp, decoder=dataclass_decoder(Row)):
+        count += 1
+    return count
+
+
+def stream_binary(fp):
+    count = 0
+    for _ in load_stream(fp.buffer):
+        count += 1
+    return count
+
+
+METHODS = {
+    "baseline": baseline,
+    "json.load": json_load,
+    "json.load + decoder": json_load_decoder,
+    "load_stream": stream,
+    "load_stream decoder": stream_decoder,
+    "load_stream binary": stream_binary,
+}
+
+
+def run_method(name, path):
+    with open(path) as fp:
+        start = perf_counter()
+        count = METHODS[name](fp)
+        elapsed = perf_counter() - start
+
+    # ru_maxrss is in KiB on Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"count": count, "elapsed": elapsed, "peak": peak}))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rows.json")
+        with open(path, "w") as f:
+            dump_stream(make_rows(), f, default=dataclass_default)
+        size = os.path.getsize(path) / (1024 * 1024)
+
+        print(f"{ROWS} rows, {size:.1f} MiB file")
+        print()
+        print("| Method              | Time /s | Peak RSS /MiB |")
+        print("| ------------------- | ------- | ------------- |")
+        for name in METHODS:
+            results = []
+            for _ in range(REPEATS):
+                output = subprocess.run(
+                    [sys.executable, __file__, name, path],
+                    capture_output=True,
+                    check=True,
+                    text=True,
+                ).stdout
+                result = json.loads(output)
+                assert name == "baseline" or result["count"] == ROWS
+                results.append(result)
+
+            elapsed = min(r["elapsed"] for r in results)
+            peak = max(r["peak"] for r in results)
+            print(f"| {name:<19} |  {elapsed:.3f}  |  {peak:11.1f}  |")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        run_method(sys.argv[1], sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,66 @@
+"""
+Compare the original exception driven merge_defaults closure against the
+version that remembers which default handled each type.
+
+Each object is only handled by the last default in the chain so the original
+raises and catches a TypeError for every other default on every call.
+"""
+from timeit import timeit
+
+import json
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+
+from ducktools.jsonkit import merge_defaults
+
+
+ITERATIONS = 20
+
+
+def old_merge_defaults(*defaults):
+    def default(o):
+        for func in defaults:
+            try:
+                return func(o)
+            except TypeError:
+                pass
+        else:
+            raise TypeError(
+                f"Object of type {type(o).__name__} is not JSON serializable"
+            )
+
+    return default
+
+
+def make_default(cls, func):
+    def default(o):
+        if isinstance(o, cls):
+            return func(o)
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+    return default
+
+
+defaults = [
+    make_default(Path, str),
+    make_default(Fraction, str),
+    make_default(set, sorted),
+    make_default(frozenset, sorted),
+    make_default(Decimal, str),
+]
+
+data = [Decimal(i) / Decimal(1000) for i in range(100_000)]
+
+old_default = old_merge_defaults(*defaults)
+new_default = merge_defaults(*defaults)
+
+assert json.dumps(data, default=old_default) == json.dumps(data, default=new_default)
+
+time_old = timeit(lambda: json.dumps(data, default=old_default), number=ITERATIONS)
+time_new = timeit(lambda: json.dumps(data, default=new_default), number=ITERATIONS)
+
+print("| Method           | Time /s | Time /cache |")
+print("| ---------------- | ------- | ----------- |")
+print(f"| json fallthrough |  {time_old:.3f}  |  {time_old/time_new:5.1f} |")
+print(f"| json cached      |  {time_new:.3f}  |  {time_new/time_new:5.1f} |")
@@ -0,0 +1,63 @@
+"""
+Compare the original dynamic getattr method_default against the version
+that resolves the method once per class.
+
+The 'missing' case times objects without the method, as happens when the
+method default is the first of several defaults given to merge_defaults.
+"""
+from timeit import timeit
+
+from ducktools.jsonkit import method_default
+
+
+ITERATIONS = 1_000_000
+
+
+def old_method_default(method_name):
+    def default(o):
+        try:
+            return getattr(o, method_name)()
+        except AttributeError:
+            raise TypeError(
+                f"Object of type {type(o).__name__} is not JSON serializable"
+            )
+
+    return default
+
+
+class Example:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+    def asdict(self):
+        return {'x': self.x, 'y': self.y}
+
+
+class Missing:
+    pass
+
+
+def call_missing(default, o):
+    try:
+        default(o)
+    except TypeError:
+        pass
+
+
+example = Example("hello", "world")
+missing = Missing()
+
+old_default = old_method_default("asdict")
+new_default = method_default("asdict")
+
+assert old_default(example) == new_default(example)
+
+time_old = timeit(lambda: old_default(example), number=ITERATIONS)
+time_new = timeit(lambda: new_default(example), number=ITERATIONS)
+time_old_missing = timeit(lambda: call_missing(old_default, missing), number=ITERATIONS)
+time_new_missing = timeit(lambda: call_missing(new_default, missing), number=ITERATIONS)
+
+print("| Method           | Found /s | Missing /s |")
+print("| ---------------- | -------- | ---------- |")
+print(f"| getattr          |  {time_old:.3f}   |  {time_old_missing:.3f}     |")
+print(f"| cached           |  {time_new:.3f}   |  {time_new_missing:.3f}     |")
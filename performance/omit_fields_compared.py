@@ -0,0 +1,69 @@
+"""
+Compare leaving out None and default valued fields by filtering the output
+of `dataclass_default` with a dict comprehension against generated functions
+from `make_dataclass_default` that never add these fields.
+"""
+import dataclasses
+import json
+from timeit import timeit
+
+from ducktools.jsonkit import dataclass_default, make_dataclass_default
+
+
+ITERATIONS = 20
+
+
+@dataclasses.dataclass
+class Record:
+    id: int
+    name: str
+    email: str | None = None
+    phone: str | None = None
+    address: str | None = None
+    retries: int = 0
+    priority: int = 5
+    active: bool = True
+
+
+records = [
+    Record(i, str(i) * 3, email=f"{i}@example.com" if i % 3 == 0 else None)
+    for i in range(20_000)
+]
+
+omit_none = make_dataclass_default(omit_none=True)
+omit_both = make_dataclass_default(omit_none=True, omit_defaults=True)
+defaults = {
+    f.name: f.default
+    for f in dataclasses.fields(Record)
+    if f.default is not dataclasses.MISSING
+}
+
+
+def filter_none(o):
+    return {k: v for k, v in dataclass_default(o).items() if v is not None}
+
+
+def filter_defaults(o):
+    return {
+        k: v for k, v in dataclass_default(o).items()
+        if v is not None and (k not in defaults or v != defaults[k])
+    }
+
+
+assert json.dumps(records, default=filter_none) == json.dumps(records, default=omit_none)
+assert json.dumps(records, default=filter_defaults) == json.dumps(records, default=omit_both)
+
+methods = [
+    ("all fields", dataclass_default),
+    ("filter None", filter_none),
+    ("omit_none", omit_none),
+    ("filter defaults", filter_defaults),
+    ("omit_defaults", omit_both),
+]
+
+print("| Method          | Time /s | Size /KiB |")
+print("| --------------- | ------- | --------- |")
+for name, default in methods:
+    size = len(json.dumps(records, default=default)) / 1024
+    elapsed = timeit(lambda: json.dumps(records, default=default), number=ITERATIONS)
+    print(f"| {name:<15} |  {elapsed:.3f}  |  {size:7.1f}  |")
@@ -0,0 +1,75 @@
+"""
+Report the speedup of parallel_dumps over a single process `json.dumps`
+with increasing numbers of worker processes.
+
+Uses the Object/Member payload from dataclass_serializers_compared.py,
+repeated to give each worker a meaningful amount of work.
+"""
+import dataclasses
+import json
+from time import perf_counter
+
+from ducktools.jsonkit import dataclass_default, parallel_dumps
+
+
+REPEATS = 3
+WORKER_COUNTS = [1, 2, 4, 8]
+
+
+@dataclasses.dataclass
+class Member:
+    id: int
+    active: bool
+
+
+@dataclasses.dataclass
+class Object:
+    id: int
+    name: str
+    members: list[Member]
+
+
+def best_time(func):
+    times = []
+    for _ in range(REPEATS):
+        start = perf_counter()
+        func()
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+def main():
+    objects_as_dataclass = [
+        Object(i, str(i) * 3, [Member(j, True) for j in range(0, 10)])
+        for i in range(100000, 300000)
+    ]
+
+    expected = json.dumps(objects_as_dataclass, default=dataclass_default)
+
+    time_serial = best_time(
+        lambda: json.dumps(objects_as_dataclass, default=dataclass_default)
+    )
+
+    print("| Workers | Time /s | Speedup |")
+    print("| ------- | ------- | ------- |")
+    print(f"| serial  |  {time_serial:.3f}  |  {1.0:5.2f}  |")
+
+    for workers in WORKER_COUNTS:
+        def run():
+            return parallel_dumps(
+                objects_as_dataclass,
+                default=dataclass_default,
+                workers=workers,
+                chunk_size=len(objects_as_dataclass) // (workers * 4),
+            )
+
+        assert run() == expected
+        time_parallel = best_time(run)
+        print(
+            f"| {workers:>7} |  {time_parallel:.3f}  "
+            f"|  {time_serial/time_parallel:5.2f}  |"
+        )
+
+
+if __name__ == "__main__":
+    main()
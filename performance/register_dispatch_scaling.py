@@ -0,0 +1,57 @@
+"""
+Compare the cost of a JSONRegister 'default' call as the number of
+registered classes grows.
+
+The object being serialized is always an instance of the last class registered,
+the worst case for a linear isinstance scan.
+"""
+from timeit import timeit
+
+from ducktools.jsonkit import JSONRegister
+
+
+ITERATIONS = 1_000_000
+REGISTRY_SIZES = [1, 10, 30, 60, 120]
+
+
+def linear_default(registry):
+    # The original implementation of JSONRegister.default
+    def default(o):
+        for cls, func in registry:
+            if isinstance(o, cls):
+                return func(o)
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+    return default
+
+
+def make_register(size):
+    register = JSONRegister()
+    classes = [type(f"Example{i}", (), {}) for i in range(size)]
+    for cls in classes:
+        register.register(cls, id)
+    return register, classes[-1]()
+
+
+print("| Registered | Linear /s | Cached /s | Frozen /s |")
+print("| ---------- | --------- | --------- | --------- |")
+
+for size in REGISTRY_SIZES:
+    register, obj = make_register(size)
+
+    linear = linear_default(register.registry)
+    cached = register.default
+    frozen = register.freeze()
+
+    assert linear(obj) == cached(obj) == frozen(obj)
+
+    time_linear = timeit(lambda: linear(obj), number=ITERATIONS)
+    time_cached = timeit(lambda: cached(obj), number=ITERATIONS)
+    time_frozen = timeit(lambda: frozen(obj), number=ITERATIONS)
+
+    print(
+        f"| {size:>10} "
+        f"|  {time_linear:.3f}    "
+        f"|  {time_cached:.3f}    "
+        f"|  {time_frozen:.3f}    |"
+    )
@@ -0,0 +1,87 @@
+"""
+Compare serializing a mix of standard library types using hand written
+isinstance chains in two different orders against the `register_stdlib`
+pack for JSONRegister.
+"""
+import datetime
+import enum
+import json
+import uuid
+from decimal import Decimal
+from pathlib import Path
+from timeit import timeit
+
+from ducktools.jsonkit import JSONRegister, register_stdlib
+
+
+ITERATIONS = 5
+
+
+class Colour(enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+def make_row(i):
+    return {
+        "created": datetime.datetime(2024, 1, 1) + datetime.timedelta(seconds=i),
+        "id": uuid.UUID(int=i),
+        "price": Decimal(i) / 100,
+        "path": Path(f"data/{i}.json"),
+        "colour": Colour.RED if i % 2 else Colour.BLUE,
+        "tags": {"a"},
+    }
+
+
+data = [make_row(i) for i in range(20_000)]
+
+
+def chain_default(o):
+    # Common types first
+    if isinstance(o, (datetime.date, datetime.time)):
+        return o.isoformat()
+    if isinstance(o, (uuid.UUID, Decimal, Path)):
+        return str(o)
+    if isinstance(o, enum.Enum):
+        return o.value
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def reversed_chain_default(o):
+    # The same checks in the opposite order
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    if isinstance(o, enum.Enum):
+        return o.value
+    if isinstance(o, (uuid.UUID, Decimal, Path)):
+        return str(o)
+    if isinstance(o, (datetime.date, datetime.time)):
+        return o.isoformat()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+register = register_stdlib(JSONRegister())
+frozen = register.freeze()
+
+result = json.dumps(data, default=chain_default)
+assert (
+    result
+    == json.dumps(data, default=reversed_chain_default)
+    == json.dumps(data, default=register.default)
+    == json.dumps(data, default=frozen)
+)
+
+methods = [
+    ("isinstance chain", chain_default),
+    ("reversed chain", reversed_chain_default),
+    ("register_stdlib", register.default),
+    ("frozen", frozen),
+]
+
+print("| Method           | Time /s |")
+print("| ---------------- | ------- |")
+for name, default in methods:
+    elapsed = timeit(lambda: json.dumps(data, default=default), number=ITERATIONS)
+    print(f"| {name:<16} |  {elapsed:.3f}  |")
@@ -0,0 +1,66 @@
+"""
+Compare serializing many small objects, as in a web service returning one
+record per response, with `json.dumps` against a reused JSONEncoder and
+a `Serializer`.
+
+`json.dumps` creates a new JSONEncoder for every call given a `default`.
+"""
+import dataclasses
+import json
+from timeit import timeit
+
+from ducktools.jsonkit import Serializer, dataclass_default
+
+
+ITERATIONS = 200_000
+
+
+@dataclasses.dataclass
+class Member:
+    id: int
+    active: bool
+
+
+member = Member(1, True)
+
+encoder = json.JSONEncoder(default=dataclass_default)
+serializer = Serializer(dataclass_default)
+
+assert (
+    json.dumps(member, default=dataclass_default)
+    == encoder.encode(member)
+    == serializer.encode(member)
+)
+
+time_dumps = timeit(
+    lambda: json.dumps(member, default=dataclass_default),
+    number=ITERATIONS,
+)
+time_dumps_bytes = timeit(
+    lambda: json.dumps(member, default=dataclass_default).encode("utf-8"),
+    number=ITERATIONS,
+)
+time_encoder = timeit(lambda: encoder.encode(member), number=ITERATIONS)
+time_serializer = timeit(lambda: serializer.encode(member), number=ITERATIONS)
+time_serializer_bytes = timeit(
+    lambda: serializer.encode_bytes(member),
+    number=ITERATIONS,
+)
+time_sorted = timeit(
+    lambda: json.dumps(member, default=dataclass_default, sort_keys=True),
+    number=ITERATIONS,
+)
+time_serializer_sorted = timeit(
+    lambda: serializer.encode(member, sort_keys=True),
+    number=ITERATIONS,
+)
+
+print("| Method                      | Time /s |")
+print("| --------------------------- | ------- |")
+print(f"| json dumps                  |  {time_dumps:.3f}  |")
+print(f"| json dumps + encode         |  {time_dumps_bytes:.3f}  |")
+print(f"| json dumps sort_keys        |  {time_sorted:.3f}  |")
+print(f"| reused JSONEncoder          |  {time_encoder:.3f}  |")
+print(f"| Serializer.encode           |  {time_serializer:.3f}  |")
+print(f"| Serializer.encode_bytes     |  {time_serializer_bytes:.3f}  |")
+print(f"| Serializer.encode sort_keys |  {time_serializer_sorted:.3f}  |")
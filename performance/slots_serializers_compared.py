@@ -0,0 +1,107 @@
+"""
+Compare serializing slotted classes using a getattr loop over the slots,
+the simple `__slots__` recipe with an lru_cache and the generated
+`slots_default` and `classbuilder_default` functions.
+"""
+import json
+from functools import lru_cache
+from timeit import timeit
+
+from ducktools.classbuilder import slotclass, SlotFields
+
+from ducktools.jsonkit import (
+    field_default,
+    slots_default,
+    classbuilder_default,
+)
+
+
+ITERATIONS = 20
+
+
+class Member:
+    __slots__ = ("id", "active")
+
+    def __init__(self, id, active):
+        self.id, self.active = id, active
+
+
+class Object:
+    __slots__ = ("id", "name", "members")
+
+    def __init__(self, id, name, members):
+        self.id, self.name, self.members = id, name, members
+
+
+@slotclass
+class CBMember:
+    __slots__ = SlotFields(id=0, active=False)
+
+
+@slotclass
+class CBObject:
+    __slots__ = SlotFields(id=0, name="", members=None)
+
+
+objects = [
+    Object(i, str(i) * 3, [Member(j, True) for j in range(0, 10)])
+    for i in range(100000, 102000)
+]
+
+cb_objects = [
+    CBObject(i, str(i) * 3, [CBMember(j, True) for j in range(0, 10)])
+    for i in range(100000, 102000)
+]
+
+
+@lru_cache
+def slot_defaultmaker(cls):
+    try:
+        slots = cls.__slots__
+    except AttributeError:
+        raise TypeError(f'Object of type {cls.__name__} is not JSON serializable')
+    slot_tuple = tuple(slots)
+    return field_default(slot_tuple)
+
+
+def readme_recipe(o):
+    func = slot_defaultmaker(type(o))
+    return func(o)
+
+
+def getattr_slots(o):
+    return {name: getattr(o, name) for name in type(o).__slots__}
+
+
+result = json.dumps(objects, default=slots_default)
+assert (
+    result
+    == json.dumps(objects, default=readme_recipe)
+    == json.dumps(objects, default=getattr_slots)
+    == json.dumps(cb_objects, default=classbuilder_default)
+)
+
+
+time_getattr = timeit(
+    lambda: json.dumps(objects, default=getattr_slots),
+    number=ITERATIONS,
+)
+time_recipe = timeit(
+    lambda: json.dumps(objects, default=readme_recipe),
+    number=ITERATIONS,
+)
+time_slots = timeit(
+    lambda: json.dumps(objects, default=slots_default),
+    number=ITERATIONS,
+)
+time_classbuilder = timeit(
+    lambda: json.dumps(cb_objects, default=classbuilder_default),
+    number=ITERATIONS,
+)
+
+print("| Method               | Time /s |")
+print("| -------------------- | ------- |")
+print(f"| getattr over slots   |  {time_getattr:.3f}  |")
+print(f"| lru_cache recipe     |  {time_recipe:.3f}  |")
+print(f"| slots_default        |  {time_slots:.3f}  |")
+print(f"| classbuilder_default |  {time_classbuilder:.3f}  |")
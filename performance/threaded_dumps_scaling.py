@@ -0,0 +1,99 @@
+"""
+Report the speedup of threaded_dumps over a single threaded `json.dumps`.
+
+Run this on both a free-threaded build (eg: python3.13t) and a standard build
+to compare. With the GIL enabled threaded_dumps encodes serially, the
+'threads (GIL)' row shows the cost of forcing a thread pool anyway.
+"""
+import dataclasses
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from ducktools.jsonkit import dataclass_default, threaded_dumps
+
+
+REPEATS = 3
+WORKER_COUNTS = [1, 2, 4, 8]
+
+
+@dataclasses.dataclass
+class Member:
+    id: int
+    active: bool
+
+
+@dataclasses.dataclass
+class Object:
+    id: int
+    name: str
+    members: list[Member]
+
+
+def best_time(func):
+    times = []
+    for _ in range(REPEATS):
+        start = perf_counter()
+        func()
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+def forced_threads(items, workers, chunk_size):
+    encode = json.JSONEncoder(default=dataclass_default).encode
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(lambda chunk: encode(chunk)[1:-1], chunks)
+        return f"[{', '.join(parts)}]"
+
+
+def main():
+    try:
+        gil_enabled = sys._is_gil_enabled()
+    except AttributeError:
+        gil_enabled = True
+
+    objects_as_dataclass = [
+        Object(i, str(i) * 3, [Member(j, True) for j in range(0, 10)])
+        for i in range(100000, 300000)
+    ]
+
+    expected = json.dumps(objects_as_dataclass, default=dataclass_default)
+
+    time_serial = best_time(
+        lambda: json.dumps(objects_as_dataclass, default=dataclass_default)
+    )
+
+    print(f"Python {sys.version.split()[0]}, GIL enabled: {gil_enabled}")
+    print()
+    print("| Workers | threaded_dumps /s | Speedup | threads (GIL) /s |")
+    print("| ------- | ----------------- | ------- | ---------------- |")
+    print(f"| serial  |  {time_serial:.3f}            |  {1.0:5.2f}  |                  |")
+
+    for workers in WORKER_COUNTS:
+        chunk_size = len(objects_as_dataclass) // (workers * 4)
+
+        def run():
+            return threaded_dumps(
+                objects_as_dataclass,
+                default=dataclass_default,
+                workers=workers,
+                chunk_size=chunk_size,
+            )
+
+        def run_forced():
+            return forced_threads(objects_as_dataclass, workers, chunk_size)
+
+        assert run() == run_forced() == expected
+        time_threaded = best_time(run)
+        time_forced = best_time(run_forced)
+        print(
+            f"| {workers:>7} |  {time_threaded:.3f}            "
+            f"|  {time_serial/time_threaded:5.2f}  "
+            f"|  {time_forced:.3f}           |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,55 @@
-from ducktools.lazyimporter import LazyImporter, MultiFromImport, get_module_funcs
-from ducktools.classbuilder import slotclass, SlotFields, Field
+from ducktools.lazyimporter import (
+    LazyImporter,
+    FromImport,
+    MultiFromImport,
+    get_module_funcs,
+)
 
 from ._version import __version__
 
+_FunctionType = type(lambda: None)
+
 __all__ = [
     "merge_defaults",
     "field_default",  # noqa
     "method_default",
     "dataclass_default",  # noqa
     "make_dataclass_default",  # noqa
-    "JSONRegister",
+    "attrs_default",  # noqa
+    "make_attrs_default",  # noqa
+    "slots_default",  # noqa
+    "make_slots_default",  # noqa
+    "classbuilder_default",  # noqa
+    "make_classbuilder_default",  # noqa
+    "dataclass_cache",  # noqa
+    "codegen_cache",  # noqa
+    "precompile",  # noqa
+    "set_code_cache_dir",  # noqa
+    "dataclass_encoder",  # noqa
+    "dataclass_decoder",  # noqa
+    "dataclass_object_hook",  # noqa
+    "dataclass_array_encoder",  # noqa
+    "dataclass_array_decoder",  # noqa
+    "dataclass_array_default",  # noqa
+    "dataclass_schema",  # noqa
+    "dump_stream",  # noqa
+    "load_stream",  # noqa
+    "encode_into",  # noqa
+    "encode_async",  # noqa
+    "JSONLinesWriter",  # noqa
+    "parallel_dumps",  # noqa
+    "threaded_dumps",  # noqa
+    "profile_default",  # noqa
+    "ProfiledDefault",  # noqa
+    "JSONRegister",  # noqa
+    "JSONDecodeRegister",  # noqa
+    "register_stdlib",  # noqa
+    "dumps",  # noqa
+    "dump",  # noqa
+    "available_backends",  # noqa
+    "get_backend",  # noqa
+    "set_backend",  # noqa
+    "Serializer",  # noqa
 ]
 
 _laz = LazyImporter(
@@ -20,8 +60,83 @@ _laz = LazyImporter(
                 "field_default",
                 "dataclass_default",
                 "make_dataclass_default",
+                "attrs_default",
+                "make_attrs_default",
+                "slots_default",
+                "make_slots_default",
+                "classbuilder_default",
+                "make_classbuilder_default",
+                "codegen_cache",
+                "precompile",
+                "set_code_cache_dir",
+            ],
+        ),
+        FromImport("._caching_tools", "_dc_defaultmaker", "dataclass_cache"),
+        MultiFromImport(
+            "._dataclass_codecs",
+            [
+                "dataclass_encoder",
+                "dataclass_decoder",
+                "dataclass_object_hook",
+                "dataclass_array_encoder",
+                "dataclass_array_decoder",
+                "dataclass_array_default",
+                "dataclass_schema",
+            ],
+        ),
+        MultiFromImport(
+            "._streaming",
+            [
+                "dump_stream",
+                "load_stream",
+                "encode_into",
+                "encode_async",
+                "JSONLinesWriter",
+            ],
+        ),
+        MultiFromImport(
+            "._parallel",
+            [
+                "parallel_dumps",
+                "threaded_dumps",
+            ],
+        ),
+        MultiFromImport(
+            "._register",
+            [
+                "JSONRegister",
+                "JSONDecodeRegister",
             ],
-        )
+        ),
+        MultiFromImport(
+            "._stdlib",
+            [
+                "register_stdlib",
+            ],
+        ),
+        MultiFromImport(
+            "._backends",
+            [
+                "dumps",
+                "dump",
+                "available_backends",
+                "get_backend",
+                "set_backend",
+            ],
+        ),
+        MultiFromImport(
+            "._serializer",
+            [
+                "Serializer",
+            ],
+        ),
+        MultiFromImport(
+            "._profiling",
+            [
+                "profile_default",
+                "ProfiledDefault",
+            ],
+        ),
     ],
     globs=globals(),
 )
@@ -29,6 +144,11 @@ _laz = LazyImporter(
 __getattr__, __dir__ = get_module_funcs(_laz, __name__)
 
 
+# Maximum number of types remembered by merge_defaults and method_default
+# before their caches are cleared, so they can not keep every class alive
+RESOLVED_CACHE_SIZE = 1024
+
+
 # Merge multiple defaults
 def merge_defaults(*defaults):
     """
@@ -36,147 +156,101 @@ def merge_defaults(*defaults):
 
     Default functions are expected to return serializable objects or raise a TypeError
 
+    The default that succeeds for each concrete type is remembered and tried
+    first for later objects of that type. If it raises a TypeError the full
+    chain is tried again in order. Once `RESOLVED_CACHE_SIZE` types are
+    remembered they are all forgotten.
+
     :param defaults: 'default' functions for json.dumps
     :return: merged default function
     """
+    resolved = {}
 
     def default(o):
+        cls = type(o)
+        cached_func = resolved.get(cls)
+        if cached_func is not None:
+            try:
+                return cached_func(o)
+            except TypeError:
+                pass
+
         for func in defaults:
+            if func is cached_func:
+                continue
             try:
-                return func(o)
+                result = func(o)
             except TypeError:
                 pass
+            else:
+                if cls not in resolved and len(resolved) >= RESOLVED_CACHE_SIZE:
+                    resolved.clear()
+                resolved[cls] = func
+                return result
         else:
             raise TypeError(
-                f"Object of type {type(o).__name__} is not JSON serializable"
+                f"Object of type {cls.__name__} is not JSON serializable"
             )
 
     return default
 
 
 # Serialize using a method name
+def _resolve_method(cls, method_name):
+    for klass in cls.__mro__:
+        try:
+            attrib = klass.__dict__[method_name]
+        except KeyError:
+            continue
+
+        if isinstance(attrib, _FunctionType):
+            return attrib
+        # staticmethod, classmethod and other descriptors need the full lookup
+        break
+    else:
+        # Methods set on instances are not looked for, only classes that
+        # provide attributes dynamically can have the method without it
+        # being found in the MRO
+        if not hasattr(cls, "__getattr__"):
+            return None
+
+    return lambda o: getattr(o, method_name)()
+
+
 def method_default(method_name):
     """
     Given a method name, create a `default` function for json.dumps
     that will serialize any objects that have that method.
 
+    The method is looked up on the class of each object the first time
+    that class is seen, later objects of the same class call it directly.
+    Classes without the method are remembered and their objects raise
+    TypeError without another lookup, so methods set on instances or added
+    to a class after its first use are not found.
+
     :param method_name: name of the method that assists in serializing
     :return: default function to provide to json.dumps
     """
+    resolved = {}
 
     def default(o):
+        cls = type(o)
         try:
-            return getattr(o, method_name)()
+            method = resolved[cls]
+        except KeyError:
+            if len(resolved) >= RESOLVED_CACHE_SIZE:
+                resolved.clear()
+            method = resolved[cls] = _resolve_method(cls, method_name)
+
+        if method is None:
+            raise TypeError(
+                f"Object of type {cls.__name__} is not JSON serializable"
+            )
+        try:
+            return method(o)
         except AttributeError:
             raise TypeError(
-                f"Object of type {type(o).__name__} is not JSON serializable"
+                f"Object of type {cls.__name__} is not JSON serializable"
             )
 
     return default
-
-
-# Register
-@slotclass
-class _RegisterDecorator:
-    """
-    A descriptor used as part of the mechanism to register serializers for classes
-    using a decorator.
-    """
-    __slots__ = SlotFields(
-        func=Field(),
-        registry=Field(),
-    )
-
-    def __set_name__(self, owner, name):
-        self.registry.register(owner, self.func)
-        setattr(owner, name, self.func)
-
-
-@slotclass
-class JSONRegister:
-    """
-    Register methods for serializing classes, provides a 'default' method
-    to give to `dumps` style functions.
-
-    Provides a method to add a serializer for any class and two decorators
-    to decorate functions and class methods to register them as serializers.
-    """
-
-    __slots__ = SlotFields(registry=Field(default_factory=list, init=False))
-
-    def register(self, cls, func):
-        """
-        Register a function that will convert a class instance into something
-        that is serializable by the json.dumps function.
-
-        Usage Example: registry.register(Path, str)
-
-        :param cls: Class object to use to identify objects with isinstance
-        :param func: Single argument callable that will convert instances of cls
-                     into serializable objects
-        """
-        self.registry.append((cls, func))
-
-    def register_function(self, cls):
-        """
-        Register a function as a serializer by using a decorator.
-
-        Usage Example:
-        @registry.register_function(Decimal)
-        def unstructure_decimal(val):
-            return {'cls': 'Decimal', 'value': str(val)}
-
-        :param cls: Class the function is being registered for.
-        """
-
-        def wrapper(func):
-            self.register(cls, func)
-            return func
-
-        return wrapper
-
-    def register_method(self, method):
-        """
-        Register a class method as a serializer by using a decorator.
-
-        Usage Example:
-        @dataclasses.dataclass
-        class Demo:
-            id: int
-            name: str
-            location: Path
-            numbers: list[Decimal]
-
-            @register.register_method
-            def to_json(self):
-                return {
-                    'id': self.id,
-                    'name': self.name,
-                    'location': self.location,
-                    'numbers': self.numbers,
-                }
-
-        :param method: The method of a class that converts instances to natively
-                       serializable data.
-        """
-
-        # In order for this to work the registry needs to know the class that
-        # provides the method to be decorated.
-
-        # This isn't available by inspecting the function so a descriptor
-        # is created that will be given the class when __set_name__ is called.
-        # This descriptor is a non-data descriptor so can be replaced by
-        # the original function.
-
-        return _RegisterDecorator(method, self)
-
-    def default(self, o):
-        """
-        Default function to provide to a json.dumps call as the `default` argument.
-        :param o: object to serialize
-        :return: serializable data
-        """
-        for cls, func in self.registry:
-            if isinstance(o, cls):
-                return func(o)
-        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
@@ -1,7 +1,7 @@
 """
 Type stubs to avoid importing typing.
 """
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any
 import types
 
 from ducktools.lazyimporter import LazyImporter, MultiFromImport, get_module_funcs
@@ -12,6 +12,57 @@ if TYPE_CHECKING:
         field_default,
         dataclass_default,
         make_dataclass_default,
+        attrs_default,
+        make_attrs_default,
+        slots_default,
+        make_slots_default,
+        classbuilder_default,
+        make_classbuilder_default,
+        codegen_cache,
+        precompile,
+        set_code_cache_dir,
+        _dc_defaultmaker as dataclass_cache,
+    )
+    from ._dataclass_codecs import (
+        dataclass_encoder,
+        dataclass_decoder,
+        dataclass_object_hook,
+        dataclass_array_encoder,
+        dataclass_array_decoder,
+        dataclass_array_default,
+        dataclass_schema,
+    )
+    from ._streaming import (
+        dump_stream,
+        load_stream,
+        encode_into,
+        encode_async,
+        JSONLinesWriter,
+    )
+    from ._parallel import (
+        parallel_dumps,
+        threaded_dumps,
+    )
+    from ._register import (
+        JSONRegister,
+        JSONDecodeRegister,
+    )
+    from ._stdlib import (
+        register_stdlib,
+    )
+    from ._backends import (
+        dumps,
+        dump,
+        available_backends,
+        get_backend,
+        set_backend,
+    )
+    from ._serializer import (
+        Serializer,
+    )
+    from ._profiling import (
+        profile_default,
+        ProfiledDefault,
     )
 
 __version__: str = ...
@@ -21,32 +72,47 @@ __all__: list[str] = [
     "method_default",
     "dataclass_default",
     "make_dataclass_default",
+    "attrs_default",
+    "make_attrs_default",
+    "slots_default",
+    "make_slots_default",
+    "classbuilder_default",
+    "make_classbuilder_default",
+    "dataclass_cache",
+    "codegen_cache",
+    "precompile",
+    "set_code_cache_dir",
+    "dataclass_encoder",
+    "dataclass_decoder",
+    "dataclass_object_hook",
+    "dataclass_array_encoder",
+    "dataclass_array_decoder",
+    "dataclass_array_default",
+    "dataclass_schema",
+    "dump_stream",
+    "load_stream",
+    "encode_into",
+    "encode_async",
+    "JSONLinesWriter",
+    "parallel_dumps",
+    "threaded_dumps",
+    "profile_default",
+    "ProfiledDefault",
     "JSONRegister",
+    "JSONDecodeRegister",
+    "register_stdlib",
+    "dumps",
+    "dump",
+    "available_backends",
+    "get_backend",
+    "set_backend",
+    "Serializer",
 ]
 _laz: LazyImporter = ...
+_FunctionType: type[types.FunctionType] = ...
+
+RESOLVED_CACHE_SIZE: int = ...
 
 def merge_defaults(*defaults: Callable[[Any], Any]) -> Callable[[Any], Any]: ...
+def _resolve_method(cls: type, method_name: str) -> Callable[[Any], Any] | None: ...
 def method_default(method_name: str) -> Callable[[Any], Any]: ...
-
-class _RegisterDecorator:
-    func: Callable[[Any], Any]
-    registry: JSONRegister
-
-    __classbuilder_internals__: dict
-
-    def __init__(self, func: Callable[[Any], Any], registry: JSONRegister) -> None: ...
-    def __set_name__(self, owner: type, name: str) -> None: ...
-
-_FuncT = TypeVar("_FuncT", bound=Callable[[Any], Any])
-
-class JSONRegister:
-    registry: list[tuple[type, Callable[[Any], Any]]]
-
-    __classbuilder_internals__: dict
-
-    def __init__(self) -> None: ...
-    def register(self, cls: type, func: Callable[..., Any]) -> None: ...
-    def register_function(self, cls: type) -> Callable[[_FuncT], _FuncT]: ...
-
-    def register_method(self, method: types.MethodType) -> _RegisterDecorator: ...
-    def default(self, o: Any) -> Any: ...
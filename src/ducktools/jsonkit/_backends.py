@@ -0,0 +1,306 @@
+from ducktools.lazyimporter import (
+    LazyImporter,
+    FromImport,
+    ModuleImport,
+    TryFallbackImport,
+)
+
+
+_laz = LazyImporter(
+    [
+        ModuleImport("io"),
+        ModuleImport("json"),
+        FromImport("enum", "Enum"),
+        FromImport("uuid", "UUID"),
+        TryFallbackImport("orjson", None),
+        TryFallbackImport("rapidjson", None),
+    ]
+)
+
+
+# Output is the same from every backend: compact separators, or ',' and ': '
+# when indented, with non-ASCII characters written as UTF-8 rather than escaped.
+def _json_dumps(obj, default, indent, sort_keys, strict):
+    separators = (",", ":") if indent is None else (",", ": ")
+    return _laz.json.dumps(
+        obj,
+        default=default,
+        indent=indent,
+        sort_keys=sort_keys,
+        separators=separators,
+        ensure_ascii=False,
+    )
+
+
+# orjson raises TypeError for integers outside this range
+_ORJSON_INT_MIN = -(1 << 63)
+_ORJSON_INT_MAX = (1 << 64) - 1
+_LEAF_TYPES = frozenset({str, bool, type(None)})
+_STR_TYPES = frozenset({str})
+
+
+def _orjson_compatible(obj, native_types):
+    """
+    Check that orjson would serialize obj in the same way as json.
+
+    Incompatible values are non-finite floats, floats that json writes
+    with an exponent, integers outside the 64 bit range, dictionaries with
+    keys that are not str and instances of `native_types`: types orjson
+    serializes itself that json would give to `default` or write differently.
+
+    Other objects are given to `default` by both, the results of `default`
+    must be checked separately.
+    """
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        t = type(o)
+        if t is dict or (t is not list and isinstance(o, dict)):
+            if not _STR_TYPES.issuperset(map(type, o)):
+                return False
+            values = o.values()
+        elif t is list or t is tuple or isinstance(o, list):
+            values = o
+        else:
+            values = (o,)
+
+        # Most containers only hold strings, bools and None
+        if _LEAF_TYPES.issuperset(map(type, values)):
+            continue
+
+        for v in values:
+            tv = type(v)
+            if tv is str or tv is bool or v is None:
+                continue
+            if tv is int:
+                if not _ORJSON_INT_MIN <= v <= _ORJSON_INT_MAX:
+                    return False
+            elif tv is float:
+                # NaN and infinity are written as null by orjson
+                # and 1e+16 as 1e16
+                if v != 0.0 and not 1e-4 <= abs(v) < 1e16:
+                    return False
+            elif tv is dict or tv is list or tv is tuple:
+                stack.append(v)
+            elif isinstance(v, native_types):
+                return False
+            elif isinstance(v, (dict, list)):
+                # Subclasses are serialized as their base type by both
+                stack.append(v)
+    return True
+
+
+def _orjson_dumps(obj, default, indent, sort_keys, strict):
+    orjson = _laz.orjson
+    if indent is not None and indent != 2:
+        # orjson only supports an indent of 2
+        return _json_dumps(obj, default, indent, sort_keys, strict)
+
+    checked_default = default
+    if strict:
+        # UUIDs, Enums and subclasses of the builtin types other than
+        # str, dict and list are serialized by orjson but not by json
+        native_types = (_laz.UUID, _laz.Enum, int, float, tuple)
+        if not _orjson_compatible(obj, native_types):
+            return _json_dumps(obj, default, indent, sort_keys, strict)
+
+        if default is not None:
+            def checked_default(o):
+                result = default(o)
+                if not _orjson_compatible(result, native_types):
+                    raise TypeError("Result of default is not compatible with orjson")
+                return result
+
+    # Pass dataclasses and datetimes to `default` as the other backends do
+    option = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+    if indent is not None:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(obj, default=checked_default, option=option)
+    except TypeError:
+        # Integers wider than 64 bits or results rejected by the check,
+        # json raises its own error if the data can not be serialized
+        return _json_dumps(obj, default, indent, sort_keys, strict)
+
+
+def _rapidjson_dumps(obj, default, indent, sort_keys, strict):
+    rapidjson = _laz.rapidjson
+    if not strict:
+        return rapidjson.dumps(
+            obj,
+            default=default,
+            indent=indent,
+            sort_keys=sort_keys,
+            ensure_ascii=False,
+            mapping_mode=rapidjson.MM_COERCE_KEYS_TO_STRINGS,
+        )
+
+    # rapidjson gives dictionaries with keys that are not str to `default`,
+    # these are serialized by json which converts and sorts the keys itself
+    def checked_default(o):
+        if isinstance(o, dict) or default is None:
+            raise TypeError(
+                f"Object of type {type(o).__name__} is not JSON serializable"
+            )
+        return default(o)
+
+    try:
+        return rapidjson.dumps(
+            obj,
+            default=checked_default,
+            indent=indent,
+            sort_keys=sort_keys,
+            ensure_ascii=False,
+        )
+    except TypeError:
+        return _json_dumps(obj, default, indent, sort_keys, strict)
+
+
+# Fastest first
+_BACKENDS = {
+    "orjson": _orjson_dumps,
+    "rapidjson": _rapidjson_dumps,
+    "json": _json_dumps,
+}
+
+_backend = None
+
+
+def _get_dumps(name):
+    if name is None:
+        name = get_backend()
+
+    try:
+        func = _BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown backend {name!r}, expected one of {', '.join(_BACKENDS)}"
+        )
+    if name != "json" and getattr(_laz, name) is None:
+        raise ImportError(f"Backend {name!r} is not installed")
+    return func
+
+
+def available_backends():
+    """
+    Get the names of the installed backends, fastest first.
+
+    :return: list of backend names
+    """
+    return [
+        name for name in _BACKENDS
+        if name == "json" or getattr(_laz, name) is not None
+    ]
+
+
+def get_backend():
+    """
+    Get the name of the backend used by `dumps` and `dump` if none is given.
+
+    Unless set with `set_backend` this is the fastest installed backend.
+
+    :return: backend name
+    """
+    global _backend
+    if _backend is None:
+        _backend = available_backends()[0]
+    return _backend
+
+
+def set_backend(name):
+    """
+    Set the backend used by `dumps` and `dump` if none is given.
+
+    :param name: 'orjson', 'rapidjson' or 'json',
+                 None to use the default from `get_backend`
+    """
+    global _backend
+    if name is not None:
+        _get_dumps(name)  # Check the backend is available
+    _backend = name
+
+
+def dumps(
+    obj,
+    *,
+    default=None,
+    indent=None,
+    sort_keys=False,
+    as_bytes=False,
+    backend=None,
+    strict=False,
+):
+    """
+    Serialize obj to JSON using the selected backend.
+
+    Output is compact and not ASCII escaped with every backend.
+    `default` is given the same objects by every backend, including
+    dataclasses and datetimes which orjson would otherwise serialize itself.
+    Integers wider than 64 bits are serialized by json if orjson is used.
+
+    orjson writes UUIDs, Enums and namedtuples itself, NaN and infinity as null
+    and floats such as 1e+20 as 1e20. rapidjson writes None and bool keys with
+    str(). Both sort keys that are not str as strings. With `strict` these
+    values are serialized by json instead so the output always matches the
+    json backend, at the cost of checking the data in Python when orjson is used.
+
+    :param obj: object to serialize
+    :param default: 'default' function for objects the backend can not serialize
+    :param indent: number of spaces to indent by, orjson only supports 2
+                   and uses the json module for other values
+    :param sort_keys: sort the keys of dictionaries
+    :param as_bytes: return UTF-8 encoded bytes instead of str
+    :param backend: 'orjson', 'rapidjson' or 'json', the backend from
+                    `get_backend()` if not given
+    :param strict: give the same output as the json backend for every value
+    :return: JSON str, or bytes if as_bytes is True
+    """
+    result = _get_dumps(backend)(obj, default, indent, sort_keys, strict)
+    if as_bytes:
+        return result if type(result) is bytes else result.encode("utf-8")
+    return result if type(result) is str else result.decode("utf-8")
+
+
+def dump(
+    obj,
+    fp,
+    *,
+    default=None,
+    indent=None,
+    sort_keys=False,
+    backend=None,
+    strict=False,
+):
+    """
+    Serialize obj to JSON using the selected backend and write it to a file.
+
+    Binary files (io.RawIOBase or io.BufferedIOBase) are given UTF-8
+    encoded bytes, anything else is given str as with `json.dump`.
+
+    :param obj: object to serialize
+    :param fp: text or binary file-like object with a `write` method
+    :param default: 'default' function for objects the backend can not serialize
+    :param indent: number of spaces to indent by
+    :param sort_keys: sort the keys of dictionaries
+    :param backend: 'orjson', 'rapidjson' or 'json', the backend from
+                    `get_backend()` if not given
+    :param strict: give the same output as the json backend for every value
+    """
+    as_bytes = isinstance(fp, (_laz.io.RawIOBase, _laz.io.BufferedIOBase))
+    fp.write(
+        dumps(
+            obj,
+            default=default,
+            indent=indent,
+            sort_keys=sort_keys,
+            as_bytes=as_bytes,
+            backend=backend,
+            strict=strict,
+        )
+    )
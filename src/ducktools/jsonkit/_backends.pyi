@@ -0,0 +1,81 @@
+from ducktools.lazyimporter import LazyImporter
+
+from collections.abc import Callable
+from typing import Any, Literal, overload
+
+_laz: LazyImporter = ...
+
+_DumpsFunc = Callable[
+    [Any, Callable[[Any], Any] | None, int | None, bool, bool],
+    str | bytes,
+]
+
+def _json_dumps(
+    obj: Any,
+    default: Callable[[Any], Any] | None,
+    indent: int | None,
+    sort_keys: bool,
+    strict: bool,
+) -> str: ...
+
+_ORJSON_INT_MIN: int
+_ORJSON_INT_MAX: int
+_LEAF_TYPES: frozenset[type]
+_STR_TYPES: frozenset[type]
+
+def _orjson_compatible(obj: Any, native_types: tuple[type, ...]) -> bool: ...
+def _orjson_dumps(
+    obj: Any,
+    default: Callable[[Any], Any] | None,
+    indent: int | None,
+    sort_keys: bool,
+    strict: bool,
+) -> str | bytes: ...
+def _rapidjson_dumps(
+    obj: Any,
+    default: Callable[[Any], Any] | None,
+    indent: int | None,
+    sort_keys: bool,
+    strict: bool,
+) -> str: ...
+
+_BACKENDS: dict[str, _DumpsFunc]
+_backend: str | None
+
+def _get_dumps(name: str | None) -> _DumpsFunc: ...
+def available_backends() -> list[str]: ...
+def get_backend() -> str: ...
+def set_backend(name: str | None) -> None: ...
+
+@overload
+def dumps(
+    obj: Any,
+    *,
+    default: Callable[[Any], Any] | None = None,
+    indent: int | None = None,
+    sort_keys: bool = False,
+    as_bytes: Literal[False] = False,
+    backend: str | None = None,
+    strict: bool = False,
+) -> str: ...
+@overload
+def dumps(
+    obj: Any,
+    *,
+    default: Callable[[Any], Any] | None = None,
+    indent: int | None = None,
+    sort_keys: bool = False,
+    as_bytes: Literal[True],
+    backend: str | None = None,
+    strict: bool = False,
+) -> bytes: ...
+def dump(
+    obj: Any,
+    fp: Any,
+    *,
+    default: Callable[[Any], Any] | None = None,
+    indent: int | None = None,
+    sort_keys: bool = False,
+    backend: str | None = None,
+    strict: bool = False,
+) -> None: ...
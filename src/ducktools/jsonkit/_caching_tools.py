@@ -1,48 +1,454 @@
-from ducktools.lazyimporter import LazyImporter, ModuleImport
-from functools import lru_cache
+from ducktools.lazyimporter import LazyImporter, ModuleImport, FromImport
+from collections import namedtuple
+from functools import update_wrapper
+from types import MemberDescriptorType
+from weakref import ref
 
 
-_laz = LazyImporter([ModuleImport("dataclasses")])
+_laz = LazyImporter(
+    [
+        ModuleImport("dataclasses"),
+        ModuleImport("hashlib"),
+        ModuleImport("marshal"),
+        ModuleImport("os"),
+        ModuleImport("sys"),
+        FromImport("importlib.util", "MAGIC_NUMBER"),
+        FromImport("ducktools.classbuilder", "get_fields"),
+    ]
+)
+
+
+# Code generation
+_compile_count = 0
+# Maximum number of entries in the front cache of a CodegenCache
+FRONT_CACHE_SIZE = 1024
+_code_cache_dir = None
+
+
+def _is_private(st):
+    """
+    Check that a file or directory can only be written by the current user.
+
+    Always True where there is no POSIX ownership (Windows).
+    """
+    getuid = getattr(_laz.os, "getuid", None)
+    if getuid is None:
+        return True
+    return st.st_uid == getuid() and not st.st_mode & 0o022
+
+
+def set_code_cache_dir(path):
+    """
+    Store compiled code for generated functions in a directory so later
+    processes can load it instead of compiling the generated source again.
+
+    Entries are keyed by the generated source and the Python bytecode version.
+
+    Loaded code is executed without further checks, so anyone who can write
+    to the directory can run code in every process using it. The directory
+    must be owned by the current user and not writable by group or others,
+    entry files that fail the same check are ignored.
+
+    :param path: directory for the cache, created if needed, None to disable
+    :raises PermissionError: if the directory could be written by other users
+    """
+    global _code_cache_dir
+    if path is not None:
+        path = _laz.os.fspath(path)
+        _laz.os.makedirs(path, mode=0o700, exist_ok=True)
+        if not _is_private(_laz.os.stat(path)):
+            raise PermissionError(
+                f"Code cache directory {path!r} must be owned by the current "
+                f"user and not writable by group or others"
+            )
+    _code_cache_dir = path
+
+
+def _code_cache_path(funcdef):
+    digest = _laz.hashlib.sha256(
+        _laz.MAGIC_NUMBER + funcdef.encode("utf-8")
+    ).hexdigest()
+    filename = f"{_laz.sys.implementation.cache_tag}-{digest}.bin"
+    return _laz.os.path.join(_code_cache_dir, filename)
+
+
+def _load_code(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            if not _is_private(_laz.os.fstat(f.fileno())):
+                return None
+            return _laz.marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _private_opener(path, flags):
+    return _laz.os.open(path, flags, 0o600)
+
+
+def _store_code(cache_path, code):
+    # Write to a temporary file and rename so other processes
+    # never see a partially written file
+    tmp_path = f"{cache_path}.{_laz.os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb", opener=_private_opener) as f:
+            _laz.marshal.dump(code, f)
+        _laz.os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _exec_function(funcdef, name, globs):
+    """
+    Execute generated source and return the function `name` it defines.
+
+    If a code cache directory is set, compiled code is loaded from or
+    stored in the cache.
+
+    :param funcdef: source code defining the function
+    :param name: name of the function to return
+    :param globs: globals dictionary for the generated code
+    :return: generated function
+    """
+    global _compile_count
+
+    code = None
+    cache_path = None
+    if _code_cache_dir is not None:
+        cache_path = _code_cache_path(funcdef)
+        code = _load_code(cache_path)
+
+    if code is None:
+        _compile_count += 1
+        code = compile(funcdef, "<string>", "exec")
+        if cache_path is not None:
+            _store_code(cache_path, code)
+
+    exec(code, globs)
+    return globs[name]
+
+
+CacheInfo = namedtuple(
+    "CacheInfo",
+    ["hits", "misses", "compiles", "maxsize", "currsize"],
+)
+
+
+class CodegenCache:
+    """
+    Cache for functions that generate code, similar to `functools.lru_cache`.
+
+    With `weak=True` the first argument, usually a class, is held by weak
+    reference so generated functions for classes that no longer exist are
+    removed instead of keeping the class alive. Once `maxsize` entries are
+    stored the oldest entry is evicted.
+
+    `cache_info()` reports hits, misses and the number of functions compiled
+    while handling the misses.
+
+    The hot paths of the 'default' functions read a separate front cache keyed
+    on the class itself, as creating a weak reference for every lookup is slower
+    than the lookup. This holds classes strongly, so it is cleared whenever it
+    reaches `FRONT_CACHE_SIZE` entries to limit how many otherwise unused classes
+    it can keep alive.
+    """
+    def __init__(self, func, maxsize=None, weak=True):
+        """
+        :param func: function to cache, the first argument must be weakly
+                     referenceable if `weak` is True
+        :param maxsize: maximum number of entries, None for no limit
+        :param weak: hold the first argument by weak reference
+        """
+        self.func = func
+        self.maxsize = maxsize
+        self.weak = weak
+        # Keys are the (weakly referenced) first argument if there are no
+        # other arguments, otherwise (first_argument, other_arguments) with
+        # a tuple of the keyword arguments added if there are any
+        self._data = {}
+        # Strong references to recently used keys for the hot paths,
+        # keyed on the first argument or (first_argument, other_arguments)
+        self._front = {}
+        # Counters are kept in a list as incrementing items is
+        # noticeably cheaper than incrementing instance attributes
+        self._stats = [0, 0, 0]  # hits, misses, compiles
+        update_wrapper(self, func)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} for {self.func!r}>"
+
+    def __call__(self, key, *args, **kwargs):
+        cache_key = ref(key) if self.weak else key
+        if kwargs:
+            cache_key = (cache_key, args, tuple(kwargs.items()))
+        elif args:
+            cache_key = (cache_key, args)
+        try:
+            result = self._data[cache_key]
+        except KeyError:
+            return self._miss(key, args, kwargs)
+
+        self._stats[0] += 1
+        return result
+
+    def _miss(self, key, args, kwargs):
+        stats = self._stats
+        stats[1] += 1
+        start_count = _compile_count
+        try:
+            result = self.func(key, *args, **kwargs)
+        finally:
+            stats[2] += _compile_count - start_count
+
+        cache_key = ref(key, self._remove) if self.weak else key
+        if kwargs:
+            cache_key = (cache_key, args, tuple(kwargs.items()))
+        elif args:
+            cache_key = (cache_key, args)
+        if self.maxsize is not None:
+            self._evict(self.maxsize - 1)
+        self._data[cache_key] = result
+        return result
+
+    def _front_miss(self, key, *args):
+        """
+        Get the result for a key that is not in the front cache
+        and add it to the front cache.
+        """
+        result = self(key, *args)
+        front = self._front
+        if len(front) >= FRONT_CACHE_SIZE:
+            front.clear()
+        front[(key, args) if args else key] = result
+        return result
+
+    def _remove(self, dead_ref):
+        # Weakref callback, the referent no longer exists
+        for cache_key in [
+            k for k in self._data
+            if k is dead_ref or (type(k) is tuple and k[0] is dead_ref)
+        ]:
+            del self._data[cache_key]
+
+    def _evict(self, size):
+        if len(self._data) > size:
+            # The front cache could still hold evicted entries
+            self._front.clear()
+        while len(self._data) > size:
+            del self._data[next(iter(self._data))]
+
+    def cache_info(self):
+        """
+        Report cache statistics
+
+        :return: CacheInfo(hits, misses, compiles, maxsize, currsize)
+        """
+        hits, misses, compiles = self._stats
+        return CacheInfo(hits, misses, compiles, self.maxsize, len(self._data))
+
+    def cache_clear(self):
+        """
+        Clear the cache and statistics
+        """
+        self._data.clear()
+        self._front.clear()
+        self._stats[:] = [0, 0, 0]
+
+    def resize(self, maxsize):
+        """
+        Change the maximum size of the cache, evicting the oldest entries
+        if there are now too many.
+
+        :param maxsize: maximum number of entries, None for no limit
+        """
+        self.maxsize = maxsize
+        if maxsize is not None:
+            self._evict(maxsize)
+
+
+def codegen_cache(maxsize=None, weak=True):
+    """
+    Decorator to wrap a function that generates code in a CodegenCache.
+
+    :param maxsize: maximum number of entries, None for no limit
+    :param weak: hold the first argument by weak reference
+    :return: decorator
+    """
+    def decorator(func):
+        return CodegenCache(func, maxsize=maxsize, weak=weak)
+
+    return decorator
 
 
 # Serialize by field names
-@lru_cache
-def field_default(fieldnames):
+@codegen_cache(weak=False)
+def field_default(fieldnames, omit_none=False, defaults=(), rename=()):
     """
     Create a function that will take an object and return a
     {fieldname: obj.fieldname, ...} dictionary.
 
-    (Fieldnames must be hashable so can not be a list.)
+    (Fieldnames, defaults and rename must be hashable so can not be a list or dict.)
 
     :param fieldnames: tuple of fieldnames
+    :param omit_none: leave out fields with a value of None
+    :param defaults: tuple of (fieldname, default) pairs, fields with a value
+                     equal to and of the same type as their default are left out
+    :param rename: tuple of (fieldname, key) pairs to use a different key
+                   in the output
     :return: dict conversion function
     """
-    vals = ", ".join(f"'{fieldname}': o.{fieldname}" for fieldname in fieldnames)
-    out_dict = f"{{{vals}}}"
+    defaults = dict(defaults)
+    rename = dict(rename)
+
+    if not (omit_none or defaults or rename):
+        vals = ", ".join(f"'{fieldname}': o.{fieldname}" for fieldname in fieldnames)
+        body = [f"return {{{vals}}}"]
+        globs = {}
+    else:
+        body, globs = _conditional_body(fieldnames, omit_none, defaults, rename)
+
+    body = "\n".join(f"        {line}" for line in body)
     funcdef = (
         f"def default(o):\n"
         f"    try:\n"
-        f"        return {out_dict}\n"
+        f"{body}\n"
         f"    except AttributeError:\n"
         f"        raise TypeError(\n"
         f"            f'Object of type {{type(o).__name__}} is not JSON serializable'\n"
         f"        )\n"
     )
+    return _exec_function(funcdef, "default", globs)
+
+
+def _conditional_body(fieldnames, omit_none, defaults, rename):
+    """
+    Source lines for a field_default function where some fields may be left out.
+
+    Fields before the first field that may be left out go in the dict literal,
+    the rest are added in order so the output keeps the field order.
+    """
     globs = {}
-    exec(funcdef, globs)
-    method = globs["default"]
-    return method
+    literal = []
+    lines = []
+    for i, name in enumerate(fieldnames):
+        key = repr(rename.get(name, name))
+        conditions = []
+        if omit_none or (name in defaults and defaults[name] is None):
+            conditions.append(f"_v{i} is not None")
+        if name in defaults and defaults[name] is not None:
+            # Only values of the same type as the default are left out,
+            # so True is kept for a default of 1 and 0.0 for False
+            globs[f"_default_{i}"] = defaults[name]
+            globs[f"_dtype_{i}"] = type(defaults[name])
+            conditions.append(
+                f"(type(_v{i}) is not _dtype_{i} or _v{i} != _default_{i})"
+            )
+
+        if conditions:
+            lines.append(f"_v{i} = o.{name}")
+            lines.append(f"if {' and '.join(conditions)}:")
+            lines.append(f"    d[{key}] = _v{i}")
+        elif lines:
+            lines.append(f"d[{key}] = o.{name}")
+        else:
+            literal.append(f"{key}: o.{name}")
+
+    return [f"d = {{{', '.join(literal)}}}", *lines, "return d"], globs
 
 
 # Serialize Dataclasses
-@lru_cache
-def _dc_defaultmaker(cls, exclude_fields=()):
+@codegen_cache()
+def _dc_defaultmaker(
+    cls,
+    exclude_fields=(),
+    omit_none=False,
+    omit_defaults=False,
+    rename=(),
+):
     if not _laz.dataclasses.is_dataclass(cls):
         raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
 
+    fields = [
+        item
+        for item in _laz.dataclasses.fields(cls)
+        if item.name not in exclude_fields
+    ]
+    field_names = tuple(item.name for item in fields)
+
+    if not (omit_none or omit_defaults or rename):
+        method = field_default(field_names)  # type: ignore
+        return method
+
+    MISSING = _laz.dataclasses.MISSING
+    defaults = []
+    if omit_defaults:
+        for item in fields:
+            if item.default is not MISSING:
+                defaults.append((item.name, item.default))
+            elif item.default_factory is not MISSING:
+                defaults.append((item.name, item.default_factory()))
+
+    # Default values may not be hashable so skip the field_default cache,
+    # the result is cached for this class and set of options instead
+    method = field_default.func(field_names, omit_none, tuple(defaults), rename)
+    return method
+
+
+def _dc_maker_args(exclude_fields, omit_none, omit_defaults, rename):
+    # Arguments for _dc_defaultmaker, empty if all are the defaults
+    # so the cache entries used by dataclass_default are shared
+    rename = tuple(rename.items()) if rename else ()
+    if exclude_fields or omit_none or omit_defaults or rename:
+        return exclude_fields, omit_none, omit_defaults, rename
+    return ()
+
+
+def make_dataclass_default(
+    exclude_fields=(),
+    *,
+    omit_none=False,
+    omit_defaults=False,
+    rename=None,
+):
+    """
+    Make a 'default' function to serialize dataclasses that will
+    exclude specific named fields or leave out fields based on their values.
+
+    :param exclude_fields: tuple of field names to exclude from serialization.
+    :param omit_none: leave out fields with a value of None
+    :param omit_defaults: leave out fields with a value equal to and of the
+                          same type as their default
+    :param rename: dict of {fieldname: key} to use a different key in the output
+    :return: 'default' function to use with json.dumps
+    """
+    args = _dc_maker_args(exclude_fields, omit_none, omit_defaults, rename)
+    if not args:
+        return dataclass_default
+
+    def dataclass_excludes_default(o):
+        try:
+            method = _dc_front[(type(o), args)]
+        except KeyError:
+            method = _dc_defaultmaker._front_miss(type(o), *args)
+        else:
+            _dc_stats[0] += 1
+        return method(o)
+
+    return dataclass_excludes_default
+
+
+# Serialize attrs classes
+@codegen_cache()
+def _attrs_defaultmaker(cls, exclude_fields=()):
+    # Read the attributes directly so attrs itself is never imported
+    try:
+        attributes = cls.__attrs_attrs__
+    except AttributeError:
+        raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+
     field_names = tuple(
         item.name
-        for item in _laz.dataclasses.fields(cls)
+        for item in attributes
         if item.name not in exclude_fields
     )
 
@@ -50,20 +456,173 @@ def _dc_defaultmaker(cls, exclude_fields=()):
     return method
 
 
-def make_dataclass_default(exclude_fields):
+def make_attrs_default(exclude_fields):
     """
-    Make a 'default' function to serialize dataclasses that will
+    Make a 'default' function to serialize attrs classes that will
     exclude specific named fields.
 
     :param exclude_fields: tuple of field names to exclude from serialization.
     :return: 'default' function to use with json.dumps
     """
 
-    def dataclass_excludes_default(o):
-        method = _dc_defaultmaker(type(o), exclude_fields)
+    def attrs_excludes_default(o):
+        method = _attrs_defaultmaker(type(o), exclude_fields)
         return method(o)
 
-    return dataclass_excludes_default
+    return attrs_excludes_default
+
+
+# Serialize classes with __slots__
+def _mangle(cls, name):
+    # Private names in __slots__ are stored under their mangled name
+    if name.startswith("__") and not name.endswith("__"):
+        clsname = cls.__name__.lstrip("_")
+        if clsname:
+            return f"_{clsname}{name}"
+    return name
+
+
+def _slot_names(cls):
+    """
+    Get the names of the slots defined by a class and its bases,
+    base class slots first.
+    """
+    names = {}
+    for klass in reversed(cls.__mro__):
+        try:
+            slots = klass.__dict__["__slots__"]
+        except KeyError:
+            continue
+
+        if isinstance(slots, str):
+            slots = [slots]
+        elif iter(slots) is slots:
+            # The iterator was consumed when the class was created
+            # so use the slot descriptors on the class instead
+            slots = [
+                k for k, v in klass.__dict__.items()
+                if type(v) is MemberDescriptorType
+            ]
+            names.update(dict.fromkeys(slots))
+            continue
+
+        # Iterating a dict, such as SlotFields, gives the keys
+        for name in slots:
+            if name not in {"__dict__", "__weakref__"}:
+                names[_mangle(klass, name)] = None
+
+    return tuple(names)
+
+
+@codegen_cache()
+def _slots_defaultmaker(cls, exclude_fields=()):
+    field_names = _slot_names(cls)
+    if not field_names:
+        raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+
+    field_names = tuple(
+        name for name in field_names if name not in exclude_fields
+    )
+
+    method = field_default(field_names)  # type: ignore
+    return method
+
+
+def make_slots_default(exclude_fields):
+    """
+    Make a 'default' function to serialize classes with `__slots__` that will
+    exclude specific named fields.
+
+    :param exclude_fields: tuple of field names to exclude from serialization.
+    :return: 'default' function to use with json.dumps
+    """
+
+    def slots_excludes_default(o):
+        method = _slots_defaultmaker(type(o), exclude_fields)
+        return method(o)
+
+    return slots_excludes_default
+
+
+# Serialize ducktools.classbuilder classes
+@codegen_cache()
+def _cb_defaultmaker(cls, exclude_fields=()):
+    if not hasattr(cls, "__classbuilder_internals__"):
+        raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+
+    field_names = tuple(
+        name
+        for name in _laz.get_fields(cls)
+        if name not in exclude_fields
+    )
+
+    method = field_default(field_names)  # type: ignore
+    return method
+
+
+def make_classbuilder_default(exclude_fields):
+    """
+    Make a 'default' function to serialize ducktools.classbuilder classes
+    that will exclude specific named fields.
+
+    :param exclude_fields: tuple of field names to exclude from serialization.
+    :return: 'default' function to use with json.dumps
+    """
+
+    def classbuilder_excludes_default(o):
+        method = _cb_defaultmaker(type(o), exclude_fields)
+        return method(o)
+
+    return classbuilder_excludes_default
+
+
+def precompile(
+    classes,
+    exclude_fields=(),
+    *,
+    omit_none=False,
+    omit_defaults=False,
+    rename=None,
+):
+    """
+    Generate the serializers for classes ahead of time, for example at
+    startup, instead of on first use.
+
+    :param classes: iterable of dataclasses, attrs classes, classbuilder
+                    classes or classes with `__slots__`
+    :param exclude_fields: tuple of field names to exclude, as given
+                           to the matching `make_*_default` function
+    :param omit_none: as given to `make_dataclass_default`, dataclasses only
+    :param omit_defaults: as given to `make_dataclass_default`, dataclasses only
+    :param rename: as given to `make_dataclass_default`, dataclasses only
+    """
+    dc_args = _dc_maker_args(exclude_fields, omit_none, omit_defaults, rename)
+    args = (exclude_fields,) if exclude_fields else ()
+
+    for cls in classes:
+        if hasattr(cls, "__dataclass_fields__"):
+            _dc_defaultmaker(cls, *dc_args)
+            continue
+
+        if omit_none or omit_defaults or rename:
+            raise TypeError(
+                f"omit_none, omit_defaults and rename are only supported "
+                f"for dataclasses, not {cls.__name__}"
+            )
+
+        if hasattr(cls, "__attrs_attrs__"):
+            maker = _attrs_defaultmaker
+        elif hasattr(cls, "__classbuilder_internals__"):
+            maker = _cb_defaultmaker
+        else:
+            maker = _slots_defaultmaker
+
+        maker(cls, *args)
+
+
+# Direct access to the front cache for the hot path of dataclass_default
+_dc_front = _dc_defaultmaker._front
+_dc_stats = _dc_defaultmaker._stats
 
 
 def dataclass_default(o):
@@ -71,5 +630,64 @@ def dataclass_default(o):
     Function to provide to `json.dumps` to allow basic serialization
     of dataclass objects.
     """
-    method = _dc_defaultmaker(type(o))
+    try:
+        method = _dc_front[type(o)]
+    except KeyError:
+        method = _dc_defaultmaker._front_miss(type(o))
+    else:
+        _dc_stats[0] += 1
+    return method(o)
+
+
+_attrs_front = _attrs_defaultmaker._front
+_attrs_stats = _attrs_defaultmaker._stats
+
+
+def attrs_default(o):
+    """
+    Function to provide to `json.dumps` to allow basic serialization
+    of attrs classes.
+    """
+    try:
+        method = _attrs_front[type(o)]
+    except KeyError:
+        method = _attrs_defaultmaker._front_miss(type(o))
+    else:
+        _attrs_stats[0] += 1
+    return method(o)
+
+
+_slots_front = _slots_defaultmaker._front
+_slots_stats = _slots_defaultmaker._stats
+
+
+def slots_default(o):
+    """
+    Function to provide to `json.dumps` to allow basic serialization
+    of classes with `__slots__`, including slots inherited from base classes.
+    """
+    try:
+        method = _slots_front[type(o)]
+    except KeyError:
+        method = _slots_defaultmaker._front_miss(type(o))
+    else:
+        _slots_stats[0] += 1
+    return method(o)
+
+
+_cb_front = _cb_defaultmaker._front
+_cb_stats = _cb_defaultmaker._stats
+
+
+def classbuilder_default(o):
+    """
+    Function to provide to `json.dumps` to allow basic serialization
+    of ducktools.classbuilder classes such as `slotclass`.
+    """
+    try:
+        method = _cb_front[type(o)]
+    except KeyError:
+        method = _cb_defaultmaker._front_miss(type(o))
+    else:
+        _cb_stats[0] += 1
     return method(o)
@@ -1,15 +1,152 @@
 """
 This type stub file was generated by pyright.
 """
-from ducktools.lazyimporter import LazyImporter, ModuleImport
-from functools import lru_cache
+from ducktools.lazyimporter import LazyImporter
 
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Iterable, Mapping
+from os import PathLike, stat_result
+from types import CodeType
+from typing import Any, Generic, NamedTuple, ParamSpec, TypeVar
+from weakref import ReferenceType
 
 _laz: LazyImporter = ...
 
-@lru_cache
-def field_default(fieldnames: tuple[str, ...]) -> Callable[[Any], Any]: ...
-def make_dataclass_default(exclude_fields: tuple[str, ...]) -> Callable[[Any], Any]: ...
+_compile_count: int = ...
+FRONT_CACHE_SIZE: int = ...
+_code_cache_dir: str | None = ...
+
+def _is_private(st: stat_result) -> bool: ...
+def set_code_cache_dir(path: str | PathLike[str] | None) -> None: ...
+def _code_cache_path(funcdef: str) -> str: ...
+def _load_code(cache_path: str) -> CodeType | None: ...
+def _private_opener(path: str, flags: int) -> int: ...
+def _store_code(cache_path: str, code: CodeType) -> None: ...
+def _exec_function(funcdef: str, name: str, globs: dict[str, Any]) -> Callable[..., Any]: ...
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    compiles: int
+    maxsize: int | None
+    currsize: int
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+class CodegenCache(Generic[_P, _R]):
+    func: Callable[_P, _R]
+    maxsize: int | None
+    weak: bool
+    _data: dict[Any, _R]
+    _front: dict[Any, _R]
+    _stats: list[int]
+
+    def __init__(
+        self,
+        func: Callable[_P, _R],
+        maxsize: int | None = None,
+        weak: bool = True,
+    ) -> None: ...
+    def __call__(self, *args: _P.args, **kwargs: _P.kwargs) -> _R: ...
+    def _miss(
+        self,
+        key: Any,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> _R: ...
+    def _front_miss(self, key: Any, *args: Any) -> _R: ...
+    def _remove(self, dead_ref: ReferenceType[Any]) -> None: ...
+    def _evict(self, size: int) -> None: ...
+    def cache_info(self) -> CacheInfo: ...
+    def cache_clear(self) -> None: ...
+    def resize(self, maxsize: int | None) -> None: ...
+
+def codegen_cache(
+    maxsize: int | None = None,
+    weak: bool = True,
+) -> Callable[[Callable[_P, _R]], CodegenCache[_P, _R]]: ...
+
+@codegen_cache(weak=False)
+def field_default(
+    fieldnames: tuple[str, ...],
+    omit_none: bool = False,
+    defaults: tuple[tuple[str, Any], ...] = (),
+    rename: tuple[tuple[str, str], ...] = (),
+) -> Callable[[Any], Any]: ...
+def _conditional_body(
+    fieldnames: tuple[str, ...],
+    omit_none: bool,
+    defaults: dict[str, Any],
+    rename: dict[str, str],
+) -> tuple[list[str], dict[str, Any]]: ...
+@codegen_cache()
+def _dc_defaultmaker(
+    cls: type,
+    exclude_fields: tuple[str, ...] = (),
+    omit_none: bool = False,
+    omit_defaults: bool = False,
+    rename: tuple[tuple[str, str], ...] = (),
+) -> Callable[[Any], Any]: ...
+def _dc_maker_args(
+    exclude_fields: tuple[str, ...],
+    omit_none: bool,
+    omit_defaults: bool,
+    rename: Mapping[str, str] | None,
+) -> tuple[Any, ...]: ...
+def make_dataclass_default(
+    exclude_fields: tuple[str, ...] = (),
+    *,
+    omit_none: bool = False,
+    omit_defaults: bool = False,
+    rename: Mapping[str, str] | None = None,
+) -> Callable[[Any], Any]: ...
+
+@codegen_cache()
+def _attrs_defaultmaker(
+    cls: type,
+    exclude_fields: tuple[str, ...] = (),
+) -> Callable[[Any], Any]: ...
+def make_attrs_default(exclude_fields: tuple[str, ...]) -> Callable[[Any], Any]: ...
+def _mangle(cls: type, name: str) -> str: ...
+def _slot_names(cls: type) -> tuple[str, ...]: ...
+@codegen_cache()
+def _slots_defaultmaker(
+    cls: type,
+    exclude_fields: tuple[str, ...] = (),
+) -> Callable[[Any], Any]: ...
+def make_slots_default(exclude_fields: tuple[str, ...]) -> Callable[[Any], Any]: ...
+
+@codegen_cache()
+def _cb_defaultmaker(
+    cls: type,
+    exclude_fields: tuple[str, ...] = (),
+) -> Callable[[Any], Any]: ...
+def make_classbuilder_default(exclude_fields: tuple[str, ...]) -> Callable[[Any], Any]: ...
+def precompile(
+    classes: Iterable[type],
+    exclude_fields: tuple[str, ...] = (),
+    *,
+    omit_none: bool = False,
+    omit_defaults: bool = False,
+    rename: Mapping[str, str] | None = None,
+) -> None: ...
+
+_dc_front: dict[Any, Callable[[Any], Any]] = ...
+_dc_stats: list[int] = ...
+
 def dataclass_default(o: Any) -> Any: ...
+
+_attrs_front: dict[Any, Callable[[Any], Any]] = ...
+_attrs_stats: list[int] = ...
+
+def attrs_default(o: Any) -> Any: ...
+
+_slots_front: dict[Any, Callable[[Any], Any]] = ...
+_slots_stats: list[int] = ...
+
+def slots_default(o: Any) -> Any: ...
+
+_cb_front: dict[Any, Callable[[Any], Any]] = ...
+_cb_stats: list[int] = ...
+
+def classbuilder_default(o: Any) -> Any: ...
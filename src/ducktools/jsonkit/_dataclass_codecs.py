@@ -0,0 +1,578 @@
+from ducktools.lazyimporter import LazyImporter, ModuleImport
+
+from ._caching_tools import codegen_cache, dataclass_default, _exec_function
+
+
+_laz = LazyImporter(
+    [
+        ModuleImport("dataclasses"),
+        ModuleImport("json"),
+        ModuleImport("types"),
+        ModuleImport("typing"),
+    ],
+)
+
+
+_INF = float("inf")
+# Maximum number of sets of keys remembered by a dataclass object_hook
+HOOK_CACHE_SIZE = 1024
+
+
+def _field_hints(cls):
+    """
+    Get (name, type) pairs for the fields of a dataclass, resolving string
+    annotations where possible.
+    """
+    try:
+        hints = _laz.typing.get_type_hints(cls)
+    except Exception:
+        # Unresolvable forward references, these fields fall back to `default`
+        hints = {}
+    return [
+        (f.name, hints.get(f.name, f.type))
+        for f in _laz.dataclasses.fields(cls)
+    ]
+
+
+def _optional_arg(hint):
+    """
+    If hint is Optional[X] / X | None return X, otherwise None
+    """
+    origin = _laz.typing.get_origin(hint)
+    if origin is _laz.typing.Union or origin is _laz.types.UnionType:
+        args = [arg for arg in _laz.typing.get_args(hint) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return None
+
+
+class _EncoderBuilder:
+    """
+    Collects the source for the functions that convert a graph of dataclasses
+    directly to JSON text.
+    """
+    def __init__(self, fallback, array=False):
+        # In array mode dataclasses are written as arrays of their field values
+        self.array = array
+        self.globs = {
+            "_fallback": fallback,
+            "_enc_str": _laz.json.encoder.encode_basestring_ascii,
+            "_enc_key": _encode_key,
+            "_int_repr": int.__repr__,
+            "_float_repr": float.__repr__,
+            "_INF": _INF,
+        }
+        self.class_funcs = {}
+        self.pending = []
+        self.sources = []
+
+    def class_func(self, cls):
+        try:
+            return self.class_funcs[cls]
+        except KeyError:
+            idx = len(self.class_funcs)
+            funcname = f"_emit_{idx}"
+            self.globs[f"_cls_{idx}"] = cls
+            self.class_funcs[cls] = funcname
+            self.pending.append(cls)
+            return funcname
+
+    def expr(self, hint, var, depth=0):
+        """
+        Return a Python expression that evaluates to the JSON text for `var`
+        given the annotation `hint`.
+        """
+        fallback = f"_fallback({var})"
+
+        if hint is str:
+            return f"(_enc_str({var}) if type({var}) is str else {fallback})"
+        if hint is int:
+            return f"(_int_repr({var}) if type({var}) is int else {fallback})"
+        if hint is float:
+            return (
+                f"(_float_repr({var}) "
+                f"if type({var}) is float and -_INF < {var} < _INF "
+                f"else {fallback})"
+            )
+        if hint is bool:
+            return (
+                f"('true' if {var} is True else 'false' if {var} is False "
+                f"else {fallback})"
+            )
+        if hint is None or hint is type(None):
+            return f"('null' if {var} is None else {fallback})"
+
+        if isinstance(hint, type) and _laz.dataclasses.is_dataclass(hint):
+            funcname = self.class_func(hint)
+            clsname = funcname.replace("_emit_", "_cls_")
+            return f"({funcname}({var}) if type({var}) is {clsname} else {fallback})"
+
+        optional_arg = _optional_arg(hint)
+        if optional_arg is not None:
+            inner = self.expr(optional_arg, var, depth)
+            return f"('null' if {var} is None else {inner})"
+
+        origin = _laz.typing.get_origin(hint)
+        args = _laz.typing.get_args(hint)
+
+        if origin is list and len(args) == 1:
+            item = f"_i{depth}"
+            item_expr = self.expr(args[0], item, depth + 1)
+            return (
+                f"(('[' + ', '.join([{item_expr} for {item} in {var}]) + ']') "
+                f"if type({var}) is list else {fallback})"
+            )
+
+        if origin is dict and len(args) == 2 and args[0] is str:
+            key, item = f"_k{depth}", f"_i{depth}"
+            item_expr = self.expr(args[1], item, depth + 1)
+            return (
+                f"(('{{' + ', '.join(["
+                f"_enc_key({key}) + ': ' + {item_expr} "
+                f"for {key}, {item} in {var}.items()"
+                f"]) + '}}') "
+                f"if type({var}) is dict else {fallback})"
+            )
+
+        return fallback
+
+    def build_class(self, cls):
+        funcname = self.class_funcs[cls]
+        hints = _field_hints(cls)
+
+        start, end = "[]" if self.array else "{}"
+
+        lines = [f"def {funcname}(o):"]
+        parts = []
+        for i, (name, hint) in enumerate(hints):
+            lines.append(f"    _v{i} = o.{name}")
+            prefix = start if i == 0 else ", "
+            if not self.array:
+                prefix += f"{_laz.json.dumps(name)}: "
+            parts.append(repr(prefix))
+            parts.append(self.expr(hint, f"_v{i}"))
+
+        if parts:
+            parts.append(repr(end))
+            joined = ",\n        ".join(parts)
+            lines.append(f"    return ''.join((\n        {joined},\n    ))")
+        else:
+            lines.append(f"    return {start + end!r}")
+
+        self.sources.append("\n".join(lines))
+
+    def build(self, hint):
+        root_expr = self.expr(hint, "o")
+        while self.pending:
+            self.build_class(self.pending.pop())
+
+        self.sources.append(f"def encode(o):\n    return {root_expr}")
+        funcdef = "\n\n\n".join(self.sources) + "\n"
+
+        return _exec_function(funcdef, "encode", self.globs)
+
+
+def _has_default(f):
+    return (
+        f.default is not _laz.dataclasses.MISSING
+        or f.default_factory is not _laz.dataclasses.MISSING
+    )
+
+
+def _encode_key(key):
+    if type(key) is str:
+        return _laz.json.encoder.encode_basestring_ascii(key)
+    # Let json apply its own conversion of int, float, bool and None keys
+    # '{"key": null}' -> '"key"'
+    return _laz.json.dumps({key: None})[1:-7]
+
+
+# Generated functions hold references to the classes,
+# so the hints are not held weakly
+@codegen_cache(weak=False)
+def dataclass_encoder(hint, default=None):
+    """
+    Create a function that converts objects described by a type hint
+    directly to a JSON string.
+
+    Dataclasses reachable through the type hints of the root are compiled
+    into a single set of functions. Values annotated as str, int, float, bool,
+    None, nested dataclasses, Optional, list[...] and dict[str, ...] are
+    written inline, any other value or any value that does not match its
+    annotation is encoded by a JSONEncoder using `default`.
+
+    Output matches `json.dumps(obj, default=dataclass_default)`.
+
+    Usage Example: dataclass_encoder(list[Object])(objects)
+
+    :param hint: Dataclass or type hint such as list[Dataclass] for the root object
+    :param default: 'default' function for values that are not written inline,
+                    dataclass_default if not given.
+    :return: function converting an object to a JSON string
+    """
+    if default is None:
+        default = dataclass_default
+
+    fallback = _laz.json.JSONEncoder(default=default).encode
+    return _EncoderBuilder(fallback).build(hint)
+
+
+class _DecoderBuilder:
+    """
+    Collects the source for the functions that convert parsed JSON data
+    back into a graph of dataclasses.
+    """
+    def __init__(self, passthrough=False, array=False, schema=None):
+        # With an object_hook nested values may already be converted
+        self.passthrough = passthrough
+        # In array mode dataclasses are read from arrays of field values,
+        # in the order given by the schema or by the fields of the class
+        self.array = array
+        self.schema = schema
+        self.globs = {}
+        self.class_funcs = {}
+        self.pending = []
+        self.sources = []
+
+    def class_func(self, cls):
+        try:
+            return self.class_funcs[cls]
+        except KeyError:
+            idx = len(self.class_funcs)
+            funcname = f"_decode_{idx}"
+            self.globs[f"_cls_{idx}"] = cls
+            self.class_funcs[cls] = funcname
+            self.pending.append(cls)
+            return funcname
+
+    def expr(self, hint, var, depth=0):
+        """
+        Return a Python expression that converts the parsed value `var`
+        into the type given by the annotation `hint`.
+
+        Values that need no conversion return `var` unchanged.
+        """
+        if isinstance(hint, type) and _laz.dataclasses.is_dataclass(hint):
+            return f"{self.class_func(hint)}({var})"
+
+        optional_arg = _optional_arg(hint)
+        if optional_arg is not None:
+            inner = self.expr(optional_arg, var, depth)
+            if inner == var:
+                return var
+            return f"(None if {var} is None else {inner})"
+
+        origin = _laz.typing.get_origin(hint)
+        args = _laz.typing.get_args(hint)
+
+        if origin is list and len(args) == 1:
+            item = f"_i{depth}"
+            inner = self.expr(args[0], item, depth + 1)
+            if inner == item:
+                return var
+            return f"[{inner} for {item} in {var}]"
+
+        if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+            item = f"_i{depth}"
+            inner = self.expr(args[0], item, depth + 1)
+            return f"tuple([{inner} for {item} in {var}])"
+
+        if origin is dict and len(args) == 2:
+            key, item = f"_k{depth}", f"_i{depth}"
+            inner = self.expr(args[1], item, depth + 1)
+            if inner == item:
+                return var
+            return f"{{{key}: {inner} for {key}, {item} in {var}.items()}}"
+
+        return var
+
+    def build_class(self, cls):
+        funcname = self.class_funcs[cls]
+        clsname = funcname.replace("_decode_", "_cls_")
+        hints = dict(_field_hints(cls))
+
+        if self.array:
+            self.sources.append(self.array_class(cls, funcname, clsname, hints))
+            return
+
+        required, keywords, optional = [], [], []
+        for f in _laz.dataclasses.fields(cls):
+            if not f.init:
+                continue
+            value = self.expr(hints[f.name], f"d[{f.name!r}]")
+            if _has_default(f):
+                optional.append((f.name, value))
+            elif f.kw_only:
+                # Keyword only fields can come before positional fields
+                # in the class but must follow them in the call
+                keywords.append(f"{f.name}={value}")
+            else:
+                required.append(value)
+        required.extend(keywords)
+
+        lines = [f"def {funcname}(d):"]
+        if self.passthrough:
+            lines.append("    if type(d) is not dict:")
+            lines.append("        return d")
+        if optional:
+            lines.append("    kwargs = {}")
+            for name, value in optional:
+                lines.append(f"    if {name!r} in d:")
+                lines.append(f"        kwargs[{name!r}] = {value}")
+            required.append("**kwargs")
+
+        args = ", ".join(required)
+        lines.append(f"    return {clsname}({args})")
+
+        self.sources.append("\n".join(lines))
+
+    def array_class(self, cls, funcname, clsname, hints):
+        fields = _laz.dataclasses.fields(cls)
+        if self.schema is None:
+            names = [f.name for f in fields]
+        else:
+            try:
+                names = self.schema[cls.__qualname__]
+            except KeyError:
+                raise TypeError(f"Schema has no entry for {cls.__qualname__}")
+        index = {name: i for i, name in enumerate(names)}
+
+        args = []
+        positional = True
+        for f in fields:
+            if not f.init:
+                continue
+            if f.name not in index:
+                if not _has_default(f):
+                    raise TypeError(
+                        f"Schema for {cls.__qualname__} is missing "
+                        f"required field {f.name!r}"
+                    )
+                # Later fields can no longer be given by position
+                positional = False
+                continue
+
+            value = self.expr(hints[f.name], f"d[{index[f.name]}]")
+            if positional and not f.kw_only:
+                args.append(value)
+            else:
+                # No positional arguments can follow a keyword argument
+                positional = False
+                args.append(f"{f.name}={value}")
+
+        return f"def {funcname}(d):\n    return {clsname}({', '.join(args)})"
+
+    def build_classes(self, hint):
+        root_expr = self.expr(hint, "o")
+        while self.pending:
+            self.build_class(self.pending.pop())
+        return root_expr
+
+    def build(self, hint):
+        root_expr = self.build_classes(hint)
+
+        self.sources.append(f"def decode(o):\n    return {root_expr}")
+        funcdef = "\n\n\n".join(self.sources) + "\n"
+
+        return _exec_function(funcdef, "decode", self.globs)
+
+    def build_hook(self, hint):
+        self.build_classes(hint)
+
+        if self.sources:
+            funcdef = "\n\n\n".join(self.sources) + "\n"
+            _exec_function(funcdef, next(iter(self.class_funcs.values())), self.globs)
+
+        # A dictionary matches a class if it has every required field and
+        # all of its keys are field names, fields with init=False are ignored
+        shapes = []
+        for cls, funcname in self.class_funcs.items():
+            fields = _laz.dataclasses.fields(cls)
+            names = frozenset(f.name for f in fields)
+            required = frozenset(
+                f.name for f in fields if f.init and not _has_default(f)
+            )
+            for other, other_names, other_required, _ in shapes:
+                shared = names & other_names
+                if (required | other_required) <= shared and (
+                    shared or not (names or other_names)
+                ):
+                    raise TypeError(
+                        f"Classes {other.__name__} and {cls.__name__} "
+                        f"can not be distinguished by their field names"
+                    )
+            shapes.append((cls, names, required, self.globs[funcname]))
+
+        def match(keys):
+            for _, names, required, func in shapes:
+                # Empty dictionaries only match classes without fields
+                if required <= keys <= names and (keys or not names):
+                    return func
+            return None
+
+        # Decoders by the set of keys of each dictionary seen
+        decoders = {names: func for _, names, _, func in shapes}
+
+        def object_hook(d):
+            keys = frozenset(d)
+            try:
+                func = decoders[keys]
+            except KeyError:
+                if len(decoders) >= HOOK_CACHE_SIZE:
+                    decoders.clear()
+                func = decoders[keys] = match(keys)
+            if func is None:
+                return d
+            return func(d)
+
+        return object_hook
+
+
+@codegen_cache(weak=False)
+def dataclass_decoder(hint):
+    """
+    Create a function that converts parsed JSON data into the dataclasses
+    described by a type hint.
+
+    Conversion functions for every dataclass reachable through the type hints
+    of the root are generated once. Nested dataclasses, Optional, list[...],
+    tuple[..., ...] and dict[..., ...] values are converted, other values
+    are passed to the constructors unchanged.
+
+    Usage Example: dataclass_decoder(list[Object])(json.loads(data))
+
+    :param hint: Dataclass or type hint such as list[Dataclass] for the root object
+    :return: function converting parsed JSON data to dataclass instances
+    """
+    return _DecoderBuilder().build(hint)
+
+
+@codegen_cache(weak=False)
+def dataclass_object_hook(hint):
+    """
+    Create an `object_hook` for json.loads that converts the dictionaries for
+    the dataclasses described by a type hint.
+
+    Dictionaries are matched to a dataclass if they have a key for every
+    required field and every key is the name of a field, so output with
+    defaulted fields left out or with init=False fields is matched.
+    Keys for init=False fields are ignored. Dictionaries that match no
+    dataclass are returned unchanged.
+
+    Raises TypeError if two of the dataclasses could match the same
+    dictionary.
+
+    Usage Example: json.loads(data, object_hook=dataclass_object_hook(Object))
+
+    :param hint: Dataclass or type hint such as list[Dataclass] for the root object
+    :return: object_hook function to provide to json.loads
+    """
+    return _DecoderBuilder(passthrough=True).build_hook(hint)
+
+
+# Array (positional) mode
+@codegen_cache()
+def _dc_arraymaker(cls):
+    if not _laz.dataclasses.is_dataclass(cls):
+        raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+
+    vals = ", ".join(f"o.{f.name}" for f in _laz.dataclasses.fields(cls))
+    funcdef = (
+        f"def default(o):\n"
+        f"    try:\n"
+        f"        return [{vals}]\n"
+        f"    except AttributeError:\n"
+        f"        raise TypeError(\n"
+        f"            f'Object of type {{type(o).__name__}} is not JSON serializable'\n"
+        f"        )\n"
+    )
+    return _exec_function(funcdef, "default", {})
+
+
+_array_front = _dc_arraymaker._front
+_array_stats = _dc_arraymaker._stats
+
+
+def dataclass_array_default(o):
+    """
+    Function to provide to `json.dumps` to serialize dataclass objects
+    as arrays of their field values in field order.
+    """
+    try:
+        method = _array_front[type(o)]
+    except KeyError:
+        method = _dc_arraymaker._front_miss(type(o))
+    else:
+        _array_stats[0] += 1
+    return method(o)
+
+
+def dataclass_schema(hint):
+    """
+    Get the field names of every dataclass described by a type hint in the
+    order they are written by the array encoders.
+
+    This can be sent as a header with array encoded data so a decoder
+    can match the values to the fields.
+
+    :param hint: Dataclass or type hint such as list[Dataclass] for the root object
+    :return: dict of {class qualname: [field names]}
+    """
+    builder = _DecoderBuilder(array=True)
+    builder.build_classes(hint)
+
+    schema = {}
+    for cls in builder.class_funcs:
+        if cls.__qualname__ in schema:
+            raise TypeError(
+                f"Multiple classes with the qualified name {cls.__qualname__}"
+            )
+        schema[cls.__qualname__] = [f.name for f in _laz.dataclasses.fields(cls)]
+    return schema
+
+
+@codegen_cache(weak=False)
+def dataclass_array_encoder(hint, default=None):
+    """
+    Create a function that converts objects described by a type hint
+    directly to a JSON string, writing each dataclass as an array of its
+    field values instead of an object.
+
+    Values are written as by `dataclass_encoder`.
+
+    Output matches `json.dumps(obj, default=dataclass_array_default)`.
+
+    :param hint: Dataclass or type hint such as list[Dataclass] for the root object
+    :param default: 'default' function for values that are not written inline,
+                    dataclass_array_default if not given.
+    :return: function converting an object to a JSON string
+    """
+    if default is None:
+        default = dataclass_array_default
+
+    fallback = _laz.json.JSONEncoder(default=default).encode
+    return _EncoderBuilder(fallback, array=True).build(hint)
+
+
+@codegen_cache(weak=False)
+def _array_decoder(hint, schema_items):
+    schema = None if schema_items is None else dict(schema_items)
+    return _DecoderBuilder(array=True, schema=schema).build(hint)
+
+
+def dataclass_array_decoder(hint, schema=None):
+    """
+    Create a function that converts parsed JSON data written by an array
+    encoder into the dataclasses described by a type hint.
+
+    Without a schema the arrays must be in the current field order of each
+    class. With a schema from `dataclass_schema` values are matched to fields
+    by name, so fields can be reordered or added with defaults.
+
+    :param hint: Dataclass or type hint such as list[Dataclass] for the root object
+    :param schema: dict of {class qualname: [field names]} the data was written with
+    :return: function converting parsed JSON data to dataclass instances
+    """
+    if schema is not None:
+        schema = tuple((name, tuple(fields)) for name, fields in schema.items())
+    return _array_decoder(hint, schema)
@@ -0,0 +1,93 @@
+from ducktools.lazyimporter import LazyImporter
+
+from ._caching_tools import codegen_cache
+
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import Field
+from typing import Any
+
+_laz: LazyImporter = ...
+_INF: float = ...
+HOOK_CACHE_SIZE: int
+
+def _field_hints(cls: type) -> list[tuple[str, Any]]: ...
+def _optional_arg(hint: Any) -> Any: ...
+
+class _EncoderBuilder:
+    array: bool
+    globs: dict[str, Any]
+    class_funcs: dict[type, str]
+    pending: list[type]
+    sources: list[str]
+
+    def __init__(self, fallback: Callable[[Any], str], array: bool = False) -> None: ...
+    def class_func(self, cls: type) -> str: ...
+    def expr(self, hint: Any, var: str, depth: int = 0) -> str: ...
+    def build_class(self, cls: type) -> None: ...
+    def build(self, hint: Any) -> Callable[[Any], str]: ...
+
+def _has_default(f: Field) -> bool: ...
+def _encode_key(key: Any) -> str: ...
+
+@codegen_cache(weak=False)
+def dataclass_encoder(
+    hint: Any,
+    default: Callable[[Any], Any] | None = None,
+) -> Callable[[Any], str]: ...
+
+class _DecoderBuilder:
+    passthrough: bool
+    array: bool
+    schema: Mapping[str, Sequence[str]] | None
+    globs: dict[str, Any]
+    class_funcs: dict[type, str]
+    pending: list[type]
+    sources: list[str]
+
+    def __init__(
+        self,
+        passthrough: bool = False,
+        array: bool = False,
+        schema: Mapping[str, Sequence[str]] | None = None,
+    ) -> None: ...
+    def class_func(self, cls: type) -> str: ...
+    def expr(self, hint: Any, var: str, depth: int = 0) -> str: ...
+    def build_class(self, cls: type) -> None: ...
+    def array_class(
+        self,
+        cls: type,
+        funcname: str,
+        clsname: str,
+        hints: dict[str, Any],
+    ) -> str: ...
+    def build_classes(self, hint: Any) -> str: ...
+    def build(self, hint: Any) -> Callable[[Any], Any]: ...
+    def build_hook(self, hint: Any) -> Callable[[dict[str, Any]], Any]: ...
+
+@codegen_cache(weak=False)
+def dataclass_decoder(hint: Any) -> Callable[[Any], Any]: ...
+@codegen_cache(weak=False)
+def dataclass_object_hook(hint: Any) -> Callable[[dict[str, Any]], Any]: ...
+
+@codegen_cache()
+def _dc_arraymaker(cls: type) -> Callable[[Any], list[Any]]: ...
+
+_array_front: dict[Any, Callable[[Any], list[Any]]] = ...
+_array_stats: list[int] = ...
+
+def dataclass_array_default(o: Any) -> list[Any]: ...
+def dataclass_schema(hint: Any) -> dict[str, list[str]]: ...
+@codegen_cache(weak=False)
+def dataclass_array_encoder(
+    hint: Any,
+    default: Callable[[Any], Any] | None = None,
+) -> Callable[[Any], str]: ...
+@codegen_cache(weak=False)
+def _array_decoder(
+    hint: Any,
+    schema_items: tuple[tuple[str, tuple[str, ...]], ...] | None,
+) -> Callable[[Any], Any]: ...
+def dataclass_array_decoder(
+    hint: Any,
+    schema: Mapping[str, Sequence[str]] | None = None,
+) -> Callable[[Any], Any]: ...
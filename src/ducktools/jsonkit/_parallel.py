@@ -0,0 +1,108 @@
+import sys
+
+from ducktools.lazyimporter import LazyImporter, ModuleImport, FromImport
+
+
+_laz = LazyImporter(
+    [
+        ModuleImport("json"),
+        FromImport("concurrent.futures", "ProcessPoolExecutor"),
+        FromImport("concurrent.futures", "ThreadPoolExecutor"),
+    ]
+)
+
+
+CHUNK_SIZE = 10_000
+
+
+# Encoder for the current worker process, set up once by _init_worker
+_worker_encode = None
+
+
+def _init_worker(default):
+    global _worker_encode
+    _worker_encode = _laz.json.JSONEncoder(default=default).encode
+
+
+def _encode_chunk(chunk):
+    # '[a, b]' -> 'a, b'
+    return _worker_encode(chunk)[1:-1]
+
+
+def _split_chunks(items, chunk_size):
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def _join_chunks(parts):
+    return f"[{', '.join(parts)}]"
+
+
+def parallel_dumps(items, *, default=None, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Serialize a list to a JSON array, encoding chunks of the list in
+    separate processes.
+
+    Each worker process creates its encoder once so caches used by the
+    default, such as the generated dataclass serializers, are filled once per
+    worker and reused for every chunk it encodes. Items and the default
+    function must be picklable.
+
+    The output matches `json.dumps(items, default=default)`.
+
+    :param items: list of objects to serialize
+    :param default: 'default' function for the encoder
+    :param workers: maximum number of worker processes, defaults to the CPU count
+    :param chunk_size: number of items sent to a worker in each task
+    :return: JSON array string
+    """
+    if workers == 1 or len(items) <= chunk_size:
+        return _laz.json.JSONEncoder(default=default).encode(list(items))
+
+    chunks = _split_chunks(items, chunk_size)
+
+    with _laz.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(default,),
+    ) as pool:
+        return _join_chunks(pool.map(_encode_chunk, chunks))
+
+
+def _gil_enabled():
+    # sys._is_gil_enabled is only available from 3.13
+    try:
+        return sys._is_gil_enabled()
+    except AttributeError:
+        return True
+
+
+def threaded_dumps(items, *, default=None, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Serialize a list to a JSON array, encoding chunks of the list in
+    separate threads on free-threaded builds of Python.
+
+    With the GIL enabled threads can not encode in parallel so the list
+    is encoded serially in the current thread. The default function must
+    be safe to call from multiple threads.
+
+    The output matches `json.dumps(items, default=default)`.
+
+    :param items: list of objects to serialize
+    :param default: 'default' function for the encoder
+    :param workers: maximum number of worker threads
+    :param chunk_size: number of items encoded in each task
+    :return: JSON array string
+    """
+    encode = _laz.json.JSONEncoder(default=default).encode
+
+    if workers == 1 or len(items) <= chunk_size or _gil_enabled():
+        return encode(list(items))
+
+    def encode_chunk(chunk):
+        # '[a, b]' -> 'a, b'
+        return encode(chunk)[1:-1]
+
+    chunks = _split_chunks(items, chunk_size)
+
+    with _laz.ThreadPoolExecutor(max_workers=workers) as pool:
+        return _join_chunks(pool.map(encode_chunk, chunks))
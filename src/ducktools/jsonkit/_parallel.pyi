@@ -0,0 +1,30 @@
+from ducktools.lazyimporter import LazyImporter
+
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+_laz: LazyImporter = ...
+
+CHUNK_SIZE: int = ...
+
+_worker_encode: Callable[[Any], str] | None = ...
+
+def _init_worker(default: Callable[[Any], Any] | None) -> None: ...
+def _encode_chunk(chunk: Sequence[Any]) -> str: ...
+def _split_chunks(items: Sequence[Any], chunk_size: int) -> list[Sequence[Any]]: ...
+def _join_chunks(parts: Iterable[str]) -> str: ...
+def parallel_dumps(
+    items: Sequence[Any],
+    *,
+    default: Callable[[Any], Any] | None = None,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> str: ...
+def _gil_enabled() -> bool: ...
+def threaded_dumps(
+    items: Sequence[Any],
+    *,
+    default: Callable[[Any], Any] | None = None,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> str: ...
@@ -0,0 +1,109 @@
+from time import perf_counter
+
+
+class ProfiledDefault:
+    """
+    Wrap a 'default' function to record, for each concrete type it is called
+    with, the number of calls, the cumulative time spent in the default and the
+    number of calls that raised a TypeError (types the default could not
+    serialize).
+
+    Use `profile_default` to create these so profiling can be switched off
+    without any cost.
+    """
+    __slots__ = ("default", "_stats")
+
+    def __init__(self, default):
+        """
+        :param default: 'default' function to profile
+        """
+        self.default = default
+        # type -> [calls, total_time, misses]
+        self._stats = {}
+
+    def __repr__(self):
+        return f"{type(self).__name__}(default={self.default!r})"
+
+    def __call__(self, o):
+        cls = type(o)
+        try:
+            stats = self._stats[cls]
+        except KeyError:
+            stats = self._stats[cls] = [0, 0.0, 0]
+
+        start = perf_counter()
+        try:
+            return self.default(o)
+        except TypeError:
+            stats[2] += 1
+            raise
+        finally:
+            stats[0] += 1
+            stats[1] += perf_counter() - start
+
+    def stats(self):
+        """
+        Get the recorded statistics, slowest types first.
+
+        :return: dict of {type_name: {"calls": int, "time": float, "misses": int}}
+        """
+        items = sorted(self._stats.items(), key=lambda item: item[1][1], reverse=True)
+        return {
+            f"{cls.__module__}.{cls.__qualname__}": {
+                "calls": calls,
+                "time": total_time,
+                "misses": misses,
+            }
+            for cls, (calls, total_time, misses) in items
+        }
+
+    def table(self):
+        """
+        Format the recorded statistics as a Markdown table, slowest types first.
+
+        :return: table as a string
+        """
+        lines = [
+            "| Type | Calls | Time /s | Time per call /us | Misses |",
+            "| ---- | ----- | ------- | ----------------- | ------ |",
+        ]
+        for name, stats in self.stats().items():
+            calls, total_time = stats["calls"], stats["time"]
+            lines.append(
+                f"| {name} | {calls} | {total_time:.6f} "
+                f"| {total_time / calls * 1e6:.3f} | {stats['misses']} |"
+            )
+        return "\n".join(lines)
+
+    def reset(self):
+        """
+        Clear the recorded statistics.
+        """
+        self._stats.clear()
+
+
+def profile_default(default, enabled=True):
+    """
+    Wrap a 'default' function, such as `JSONRegister.default`, the result
+    of `merge_defaults` or `dataclass_default`, to record per type call counts,
+    time and misses.
+
+    If `enabled` is False the default is returned unchanged, so the call can
+    be left in place in production code without any overhead.
+
+    To see which defaults given to `merge_defaults` are falling through,
+    profile each of them before merging, their misses are the fallthroughs.
+
+    Usage Example:
+    default = profile_default(register.default, enabled=settings.PROFILE_JSON)
+    json.dumps(data, default=default)
+    if isinstance(default, ProfiledDefault):
+        print(default.table())
+
+    :param default: 'default' function to profile
+    :param enabled: profile the default if True, otherwise return it unchanged
+    :return: ProfiledDefault wrapper or the original default
+    """
+    if not enabled:
+        return default
+    return ProfiledDefault(default)
@@ -0,0 +1,21 @@
+from collections.abc import Callable
+from typing import Any, TypedDict, TypeVar
+
+class _TypeStats(TypedDict):
+    calls: int
+    time: float
+    misses: int
+
+class ProfiledDefault:
+    default: Callable[[Any], Any]
+    _stats: dict[type, list[Any]]
+
+    def __init__(self, default: Callable[[Any], Any]) -> None: ...
+    def __call__(self, o: Any) -> Any: ...
+    def stats(self) -> dict[str, _TypeStats]: ...
+    def table(self) -> str: ...
+    def reset(self) -> None: ...
+
+_DefaultT = TypeVar("_DefaultT", bound=Callable[[Any], Any])
+
+def profile_default(default: _DefaultT, enabled: bool = True) -> _DefaultT | ProfiledDefault: ...
@@ -0,0 +1,346 @@
+import sys
+from abc import get_cache_token
+
+from ducktools.classbuilder import slotclass, SlotFields, Field
+
+
+# Maximum number of types held by a dispatch cache before it is cleared
+DISPATCH_CACHE_SIZE = 1024
+
+
+# Register
+def _lookup_class(name):
+    """
+    Find a class from a 'module.qualname' string without importing anything.
+
+    The longest dotted prefix of the name that is an imported module is used
+    as the module and the rest is looked up as the (possibly nested) qualname.
+    If the module has not been imported there can be no instances of the class
+    so None is returned. None is also returned if the name is not a class.
+    """
+    parts = name.split(".")
+    for i in range(len(parts) - 1, 0, -1):
+        obj = sys.modules.get(".".join(parts[:i]))
+        if obj is not None:
+            break
+    else:
+        return None
+
+    for attr in parts[i:]:
+        obj = getattr(obj, attr, None)
+        if obj is None:
+            return None
+    return obj if isinstance(obj, type) else None
+
+
+def _resolve_serializer(registry, cls):
+    # First registered match wins, as with a plain isinstance scan
+    for reg_cls, func in registry:
+        if type(reg_cls) is str:
+            reg_cls = _lookup_class(reg_cls)
+            if reg_cls is None:
+                continue
+        if issubclass(cls, reg_cls):
+            return func
+    return None
+
+
+@slotclass
+class _RegisterDecorator:
+    """
+    A descriptor used as part of the mechanism to register serializers for classes
+    using a decorator.
+    """
+    __slots__ = SlotFields(
+        func=Field(),
+        registry=Field(),
+    )
+
+    def __set_name__(self, owner, name):
+        self.registry.register(owner, self.func)
+        setattr(owner, name, self.func)
+
+
+@slotclass
+class JSONRegister:
+    """
+    Register methods for serializing classes, provides a 'default' method
+    to give to `dumps` style functions.
+
+    Provides a method to add a serializer for any class and two decorators
+    to decorate functions and class methods to register them as serializers.
+
+    The serializer for each type is cached. The cache is cleared by `register`
+    and once it holds `DISPATCH_CACHE_SIZE` types, so it can not keep an
+    unlimited number of classes alive. Classes registered with an ABC after
+    they were cached are found the next time the cached result is to raise a
+    TypeError. Call `cache_clear` after changing `registry` directly.
+    """
+
+    __slots__ = SlotFields(
+        registry=Field(default_factory=list, init=False),
+        _dispatch_cache=Field(
+            default_factory=dict, init=False, repr=False, compare=False
+        ),
+        _abc_token=Field(default=None, init=False, repr=False, compare=False),
+    )
+
+    def register(self, cls, func):
+        """
+        Register a function that will convert a class instance into something
+        that is serializable by the json.dumps function.
+
+        Usage Example: registry.register(Path, str)
+
+        The class can also be given as a 'module.qualname' string such as
+        'decimal.Decimal' so the module does not need to be imported to register
+        a serializer. The class is only looked up once its module is imported.
+
+        :param cls: Class object to use to identify objects with isinstance,
+                    or the 'module.qualname' string for the class
+        :param func: Single argument callable that will convert instances of cls
+                     into serializable objects
+        """
+        if type(cls) is str and "." not in cls:
+            raise ValueError(
+                f"Classes must be registered by 'module.qualname', got {cls!r}"
+            )
+        self.registry.append((cls, func))
+        # Earlier resolutions may now be shadowed by this entry
+        self._dispatch_cache.clear()
+
+    def register_function(self, cls):
+        """
+        Register a function as a serializer by using a decorator.
+
+        Usage Example:
+        @registry.register_function(Decimal)
+        def unstructure_decimal(val):
+            return {'cls': 'Decimal', 'value': str(val)}
+
+        :param cls: Class the function is being registered for.
+        """
+
+        def wrapper(func):
+            self.register(cls, func)
+            return func
+
+        return wrapper
+
+    def register_method(self, method):
+        """
+        Register a class method as a serializer by using a decorator.
+
+        Usage Example:
+        @dataclasses.dataclass
+        class Demo:
+            id: int
+            name: str
+            location: Path
+            numbers: list[Decimal]
+
+            @register.register_method
+            def to_json(self):
+                return {
+                    'id': self.id,
+                    'name': self.name,
+                    'location': self.location,
+                    'numbers': self.numbers,
+                }
+
+        :param method: The method of a class that converts instances to natively
+                       serializable data.
+        """
+
+        # In order for this to work the registry needs to know the class that
+        # provides the method to be decorated.
+
+        # This isn't available by inspecting the function so a descriptor
+        # is created that will be given the class when __set_name__ is called.
+        # This descriptor is a non-data descriptor so can be replaced by
+        # the original function.
+
+        return _RegisterDecorator(method, self)
+
+    def cache_clear(self):
+        """
+        Clear the cached serializers for each type.
+
+        Needed if `registry` is modified directly instead of through `register`.
+        """
+        self._dispatch_cache.clear()
+
+    def _resolve(self, cls):
+        cache = self._dispatch_cache
+        if len(cache) >= DISPATCH_CACHE_SIZE:
+            cache.clear()
+        func = cache[cls] = _resolve_serializer(self.registry, cls)
+        return func
+
+    def default(self, o):
+        """
+        Default function to provide to a json.dumps call as the `default` argument.
+
+        The serializer for each concrete type is resolved once and cached, so
+        repeated objects of the same type skip the search through the registry.
+
+        :param o: object to serialize
+        :return: serializable data
+        """
+        cls = type(o)
+        try:
+            func = self._dispatch_cache[cls]
+        except KeyError:
+            func = self._resolve(cls)
+
+        if func is None:
+            token = get_cache_token()
+            if token != self._abc_token:
+                # Classes may have been registered with an ABC since
+                # the cached serializers were resolved
+                self._abc_token = token
+                self._dispatch_cache.clear()
+                func = self._resolve(cls)
+            if func is None:
+                raise TypeError(
+                    f"Object of type {cls.__name__} is not JSON serializable"
+                )
+        return func(o)
+
+    def freeze(self):
+        """
+        Create a standalone 'default' function from the current state of the register.
+
+        Serializers for the registered classes are resolved ahead of time and
+        later registrations do not affect the returned function.
+
+        :return: default function to provide to json.dumps
+        """
+        registry = tuple(self.registry)
+        dispatch = {}
+        abc_token = get_cache_token()
+
+        def resolve(cls):
+            if len(dispatch) >= DISPATCH_CACHE_SIZE:
+                dispatch.clear()
+            func = dispatch[cls] = _resolve_serializer(registry, cls)
+            return func
+
+        for cls, _ in registry:
+            if type(cls) is str:
+                # Classes given by name are resolved on first use
+                continue
+            if cls not in dispatch:
+                resolve(cls)
+
+        def default(o):
+            nonlocal abc_token
+            cls = type(o)
+            try:
+                func = dispatch[cls]
+            except KeyError:
+                func = resolve(cls)
+
+            if func is None:
+                token = get_cache_token()
+                if token != abc_token:
+                    abc_token = token
+                    dispatch.clear()
+                    func = resolve(cls)
+                if func is None:
+                    raise TypeError(
+                        f"Object of type {cls.__name__} is not JSON serializable"
+                    )
+            return func(o)
+
+        return default
+
+
+@slotclass
+class JSONDecodeRegister:
+    """
+    Register functions for reconstructing objects from tagged dictionaries,
+    provides an 'object_hook' method to give to `loads` style functions.
+
+    Dictionaries are matched by the value of a single discriminator key,
+    such as {"cls": "Decimal", "value": "0.001"}, with one dict lookup.
+    Dictionaries without the key, or with an unregistered tag, are returned
+    unchanged.
+    """
+
+    __slots__ = SlotFields(
+        key=Field(default="cls"),
+        registry=Field(default_factory=dict, init=False),
+    )
+
+    def register(self, tag, func):
+        """
+        Register a function that will convert a tagged dictionary back into
+        an object.
+
+        Usage Example: registry.register("Decimal", lambda d: Decimal(d["value"]))
+
+        :param tag: Value of the discriminator key identifying the dictionaries
+        :param func: Single argument callable taking the dictionary and
+                     returning the reconstructed object
+        """
+        self.registry[tag] = func
+
+    def register_function(self, tag):
+        """
+        Register a function as a reconstructor by using a decorator.
+
+        Usage Example:
+        @registry.register_function("Decimal")
+        def structure_decimal(d):
+            return Decimal(d["value"])
+
+        :param tag: Value of the discriminator key the function is being registered for.
+        """
+
+        def wrapper(func):
+            self.register(tag, func)
+            return func
+
+        return wrapper
+
+    def object_hook(self, d):
+        """
+        Object hook function to provide to a json.loads call as the `object_hook` argument.
+
+        :param d: decoded dictionary
+        :return: reconstructed object, or d if it is not a registered tagged dictionary
+        """
+        key = self.key
+        if key not in d:
+            return d
+        try:
+            func = self.registry[d[key]]
+        except (KeyError, TypeError):
+            # Unregistered or unhashable tag
+            return d
+        return func(d)
+
+    def freeze(self):
+        """
+        Create a standalone 'object_hook' function from the current state of the register.
+
+        Later registrations do not affect the returned function.
+
+        :return: object_hook function to provide to json.loads
+        """
+        key = self.key
+        get_func = dict(self.registry).get
+
+        def object_hook(d):
+            if key not in d:
+                return d
+            try:
+                func = get_func(d[key])
+            except TypeError:
+                return d
+            if func is None:
+                return d
+            return func(d)
+
+        return object_hook
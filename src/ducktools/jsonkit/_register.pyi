@@ -0,0 +1,52 @@
+import types
+from typing import Any, TypeVar
+
+from collections.abc import Callable, Sequence
+
+class _RegisterDecorator:
+    func: Callable[[Any], Any]
+    registry: JSONRegister
+
+    __classbuilder_internals__: dict
+
+    def __init__(self, func: Callable[[Any], Any], registry: JSONRegister) -> None: ...
+    def __set_name__(self, owner: type, name: str) -> None: ...
+
+_FuncT = TypeVar("_FuncT", bound=Callable[[Any], Any])
+
+DISPATCH_CACHE_SIZE: int = ...
+
+def _lookup_class(name: str) -> type | None: ...
+def _resolve_serializer(
+    registry: Sequence[tuple[type | str, Callable[[Any], Any]]],
+    cls: type,
+) -> Callable[[Any], Any] | None: ...
+
+class JSONRegister:
+    registry: list[tuple[type | str, Callable[[Any], Any]]]
+    _dispatch_cache: dict[type, Callable[[Any], Any] | None]
+    _abc_token: object
+
+    __classbuilder_internals__: dict
+
+    def __init__(self) -> None: ...
+    def register(self, cls: type | str, func: Callable[..., Any]) -> None: ...
+    def register_function(self, cls: type | str) -> Callable[[_FuncT], _FuncT]: ...
+
+    def register_method(self, method: types.MethodType) -> _RegisterDecorator: ...
+    def cache_clear(self) -> None: ...
+    def _resolve(self, cls: type) -> Callable[[Any], Any] | None: ...
+    def default(self, o: Any) -> Any: ...
+    def freeze(self) -> Callable[[Any], Any]: ...
+
+class JSONDecodeRegister:
+    key: str
+    registry: dict[Any, Callable[[dict[str, Any]], Any]]
+
+    __classbuilder_internals__: dict
+
+    def __init__(self, key: str = "cls") -> None: ...
+    def register(self, tag: Any, func: Callable[[dict[str, Any]], Any]) -> None: ...
+    def register_function(self, tag: Any) -> Callable[[_FuncT], _FuncT]: ...
+    def object_hook(self, d: dict[str, Any]) -> Any: ...
+    def freeze(self) -> Callable[[dict[str, Any]], Any]: ...
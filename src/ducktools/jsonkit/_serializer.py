@@ -0,0 +1,156 @@
+from ducktools.lazyimporter import LazyImporter, ModuleImport
+
+
+_laz = LazyImporter(
+    [
+        ModuleImport("io"),
+        ModuleImport("json"),
+    ]
+)
+
+
+class Serializer:
+    """
+    Serialize objects with a 'default' function, reusing one JSONEncoder
+    for each combination of options.
+
+    `json.dumps` creates a new JSONEncoder on every call that is given
+    a `default`, which is a significant part of the cost for small objects.
+    """
+    __slots__ = ("default", "_encoders")
+
+    def __init__(self, default=None):
+        """
+        :param default: 'default' function, or an object with a 'default' method
+                        such as a JSONRegister
+        """
+        if default is not None and not callable(default):
+            default = default.default
+        self.default = default
+        # (indent, sort_keys, separators, ensure_ascii) -> JSONEncoder
+        self._encoders = {}
+
+    def __repr__(self):
+        return f"{type(self).__name__}(default={self.default!r})"
+
+    def encoder(
+        self,
+        *,
+        indent=None,
+        sort_keys=False,
+        separators=None,
+        ensure_ascii=True,
+    ):
+        """
+        Get the JSONEncoder for a set of options, creating it on first use.
+
+        :param indent: indent as for `json.dumps`
+        :param sort_keys: sort the keys of dictionaries
+        :param separators: (item_separator, key_separator) tuple
+        :param ensure_ascii: escape non-ASCII characters
+        :return: JSONEncoder
+        """
+        key = (indent, sort_keys, separators, ensure_ascii)
+        try:
+            return self._encoders[key]
+        except KeyError:
+            encoder = self._encoders[key] = _laz.json.JSONEncoder(
+                default=self.default,
+                indent=indent,
+                sort_keys=sort_keys,
+                separators=separators,
+                ensure_ascii=ensure_ascii,
+            )
+            return encoder
+
+    def encode(
+        self,
+        obj,
+        *,
+        indent=None,
+        sort_keys=False,
+        separators=None,
+        ensure_ascii=True,
+    ):
+        """
+        Serialize obj to a JSON str.
+
+        :param obj: object to serialize
+        :param indent: indent as for `json.dumps`
+        :param sort_keys: sort the keys of dictionaries
+        :param separators: (item_separator, key_separator) tuple
+        :param ensure_ascii: escape non-ASCII characters
+        :return: JSON str
+        """
+        key = (indent, sort_keys, separators, ensure_ascii)
+        try:
+            encoder = self._encoders[key]
+        except KeyError:
+            encoder = self.encoder(
+                indent=indent,
+                sort_keys=sort_keys,
+                separators=separators,
+                ensure_ascii=ensure_ascii,
+            )
+        return encoder.encode(obj)
+
+    def encode_bytes(
+        self,
+        obj,
+        *,
+        indent=None,
+        sort_keys=False,
+        separators=None,
+        ensure_ascii=True,
+    ):
+        """
+        Serialize obj to UTF-8 encoded JSON bytes.
+
+        :param obj: object to serialize
+        :param indent: indent as for `json.dumps`
+        :param sort_keys: sort the keys of dictionaries
+        :param separators: (item_separator, key_separator) tuple
+        :param ensure_ascii: escape non-ASCII characters
+        :return: JSON bytes
+        """
+        return self.encode(
+            obj,
+            indent=indent,
+            sort_keys=sort_keys,
+            separators=separators,
+            ensure_ascii=ensure_ascii,
+        ).encode("utf-8")
+
+    def dump(
+        self,
+        obj,
+        fp,
+        *,
+        indent=None,
+        sort_keys=False,
+        separators=None,
+        ensure_ascii=True,
+    ):
+        """
+        Serialize obj and write it to a file with a single write.
+
+        Binary files (io.RawIOBase or io.BufferedIOBase) are given UTF-8
+        encoded bytes, anything else is given str as with `json.dump`.
+
+        :param obj: object to serialize
+        :param fp: text or binary file-like object with a `write` method
+        :param indent: indent as for `json.dumps`
+        :param sort_keys: sort the keys of dictionaries
+        :param separators: (item_separator, key_separator) tuple
+        :param ensure_ascii: escape non-ASCII characters
+        """
+        data = self.encode(
+            obj,
+            indent=indent,
+            sort_keys=sort_keys,
+            separators=separators,
+            ensure_ascii=ensure_ascii,
+        )
+        if isinstance(fp, (_laz.io.RawIOBase, _laz.io.BufferedIOBase)):
+            data = data.encode("utf-8")
+        fp.write(data)
@@ -0,0 +1,59 @@
+import json
+
+from ducktools.lazyimporter import LazyImporter
+
+from collections.abc import Callable
+from typing import Any, Protocol
+
+_laz: LazyImporter = ...
+
+class _HasDefault(Protocol):
+    def default(self, o: Any) -> Any: ...
+
+_EncoderKey = tuple[int | str | None, bool, tuple[str, str] | None, bool]
+
+class Serializer:
+    default: Callable[[Any], Any] | None
+    _encoders: dict[_EncoderKey, json.JSONEncoder]
+
+    def __init__(
+        self,
+        default: Callable[[Any], Any] | _HasDefault | None = None,
+    ) -> None: ...
+    def __repr__(self) -> str: ...
+    def encoder(
+        self,
+        *,
+        indent: int | str | None = None,
+        sort_keys: bool = False,
+        separators: tuple[str, str] | None = None,
+        ensure_ascii: bool = True,
+    ) -> json.JSONEncoder: ...
+    def encode(
+        self,
+        obj: Any,
+        *,
+        indent: int | str | None = None,
+        sort_keys: bool = False,
+        separators: tuple[str, str] | None = None,
+        ensure_ascii: bool = True,
+    ) -> str: ...
+    def encode_bytes(
+        self,
+        obj: Any,
+        *,
+        indent: int | str | None = None,
+        sort_keys: bool = False,
+        separators: tuple[str, str] | None = None,
+        ensure_ascii: bool = True,
+    ) -> bytes: ...
+    def dump(
+        self,
+        obj: Any,
+        fp: Any,
+        *,
+        indent: int | str | None = None,
+        sort_keys: bool = False,
+        separators: tuple[str, str] | None = None,
+        ensure_ascii: bool = True,
+    ) -> None: ...
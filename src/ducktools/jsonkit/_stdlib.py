@@ -0,0 +1,42 @@
+def _isoformat(o):
+    return o.isoformat()
+
+
+def _enum_value(o):
+    return o.value
+
+
+# Classes are given by name so registering them does not import their modules.
+# As the first match wins subclasses must come before their base classes.
+STDLIB_SERIALIZERS = (
+    ("datetime.datetime", _isoformat),
+    ("datetime.date", _isoformat),
+    ("datetime.time", _isoformat),
+    ("uuid.UUID", str),
+    ("decimal.Decimal", str),
+    ("pathlib.PurePath", str),
+    ("enum.Enum", _enum_value),
+    (set, list),
+    (frozenset, list),
+)
+
+
+def register_stdlib(register):
+    """
+    Register serializers for common standard library types.
+
+    datetime, date and time objects are converted with `isoformat()`,
+    UUID, Decimal and paths with `str`, Enum members to their value and
+    sets and frozensets to lists.
+
+    NamedTuple instances are always serialized as lists by `json` as they
+    are tuples, so they never reach the 'default' function.
+
+    No modules are imported by registering these serializers.
+
+    :param register: JSONRegister to add the serializers to
+    :return: the register
+    """
+    for cls, func in STDLIB_SERIALIZERS:
+        register.register(cls, func)
+    return register
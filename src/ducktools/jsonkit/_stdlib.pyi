@@ -0,0 +1,14 @@
+from typing import Any, TypeVar
+
+from collections.abc import Callable
+
+from ._register import JSONRegister
+
+_RegisterT = TypeVar("_RegisterT", bound=JSONRegister)
+
+def _isoformat(o: Any) -> str: ...
+def _enum_value(o: Any) -> Any: ...
+
+STDLIB_SERIALIZERS: tuple[tuple[type | str, Callable[[Any], Any]], ...]
+
+def register_stdlib(register: _RegisterT) -> _RegisterT: ...
@@ -0,0 +1,507 @@
+from ducktools.lazyimporter import LazyImporter, ModuleImport
+from itertools import islice
+from time import perf_counter
+
+
+_laz = LazyImporter(
+    [
+        ModuleImport("asyncio"),
+        ModuleImport("codecs"),
+        ModuleImport("inspect"),
+        ModuleImport("json"),
+        ModuleImport("re"),
+    ]
+)
+
+
+BUFFER_SIZE = 1 << 16
+BATCH_SIZE = 256
+TIME_BUDGET = 0.005
+
+
+def _iter_batches(iterable, batch_size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def _write_array(iterable, encode, write, buffer_size, batch_size):
+    """
+    Write the elements of an iterable as a JSON array.
+
+    Elements are encoded `batch_size` at a time as the C encoder is much
+    faster on a list than when called for each element. Encoded text is
+    gathered into writes of at least `buffer_size` characters.
+
+    :return: number of elements written
+    """
+    count = 0
+    parts = []
+    size = 0
+    started = False
+
+    write("[")
+    for batch in _iter_batches(iterable, batch_size):
+        # '[a, b]' -> 'a, b'
+        chunk = encode(batch)[1:-1]
+        parts.append(chunk)
+        size += len(chunk)
+        count += len(batch)
+        if size >= buffer_size:
+            if started:
+                write(", ")
+            write(", ".join(parts))
+            started = True
+            parts.clear()
+            size = 0
+
+    if parts:
+        if started:
+            write(", ")
+        write(", ".join(parts))
+    write("]")
+
+    return count
+
+
+def dump_stream(
+    iterable,
+    fp,
+    *,
+    default=None,
+    buffer_size=BUFFER_SIZE,
+    batch_size=BATCH_SIZE,
+):
+    """
+    Write the elements of an iterable to a file as a JSON array, encoding
+    one element at a time so the iterable is never held in memory.
+
+    Elements are encoded in batches of `batch_size` with a single reused
+    JSONEncoder and written in chunks of at least `buffer_size` characters.
+
+    Usage Example: dump_stream(row_generator(), f, default=dataclass_default)
+
+    :param iterable: iterable of objects to serialize
+    :param fp: file-like object with a `write` method accepting str
+    :param default: 'default' function for the encoder
+    :param buffer_size: minimum number of characters to gather before writing
+    :param batch_size: number of elements to encode in one call to the encoder
+    :return: number of elements written
+    """
+    encode = _laz.json.JSONEncoder(default=default).encode
+    return _write_array(iterable, encode, fp.write, buffer_size, batch_size)
+
+
+def _iter_chunks(obj, encode, batch_size, markers):
+    """
+    Yield the JSON text for obj in pieces.
+
+    Lists and tuples are encoded `batch_size` elements at a time and the
+    values of dicts are encoded separately, recursively, so no single
+    string holds the whole output. Other objects are encoded in one piece.
+    """
+    obj_type = type(obj)
+    if obj_type is not list and obj_type is not tuple and obj_type is not dict:
+        yield encode(obj)
+        return
+
+    if id(obj) in markers:
+        raise ValueError("Circular reference detected")
+    markers.add(id(obj))
+
+    if obj_type is dict:
+        yield "{"
+        for i, (key, value) in enumerate(obj.items()):
+            # '{"key": null}' -> '"key": ' converting non-str keys as json does
+            key_text = encode({key: None})[1:-5]
+            yield f", {key_text}" if i else key_text
+            yield from _iter_chunks(value, encode, batch_size, markers)
+        yield "}"
+    else:
+        yield "["
+        for i, batch in enumerate(_iter_batches(obj, batch_size)):
+            # '[a, b]' -> 'a, b'
+            chunk = encode(batch)[1:-1]
+            yield f", {chunk}" if i else chunk
+        yield "]"
+
+    markers.discard(id(obj))
+
+
+def encode_into(
+    obj,
+    sink,
+    *,
+    default=None,
+    ensure_ascii=True,
+    buffer_size=BUFFER_SIZE,
+    batch_size=BATCH_SIZE,
+):
+    """
+    Serialize obj as UTF-8 encoded JSON directly into a bytes sink without
+    creating the full JSON str first.
+
+    The output is gathered into pieces of at least `buffer_size` characters
+    that are encoded to UTF-8 and given to the sink. The values of dicts and
+    the elements of lists, in batches of `batch_size`, are encoded separately
+    so the full output is never held in memory.
+
+    The output matches `json.dumps(obj, default=default, ensure_ascii=ensure_ascii)`.
+
+    Usage Example: encode_into(rows, response_buffer, default=dataclass_default)
+
+    :param obj: object to serialize
+    :param sink: bytearray, or an object with a `sendall` method such as a socket
+                 or a `write` method such as a binary file
+    :param default: 'default' function for the encoder
+    :param ensure_ascii: escape non-ASCII characters
+    :param buffer_size: minimum number of characters to gather before writing
+    :param batch_size: number of list elements to encode in one call to the encoder
+    :return: number of bytes written
+    """
+    if isinstance(sink, bytearray):
+        write = sink.extend
+    elif hasattr(sink, "sendall"):
+        write = sink.sendall
+    else:
+        write = sink.write
+
+    encode = _laz.json.JSONEncoder(default=default, ensure_ascii=ensure_ascii).encode
+
+    written = 0
+    parts = []
+    size = 0
+    for chunk in _iter_chunks(obj, encode, batch_size, set()):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            data = "".join(parts).encode("utf-8")
+            write(data)
+            written += len(data)
+            parts.clear()
+            size = 0
+
+    if parts:
+        data = "".join(parts).encode("utf-8")
+        write(data)
+        written += len(data)
+
+    return written
+
+
+async def encode_async(
+    obj,
+    writer,
+    *,
+    default=None,
+    ensure_ascii=True,
+    buffer_size=BUFFER_SIZE,
+    batch_size=BATCH_SIZE,
+    time_budget=TIME_BUDGET,
+):
+    """
+    Serialize obj as UTF-8 encoded JSON to an asyncio StreamWriter without
+    blocking the event loop for the whole encode.
+
+    Output is encoded in pieces as with `encode_into`. After each write
+    `drain()` is awaited so a slow reader holds back the encoder, and control
+    is returned to the event loop whenever `time_budget` seconds of encoding
+    have passed since it last had control.
+
+    The longest block is roughly `time_budget` plus the time to encode
+    one batch of `batch_size` list elements or one value that is not a list
+    or dict.
+
+    Usage Example: await encode_async(rows, writer, default=dataclass_default)
+
+    :param obj: object to serialize
+    :param writer: asyncio.StreamWriter, or any object with a `write` method
+                   accepting bytes and an awaitable `drain` method.
+                   `write` may also be awaitable.
+    :param default: 'default' function for the encoder
+    :param ensure_ascii: escape non-ASCII characters
+    :param buffer_size: minimum number of characters to gather before writing
+    :param batch_size: number of list elements to encode in one call to the encoder
+    :param time_budget: seconds of encoding after which to yield to the event loop
+    :return: number of bytes written
+    """
+    encode = _laz.json.JSONEncoder(default=default, ensure_ascii=ensure_ascii).encode
+    isawaitable = _laz.inspect.isawaitable
+    sleep = _laz.asyncio.sleep
+    drain = getattr(writer, "drain", None)
+
+    async def write(text):
+        data = text.encode("utf-8")
+        result = writer.write(data)
+        if isawaitable(result):
+            await result
+        if drain is not None:
+            await drain()
+        return len(data)
+
+    written = 0
+    parts = []
+    size = 0
+    started = perf_counter()
+    for chunk in _iter_chunks(obj, encode, batch_size, set()):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            written += await write("".join(parts))
+            parts.clear()
+            size = 0
+
+        if perf_counter() - started >= time_budget:
+            await sleep(0)
+            started = perf_counter()
+
+    if parts:
+        written += await write("".join(parts))
+
+    return written
+
+
+class JSONLinesWriter:
+    """
+    Write records to a file as JSON Lines (NDJSON) using a single
+    reused JSONEncoder.
+
+    Encoded records are held in a buffer that is written to the file in one
+    call once it reaches `max_buffer_bytes` characters or `max_buffer_records`
+    records. As the encoder escapes all non-ASCII characters the character
+    count is also the size in bytes.
+
+    Usage Example:
+    with JSONLinesWriter(f, default=register.default) as writer:
+        writer.write_many(events)
+    """
+    __slots__ = (
+        "fp",
+        "encode",
+        "max_buffer_bytes",
+        "max_buffer_records",
+        "_buffer",
+        "_buffered_bytes",
+    )
+
+    def __init__(
+        self,
+        fp,
+        *,
+        default=None,
+        max_buffer_bytes=BUFFER_SIZE,
+        max_buffer_records=None,
+    ):
+        """
+        :param fp: file-like object with a `write` method accepting str
+        :param default: 'default' function for the encoder
+        :param max_buffer_bytes: write the buffer once it holds this many bytes
+        :param max_buffer_records: write the buffer once it holds this many records
+        """
+        self.fp = fp
+        self.encode = _laz.json.JSONEncoder(default=default).encode
+        self.max_buffer_bytes = max_buffer_bytes
+        self.max_buffer_records = max_buffer_records
+        self._buffer = []
+        self._buffered_bytes = 0
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}("
+            f"fp={self.fp!r}, "
+            f"max_buffer_bytes={self.max_buffer_bytes!r}, "
+            f"max_buffer_records={self.max_buffer_records!r}"
+            f")"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+    def _write_buffer(self):
+        if self._buffer:
+            self._buffer.append("")  # Trailing newline
+            self.fp.write("\n".join(self._buffer))
+            self._buffer.clear()
+            self._buffered_bytes = 0
+
+    def write(self, record):
+        """
+        Encode a single record and add it to the buffer.
+
+        :param record: object to serialize as one line
+        """
+        line = self.encode(record)
+        self._buffer.append(line)
+        self._buffered_bytes += len(line) + 1
+
+        if (
+            self._buffered_bytes >= self.max_buffer_bytes
+            or len(self._buffer) == self.max_buffer_records
+        ):
+            self._write_buffer()
+
+    def write_many(self, records):
+        """
+        Encode an iterable of records, writing the buffer to the file
+        whenever a threshold is reached.
+
+        :param records: iterable of objects to serialize, one per line
+        :return: number of records encoded
+        """
+        encode = self.encode
+        buffer = self._buffer
+        max_bytes = self.max_buffer_bytes
+        max_records = self.max_buffer_records
+
+        count = 0
+        for record in records:
+            line = encode(record)
+            buffer.append(line)
+            self._buffered_bytes += len(line) + 1
+            count += 1
+            if self._buffered_bytes >= max_bytes or len(buffer) == max_records:
+                self._write_buffer()
+
+        return count
+
+    def flush(self):
+        """
+        Write any buffered records and flush the underlying file
+        if it supports flushing.
+        """
+        self._write_buffer()
+        try:
+            flush = self.fp.flush
+        except AttributeError:
+            pass
+        else:
+            flush()
+
+
+def _text_reader(fp):
+    """
+    Create a function reading text from a text or binary file.
+
+    Binary files are decoded as UTF-8 incrementally so characters split
+    between reads are joined.
+
+    :return: function taking a size and returning str, '' at the end of the file
+    """
+    read = fp.read
+    text_decoder = None
+
+    def read_text(size):
+        nonlocal text_decoder
+        while True:
+            data = read(size)
+            if isinstance(data, str):
+                return data
+            if text_decoder is None:
+                text_decoder = _laz.codecs.getincrementaldecoder("utf-8-sig")()
+            if not data:
+                return text_decoder.decode(b"", final=True)
+            text = text_decoder.decode(data)
+            if text:
+                return text
+            # Only part of a character was read
+
+    return read_text
+
+
+def load_stream(fp, *, object_hook=None, decoder=None, chunk_size=BUFFER_SIZE):
+    """
+    Read a file containing a JSON array, yielding each element of the array
+    as soon as it has been read instead of loading the whole array.
+
+    The file is read `chunk_size` characters (or bytes) at a time and
+    each element is parsed with `JSONDecoder.raw_decode`, so only the
+    current chunk and the current element are held in memory.
+
+    Usage Example:
+    for row in load_stream(f, decoder=dataclass_decoder(Row)):
+        ...
+
+    :param fp: text or binary (UTF-8) file-like object with a `read` method
+    :param object_hook: object_hook for the JSONDecoder
+    :param decoder: function applied to each decoded element,
+                    such as one created by `dataclass_decoder`
+    :param chunk_size: amount of data to read from the file at a time
+    :return: generator of array elements
+    """
+    json = _laz.json
+    JSONDecodeError = json.JSONDecodeError
+    raw_decode = json.JSONDecoder(object_hook=object_hook).raw_decode
+    skip_whitespace = _laz.re.compile(r"[ \t\n\r]*").match
+    skip_number = _laz.re.compile(r"[0-9eE.+-]*").match
+    skip_separator = _laz.re.compile(r"[ \t\n\r]*,[ \t\n\r]*").match
+    read_text = _text_reader(fp)
+
+    # The buffer state is passed to and returned from these helpers
+    # so the loop over elements only uses fast local variables
+    def fill(buf, pos, size):
+        # Discard the text that has been parsed and read more
+        data = read_text(size)
+        if data:
+            return buf[pos:] + data, 0, False
+        return buf, pos, True
+
+    def skip(buf, pos, eof):
+        # Skip whitespace, reading more if the end of the buffer is reached
+        while True:
+            pos = skip_whitespace(buf, pos).end()
+            if pos < len(buf) or eof:
+                return buf, pos, eof
+            buf, pos, eof = fill(buf, pos, chunk_size)
+
+    buf, pos, eof = skip("", 0, False)
+    if buf[pos:pos + 1] != "[":
+        raise JSONDecodeError("Expecting '['", buf, pos)
+    buf, pos, eof = skip(buf, pos + 1, eof)
+
+    if buf[pos:pos + 1] == "]":
+        pos += 1
+    else:
+        while True:
+            try:
+                obj, end = raw_decode(buf, pos)
+            except JSONDecodeError:
+                if eof:
+                    raise
+                # The element may continue past the end of the buffer.
+                # Doubling the unparsed text means large elements are
+                # only parsed a few times.
+                buf, pos, eof = fill(buf, pos, max(chunk_size, len(buf) - pos))
+                continue
+            if (
+                not eof
+                and type(obj) in (int, float)
+                and skip_number(buf, end).end() == len(buf)
+            ):
+                # The number may continue in the next chunk
+                buf, pos, eof = fill(buf, pos, chunk_size)
+                continue
+
+            yield obj if decoder is None else decoder(obj)
+
+            # Fast path for a separator with the next element in the buffer
+            match = skip_separator(buf, end)
+            if match is not None and match.end() < len(buf):
+                pos = match.end()
+                continue
+
+            buf, pos, eof = skip(buf, end, eof)
+            char = buf[pos:pos + 1]
+            if char == ",":
+                buf, pos, eof = skip(buf, pos + 1, eof)
+            elif char == "]":
+                pos += 1
+                break
+            else:
+                raise JSONDecodeError("Expecting ',' delimiter", buf, pos)
+
+    buf, pos, eof = skip(buf, pos, eof)
+    if pos < len(buf):
+        raise JSONDecodeError("Extra data", buf, pos)
@@ -0,0 +1,102 @@
+from ducktools.lazyimporter import LazyImporter
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Protocol, Self
+
+_laz: LazyImporter = ...
+
+BUFFER_SIZE: int = ...
+BATCH_SIZE: int = ...
+TIME_BUDGET: float = ...
+
+class _SupportsWrite(Protocol):
+    def write(self, s: str, /) -> object: ...
+
+def _iter_batches(iterable: Iterable[Any], batch_size: int) -> Iterator[list[Any]]: ...
+def _write_array(
+    iterable: Iterable[Any],
+    encode: Callable[[Any], str],
+    write: Callable[[str], object],
+    buffer_size: int,
+    batch_size: int,
+) -> int: ...
+def dump_stream(
+    iterable: Iterable[Any],
+    fp: _SupportsWrite,
+    *,
+    default: Callable[[Any], Any] | None = None,
+    buffer_size: int = BUFFER_SIZE,
+    batch_size: int = BATCH_SIZE,
+) -> int: ...
+
+class _SupportsSendall(Protocol):
+    def sendall(self, data: bytes, /) -> object: ...
+
+class _SupportsWriteBytes(Protocol):
+    def write(self, data: bytes, /) -> object: ...
+
+def _iter_chunks(
+    obj: Any,
+    encode: Callable[[Any], str],
+    batch_size: int,
+    markers: set[int],
+) -> Iterator[str]: ...
+def encode_into(
+    obj: Any,
+    sink: bytearray | _SupportsSendall | _SupportsWriteBytes,
+    *,
+    default: Callable[[Any], Any] | None = None,
+    ensure_ascii: bool = True,
+    buffer_size: int = BUFFER_SIZE,
+    batch_size: int = BATCH_SIZE,
+) -> int: ...
+
+class _AsyncWriter(Protocol):
+    def write(self, data: bytes, /) -> object: ...
+    async def drain(self) -> None: ...
+
+async def encode_async(
+    obj: Any,
+    writer: _AsyncWriter,
+    *,
+    default: Callable[[Any], Any] | None = None,
+    ensure_ascii: bool = True,
+    buffer_size: int = BUFFER_SIZE,
+    batch_size: int = BATCH_SIZE,
+    time_budget: float = TIME_BUDGET,
+) -> int: ...
+
+class JSONLinesWriter:
+    fp: _SupportsWrite
+    encode: Callable[[Any], str]
+    max_buffer_bytes: int
+    max_buffer_records: int | None
+    _buffer: list[str]
+    _buffered_bytes: int
+
+    def __init__(
+        self,
+        fp: _SupportsWrite,
+        *,
+        default: Callable[[Any], Any] | None = None,
+        max_buffer_bytes: int = BUFFER_SIZE,
+        max_buffer_records: int | None = None,
+    ) -> None: ...
+    def __enter__(self) -> Self: ...
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None: ...
+    def _write_buffer(self) -> None: ...
+    def write(self, record: Any) -> None: ...
+    def write_many(self, records: Iterable[Any]) -> int: ...
+    def flush(self) -> None: ...
+
+class _SupportsRead(Protocol):
+    def read(self, size: int, /) -> str | bytes: ...
+
+def _text_reader(fp: _SupportsRead) -> Callable[[int], str]: ...
+def load_stream(
+    fp: _SupportsRead,
+    *,
+    object_hook: Callable[[dict[str, Any]], Any] | None = None,
+    decoder: Callable[[Any], Any] | None = None,
+    chunk_size: int = BUFFER_SIZE,
+) -> Iterator[Any]: ...
@@ -0,0 +1,102 @@
+import json
+from dataclasses import dataclass, field
+
+import pytest
+
+from ducktools.jsonkit import (
+    dataclass_array_default,
+    dataclass_array_encoder,
+    dataclass_array_decoder,
+    dataclass_schema,
+)
+
+
+@dataclass
+class Member:
+    id: int
+    active: bool
+
+
+@dataclass
+class Object:
+    id: int
+    name: str
+    members: list[Member]
+    score: float | None = None
+    tags: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class KwOnly:
+    a: int
+    b: int = field(default=2, kw_only=True)
+
+
+@dataclass
+class KwFirst:
+    a: int = field(kw_only=True)
+    b: int
+    c: int = 3
+
+
+objects = [
+    Object(i, str(i), [Member(j, j % 2 == 0) for j in range(3)], i / 2, {"x": i})
+    for i in range(5)
+]
+
+
+def test_array_default():
+    assert json.dumps(Member(1, True), default=dataclass_array_default) == "[1, true]"
+    with pytest.raises(TypeError):
+        dataclass_array_default(object())
+
+
+def test_array_encoder_matches_default():
+    encode = dataclass_array_encoder(list[Object])
+    assert encode(objects) == json.dumps(objects, default=dataclass_array_default)
+    assert encode(objects[:1]) == (
+        '[[0, "0", [[0, true], [1, false], [2, true]], 0.0, {"x": 0}]]'
+    )
+
+
+def test_array_roundtrip():
+    encode = dataclass_array_encoder(list[Object])
+    decode = dataclass_array_decoder(list[Object])
+    assert decode(json.loads(encode(objects))) == objects
+
+    kw = [KwOnly(1, b=3)]
+    data = dataclass_array_encoder(list[KwOnly])(kw)
+    assert dataclass_array_decoder(list[KwOnly])(json.loads(data)) == kw
+
+    # A required keyword only field before a positional field
+    kw_first = [KwFirst(2, a=1), KwFirst(5, a=4, c=6)]
+    data = dataclass_array_encoder(list[KwFirst])(kw_first)
+    assert dataclass_array_decoder(list[KwFirst])(json.loads(data)) == kw_first
+
+
+def test_schema():
+    assert dataclass_schema(list[Object]) == {
+        "Member": ["id", "active"],
+        "Object": ["id", "name", "members", "score", "tags"],
+    }
+
+
+def test_schema_reordered():
+    # Data written by an older version of Member with the fields swapped
+    # and without the defaulted fields of Object
+    schema = {
+        "Member": ["active", "id"],
+        "Object": ["id", "name", "members"],
+    }
+    data = [[1, "one", [[True, 7]]]]
+
+    decode = dataclass_array_decoder(list[Object], schema)
+    assert decode(data) == [Object(1, "one", [Member(7, True)])]
+
+
+def test_schema_missing_field():
+    with pytest.raises(TypeError):
+        dataclass_array_decoder(Member, {"Member": ["id"]})
+
+    with pytest.raises(TypeError):
+        dataclass_array_decoder(Member, {"Other": ["id", "active"]})
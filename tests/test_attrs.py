@@ -0,0 +1,71 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from ducktools.jsonkit import attrs_default, make_attrs_default
+
+
+class _Attribute:
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeAttrs:
+    # Mimic the attributes attrs adds to a class
+    __attrs_attrs__ = (_Attribute("x"), _Attribute("y"))
+
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+
+def test_attrs_default():
+    data = [FakeAttrs(1, "a"), FakeAttrs(2, "b")]
+
+    assert json.dumps(data, default=attrs_default) == (
+        '[{"x": 1, "y": "a"}, {"x": 2, "y": "b"}]'
+    )
+    assert json.dumps(data, default=make_attrs_default(("y",))) == (
+        '[{"x": 1}, {"x": 2}]'
+    )
+
+    with pytest.raises(TypeError):
+        json.dumps(object(), default=attrs_default)
+
+
+def test_attrs_default_real_attrs():
+    attrs = pytest.importorskip("attrs")
+
+    @attrs.define
+    class Member:
+        id: int
+        active: bool
+
+    @attrs.define
+    class Object:
+        id: int
+        name: str
+        members: list[Member]
+
+    obj = Object(1, "one", [Member(i, True) for i in range(3)])
+
+    assert json.dumps(obj, default=attrs_default) == json.dumps(attrs.asdict(obj))
+
+
+def test_attrs_not_imported():
+    code = (
+        "import sys, json\n"
+        "from ducktools.jsonkit import attrs_default\n"
+        "class A:\n"
+        "    __attrs_attrs__ = ()\n"
+        "json.dumps(A(), default=attrs_default)\n"
+        "print('attrs' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,158 @@
+import io
+import json
+from dataclasses import dataclass
+from datetime import date
+from enum import Enum
+from uuid import UUID
+
+import pytest
+
+from ducktools.jsonkit import (
+    dumps,
+    dump,
+    available_backends,
+    get_backend,
+    set_backend,
+    dataclass_default,
+    merge_defaults,
+)
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+class Colour(Enum):
+    RED = 1
+
+
+def tag_default(o):
+    if type(o) is date:
+        return f"date:{o.isoformat()}"
+    if isinstance(o, UUID):
+        return {"cls": "UUID", "value": str(o)}
+    if isinstance(o, Enum):
+        return {"cls": type(o).__name__, "value": o.value}
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+default = merge_defaults(dataclass_default, tag_default)
+
+data = {
+    "b": [Point(1, 2), Point(3, 4)],
+    "a": "café",
+    "when": date(2024, 1, 2),
+    "c": None,
+}
+
+# Values orjson serializes differently from json unless strict is used
+mixed_data = {
+    **data,
+    "id": UUID(int=1),
+    "colour": Colour.RED,
+    "nan": float("nan"),
+    "big": 2**70,
+}
+
+
+def test_json_backend():
+    assert dumps(data, default=default, backend="json") == (
+        '{"b":[{"x":1,"y":2},{"x":3,"y":4}],"a":"café",'
+        '"when":"date:2024-01-02","c":null}'
+    )
+    assert dumps({1: 2}, backend="json") == '{"1":2}'
+    assert dumps([1], backend="json", as_bytes=True) == b"[1]"
+    assert dumps({"b": 1, "a": 2}, backend="json", sort_keys=True) == '{"a":2,"b":1}'
+    assert dumps({"a": [1]}, backend="json", indent=2) == (
+        '{\n  "a": [\n    1\n  ]\n}'
+    )
+
+    with pytest.raises(TypeError):
+        dumps(object(), backend="json")
+
+
+@pytest.mark.parametrize("backend", ["orjson", "rapidjson"])
+def test_backends_match_json(backend):
+    pytest.importorskip(backend)
+
+    for kwargs in [{}, {"sort_keys": True}, {"indent": 2}, {"indent": 4}]:
+        expected = dumps(data, default=default, backend="json", **kwargs)
+        assert dumps(data, default=default, backend=backend, **kwargs) == expected
+        assert dumps(
+            data, default=default, backend=backend, as_bytes=True, **kwargs
+        ) == expected.encode("utf-8")
+
+    assert dumps({1: 2}, backend=backend) == dumps({1: 2}, backend="json")
+    assert dumps(2**70, backend=backend) == str(2**70)
+
+
+@pytest.mark.parametrize("backend", ["orjson", "rapidjson"])
+def test_backends_match_json_strict(backend):
+    pytest.importorskip(backend)
+
+    for kwargs in [{}, {"sort_keys": True}, {"indent": 2}, {"indent": 4}]:
+        for value in [data, mixed_data]:
+            expected = dumps(value, default=default, backend="json", **kwargs)
+            assert dumps(
+                value, default=default, backend=backend, strict=True, **kwargs
+            ) == expected
+            assert dumps(
+                value,
+                default=default,
+                backend=backend,
+                as_bytes=True,
+                strict=True,
+                **kwargs,
+            ) == expected.encode("utf-8")
+
+    # Values returned by default are checked as well
+    def nested_default(o):
+        if isinstance(o, UUID):
+            return f"uuid:{o}"
+        return [UUID(int=2)]
+
+    assert dumps(Point(1, 2), default=nested_default, backend=backend, strict=True) == (
+        dumps(Point(1, 2), default=nested_default, backend="json")
+    )
+
+    keys = {10: 1, 2: 2, None: 3, True: 4}
+    assert dumps(keys, backend=backend, sort_keys=False, strict=True) == (
+        dumps(keys, backend="json")
+    )
+    assert dumps({10: 1, 2: 2}, backend=backend, sort_keys=True, strict=True) == (
+        '{"2":2,"10":1}'
+    )
+    assert dumps([1e20, 5e-05], backend=backend, strict=True) == "[1e+20,5e-05]"
+
+    with pytest.raises(TypeError):
+        dumps(object(), backend=backend, strict=True)
+
+
+def test_dump():
+    text, binary = io.StringIO(), io.BytesIO()
+    dump(data, text, default=default, backend="json")
+    dump(data, binary, default=default, backend="json")
+
+    assert text.getvalue() == binary.getvalue().decode("utf-8")
+    assert json.loads(text.getvalue())["b"] == [{"x": 1, "y": 2}, {"x": 3, "y": 4}]
+
+
+def test_select_backend():
+    assert available_backends()[-1] == "json"
+    assert get_backend() == available_backends()[0]
+
+    try:
+        set_backend("json")
+        assert get_backend() == "json"
+        assert dumps([1, 2]) == "[1,2]"
+    finally:
+        set_backend(None)
+
+    assert get_backend() == available_backends()[0]
+
+    with pytest.raises(ValueError):
+        set_backend("not_a_backend")
+    with pytest.raises(ValueError):
+        dumps([], backend="not_a_backend")
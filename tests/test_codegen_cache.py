@@ -0,0 +1,101 @@
+import gc
+import json
+from dataclasses import dataclass
+
+from ducktools.jsonkit import codegen_cache, dataclass_cache, dataclass_default
+
+
+def test_codegen_cache_info():
+    @codegen_cache()
+    def maker(cls, suffix=""):
+        return cls.__name__ + suffix
+
+    class A:
+        pass
+
+    assert maker(A) == "A"
+    assert maker(A) == "A"
+    assert maker(A, "_x") == "A_x"
+
+    info = maker.cache_info()
+    assert (info.hits, info.misses, info.compiles, info.currsize) == (1, 2, 0, 2)
+
+    maker.cache_clear()
+    assert maker.cache_info() == (0, 0, 0, None, 0)
+
+
+def test_codegen_cache_weak():
+    @codegen_cache()
+    def maker(cls):
+        return cls.__name__
+
+    class Temporary:
+        pass
+
+    maker(Temporary)
+    assert maker.cache_info().currsize == 1
+
+    del Temporary
+    gc.collect()
+
+    assert maker.cache_info().currsize == 0
+
+
+def test_codegen_cache_maxsize():
+    @codegen_cache(maxsize=2, weak=False)
+    def maker(key):
+        return key * 2
+
+    for i in range(4):
+        maker(i)
+
+    assert maker.cache_info().currsize == 2
+    assert list(maker._data) == [2, 3]
+
+    maker.resize(1)
+    assert list(maker._data) == [3]
+
+
+def test_dataclass_cache_compiles():
+    @dataclass
+    class Example:
+        unique_field_name_for_cache_test: int
+
+    before = dataclass_cache.cache_info()
+
+    for i in range(3):
+        json.dumps(Example(i), default=dataclass_default)
+
+    after = dataclass_cache.cache_info()
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == 2
+    assert after.compiles - before.compiles == 1
+
+
+def test_codegen_cache_front(monkeypatch):
+    from ducktools.jsonkit import _caching_tools
+
+    monkeypatch.setattr(_caching_tools, "FRONT_CACHE_SIZE", 2)
+
+    @codegen_cache()
+    def maker(cls):
+        return cls.__name__
+
+    classes = [type(f"C{i}", (), {}) for i in range(3)]
+
+    for cls in classes:
+        assert maker._front_miss(cls) == cls.__name__
+
+    # The front cache was cleared when full, so only the last class remains
+    assert list(maker._front) == [classes[2]]
+    assert maker.cache_info().currsize == 3
+
+    del cls
+    classes.pop(0)
+    gc.collect()
+
+    # Classes no longer in the front cache are not kept alive
+    assert maker.cache_info().currsize == 2
+
+    maker.cache_clear()
+    assert maker._front == {}
@@ -0,0 +1,153 @@
+import json
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pytest
+
+from ducktools.jsonkit import (
+    dataclass_default,
+    dataclass_decoder,
+    dataclass_object_hook,
+    make_dataclass_default,
+)
+
+
+@dataclass
+class Member:
+    id: int
+    active: bool
+
+
+@dataclass
+class Node:
+    name: str
+    members: list[Member] = field(default_factory=list)
+    parent: Optional["Node"] = None
+    lookup: dict[str, Member] = field(default_factory=dict)
+    points: tuple[int, ...] = ()
+
+
+def make_nodes():
+    root = Node("root", points=(1, 2))
+    return [
+        Node(
+            f"node_{i}",
+            members=[Member(j, j % 2 == 0) for j in range(3)],
+            parent=root,
+            lookup={"first": Member(0, True)},
+        )
+        for i in range(3)
+    ]
+
+
+def test_dataclass_decoder_roundtrip():
+    nodes = make_nodes()
+    data = json.dumps(nodes, default=dataclass_default)
+
+    decode = dataclass_decoder(list[Node])
+
+    assert decode(json.loads(data)) == nodes
+
+
+def test_dataclass_decoder_defaults():
+    decode = dataclass_decoder(Node)
+    assert decode({"name": "only_name"}) == Node("only_name")
+
+    with pytest.raises(KeyError):
+        decode({"members": []})
+
+
+def test_dataclass_object_hook_roundtrip():
+    nodes = make_nodes()
+    data = json.dumps(nodes, default=dataclass_default)
+
+    hook = dataclass_object_hook(list[Node])
+
+    assert json.loads(data, object_hook=hook) == nodes
+    assert json.loads('{"unknown": 1}', object_hook=hook) == {"unknown": 1}
+
+
+def test_dataclass_object_hook_partial_keys():
+    @dataclass
+    class P:
+        a: int
+        b: int = field(init=False, default=0)
+        c: Optional[str] = None
+
+    hook = dataclass_object_hook(list[P])
+
+    # init=False fields are written by dataclass_default and ignored
+    data = json.dumps([P(1), P(2, "x")], default=dataclass_default)
+    assert json.loads(data, object_hook=hook) == [P(1), P(2, "x")]
+
+    # Defaulted fields may be left out
+    for default in [
+        make_dataclass_default(omit_none=True),
+        make_dataclass_default(omit_defaults=True),
+    ]:
+        data = json.dumps([P(1), P(2, "x")], default=default)
+        assert json.loads(data, object_hook=hook) == [P(1), P(2, "x")]
+
+    # Required fields are needed and unknown keys are not matched
+    assert json.loads('{"c": "x"}', object_hook=hook) == {"c": "x"}
+    assert json.loads('{"a": 1, "d": 2}', object_hook=hook) == {"a": 1, "d": 2}
+
+    # Empty dictionaries are left alone
+    assert json.loads("{}", object_hook=dataclass_object_hook(Node)) == {}
+
+
+def test_dataclass_object_hook_ambiguous():
+    @dataclass
+    class A:
+        x: int
+
+    @dataclass
+    class B:
+        x: int
+
+    @dataclass
+    class C:
+        a: A
+        b: B
+
+    with pytest.raises(TypeError):
+        dataclass_object_hook(C)
+
+    # {"x": 1} would match either class
+    @dataclass
+    class D:
+        x: int
+        y: int = 0
+
+    @dataclass
+    class E:
+        x: int
+        z: int = 0
+
+    @dataclass
+    class F:
+        d: D
+        e: E
+
+    with pytest.raises(TypeError):
+        dataclass_object_hook(F)
+
+
+def test_dataclass_decoder_kw_only():
+    @dataclass(kw_only=True)
+    class KW:
+        x: int
+        y: int = 2
+
+    assert dataclass_decoder(KW)({"x": 1}) == KW(x=1)
+
+    # A required keyword only field before a positional field
+    @dataclass
+    class Mixed:
+        a: int = field(kw_only=True)
+        b: int
+        c: int = 3
+
+    decode = dataclass_decoder(Mixed)
+    assert decode({"a": 1, "b": 2}) == Mixed(2, a=1)
+    assert decode({"a": 1, "b": 2, "c": 4}) == Mixed(2, a=1, c=4)
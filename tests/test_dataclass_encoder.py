@@ -0,0 +1,73 @@
+import json
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Optional
+
+from ducktools.jsonkit import dataclass_default, dataclass_encoder
+
+
+@dataclass
+class Member:
+    id: int
+    active: bool
+
+
+@dataclass
+class Node:
+    name: str
+    weight: float = 1.0
+    members: list[Member] = field(default_factory=list)
+    parent: Optional["Node"] = None
+    tags: dict[str, int] = field(default_factory=dict)
+    extra: object = None
+
+
+def test_dataclass_encoder_matches_dumps():
+    root = Node("rooté")
+    nodes = [
+        Node(
+            f"node_{i}",
+            weight=i / 3,
+            members=[Member(j, j % 2 == 0) for j in range(3)],
+            parent=root,
+            tags={"i": i},
+            extra={1: [i]},
+        )
+        for i in range(5)
+    ]
+
+    encode = dataclass_encoder(list[Node])
+
+    assert encode(nodes) == json.dumps(nodes, default=dataclass_default)
+    assert dataclass_encoder(Node)(root) == json.dumps(root, default=dataclass_default)
+
+
+def test_dataclass_encoder_fallback():
+    # Values that do not match their annotations go through `default`
+    node = Node(
+        "node",
+        weight=float("inf"),
+        members=(Member(True, 1),),  # type: ignore
+        extra=Decimal("1.5"),
+    )
+
+    def decimal_default(o):
+        if isinstance(o, Decimal):
+            return str(o)
+        return dataclass_default(o)
+
+    encode = dataclass_encoder(Node, decimal_default)
+
+    assert encode(node) == json.dumps(node, default=decimal_default)
+
+
+def test_dataclass_encoder_non_str_keys():
+    # json converts int, float, bool and None keys to strings
+    node = Node("node", tags={1: 1, 1.5: 2, None: 3, False: 4, "s": 5})  # type: ignore
+
+    encode = dataclass_encoder(Node)
+
+    assert encode(node) == json.dumps(node, default=dataclass_default)
+    assert json.loads(encode(node))["tags"] == {
+        "1": 1, "1.5": 2, "null": 3, "false": 4, "s": 5
+    }
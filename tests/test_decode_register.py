@@ -0,0 +1,66 @@
+import json
+from decimal import Decimal
+from fractions import Fraction
+
+from ducktools.jsonkit import JSONDecodeRegister, JSONRegister
+
+
+def test_decode_register():
+    register = JSONDecodeRegister()
+    register.register("Decimal", lambda d: Decimal(d["value"]))
+
+    @register.register_function("Fraction")
+    def structure_fraction(d):
+        return Fraction(d["numerator"], d["denominator"])
+
+    data = (
+        '{"price": {"cls": "Decimal", "value": "0.001"}, '
+        '"ratio": {"cls": "Fraction", "numerator": 1, "denominator": 3}, '
+        '"plain": {"a": 1}, '
+        '"unknown": {"cls": "Unknown"}, '
+        '"unhashable": {"cls": [1, 2]}}'
+    )
+
+    expected = {
+        "price": Decimal("0.001"),
+        "ratio": Fraction(1, 3),
+        "plain": {"a": 1},
+        "unknown": {"cls": "Unknown"},
+        "unhashable": {"cls": [1, 2]},
+    }
+
+    assert json.loads(data, object_hook=register.object_hook) == expected
+    assert json.loads(data, object_hook=register.freeze()) == expected
+
+
+def test_decode_register_key():
+    register = JSONDecodeRegister(key="$type")
+    register.register("Decimal", lambda d: Decimal(d["value"]))
+
+    assert json.loads(
+        '[{"$type": "Decimal", "value": "1.5"}, {"cls": "Decimal", "value": "1.5"}]',
+        object_hook=register.object_hook,
+    ) == [Decimal("1.5"), {"cls": "Decimal", "value": "1.5"}]
+
+
+def test_decode_register_freeze():
+    register = JSONDecodeRegister()
+    frozen = register.freeze()
+    register.register("Decimal", lambda d: Decimal(d["value"]))
+
+    # Registrations after freezing are not seen by the frozen hook
+    data = '{"cls": "Decimal", "value": "2"}'
+    assert json.loads(data, object_hook=frozen) == {"cls": "Decimal", "value": "2"}
+    assert json.loads(data, object_hook=register.freeze()) == Decimal("2")
+
+
+def test_round_trip():
+    encoder = JSONRegister()
+    decoder = JSONDecodeRegister()
+
+    encoder.register(Decimal, lambda o: {"cls": "Decimal", "value": str(o)})
+    decoder.register("Decimal", lambda d: Decimal(d["value"]))
+
+    data = {"prices": [Decimal("0.1"), Decimal("2.50")]}
+    text = json.dumps(data, default=encoder.default)
+    assert json.loads(text, object_hook=decoder.object_hook) == data
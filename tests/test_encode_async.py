@@ -0,0 +1,90 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from time import perf_counter
+
+from ducktools.jsonkit import dataclass_default, encode_async
+
+
+@dataclass
+class Row:
+    id: int
+    name: str
+    score: float
+
+
+class Writer:
+    """Collects written data and counts calls to drain"""
+    def __init__(self, drain_delay=0.0):
+        self.data = bytearray()
+        self.writes = 0
+        self.drains = 0
+        self.drain_delay = drain_delay
+
+    def write(self, data):
+        self.data.extend(data)
+        self.writes += 1
+
+    async def drain(self):
+        self.drains += 1
+        await asyncio.sleep(self.drain_delay)
+
+
+class AwaitableWriter(Writer):
+    async def write(self, data):
+        super().write(data)
+
+
+def test_encode_async_output():
+    data = {"rows": [Row(i, f"row_{i}", i / 3) for i in range(1000)], "count": 1000}
+    expected = json.dumps(data, default=dataclass_default).encode("utf-8")
+
+    for writer in [Writer(), AwaitableWriter()]:
+        written = asyncio.run(
+            encode_async(data, writer, default=dataclass_default, buffer_size=1000)
+        )
+        assert writer.data == expected
+        assert written == len(expected)
+        # Backpressure is checked after every write
+        assert writer.writes > 1
+        assert writer.drains == writer.writes
+
+
+def test_encode_async_max_blocking():
+    rows = [Row(i, f"row_{i}", i / 3) for i in range(200_000)]
+
+    async def main():
+        gaps = []
+        done = False
+
+        async def ticker():
+            last = perf_counter()
+            while not done:
+                await asyncio.sleep(0)
+                now = perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+
+        start = perf_counter()
+        await encode_async(
+            rows,
+            Writer(),
+            default=dataclass_default,
+            time_budget=0.005,
+        )
+        total = perf_counter() - start
+
+        done = True
+        await task
+        return total, max(gaps), len(gaps)
+
+    total, max_gap, ticks = asyncio.run(main())
+
+    # The loop regularly got control while encoding
+    # and was never blocked for a large part of the encode
+    assert ticks > 10
+    assert max_gap < 0.05
+    assert max_gap < total / 4
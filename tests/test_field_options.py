@@ -0,0 +1,114 @@
+import json
+from dataclasses import dataclass, field
+
+import pytest
+
+from ducktools.jsonkit import (
+    dataclass_default,
+    field_default,
+    make_dataclass_default,
+    precompile,
+)
+from ducktools.jsonkit._caching_tools import _dc_defaultmaker
+
+
+class Example:
+    def __init__(self, a, b, c):
+        self.a, self.b, self.c = a, b, c
+
+
+@dataclass
+class Options:
+    id: int
+    name: str | None = None
+    count: int = 0
+    tags: list[str] = field(default_factory=list)
+    note: str | None = "note"
+
+
+def test_field_default_omit_none():
+    default = field_default(("a", "b", "c"), omit_none=True)
+    assert default(Example(1, None, 3)) == {"a": 1, "c": 3}
+    assert default(Example(None, None, None)) == {}
+    assert list(default(Example(1, 2, 3))) == ["a", "b", "c"]
+
+
+def test_field_default_defaults_and_rename():
+    default = field_default(
+        ("a", "b", "c"),
+        defaults=(("b", 0), ("c", None)),
+        rename=(("a", "A"), ("c", "see")),
+    )
+    assert default(Example(1, 0, None)) == {"A": 1}
+    # None is only left out where it is the default
+    assert default(Example(None, 2, 3)) == {"A": None, "b": 2, "see": 3}
+    assert list(default(Example(1, 2, 3))) == ["A", "b", "see"]
+
+    # Keyword arguments are cached
+    assert default is field_default(
+        ("a", "b", "c"),
+        defaults=(("b", 0), ("c", None)),
+        rename=(("a", "A"), ("c", "see")),
+    )
+
+
+def test_make_dataclass_default_omit_none():
+    default = make_dataclass_default(omit_none=True)
+    assert json.dumps(Options(1), default=default) == (
+        '{"id": 1, "count": 0, "tags": [], "note": "note"}'
+    )
+
+
+def test_make_dataclass_default_omit_defaults():
+    default = make_dataclass_default(omit_defaults=True)
+    assert json.dumps(Options(1), default=default) == '{"id": 1}'
+    assert json.dumps(Options(1, "x", 2, ["a"], None), default=default) == (
+        '{"id": 1, "name": "x", "count": 2, "tags": ["a"], "note": null}'
+    )
+
+
+def test_omit_defaults_checks_type():
+    @dataclass
+    class Flags:
+        level: int = 1
+        enabled: bool = False
+
+    default = make_dataclass_default(omit_defaults=True)
+    assert json.dumps(Flags(), default=default) == "{}"
+    # Equal values of a different type are kept
+    assert json.dumps(Flags(True, 0.0), default=default) == (
+        '{"level": true, "enabled": 0.0}'
+    )
+
+
+def test_make_dataclass_default_rename_exclude():
+    default = make_dataclass_default(
+        ("tags",),
+        omit_none=True,
+        rename={"id": "ID", "count": "n"},
+    )
+    assert json.dumps(Options(1, note=None), default=default) == (
+        '{"ID": 1, "n": 0}'
+    )
+
+
+def test_make_dataclass_default_no_options():
+    assert make_dataclass_default() is dataclass_default
+
+
+def test_precompile_options():
+    precompile([Options], omit_none=True, omit_defaults=True)
+
+    before = _dc_defaultmaker.cache_info()
+    default = make_dataclass_default(omit_none=True, omit_defaults=True)
+    assert default(Options(2)) == {"id": 2}
+    assert _dc_defaultmaker.cache_info().hits == before.hits + 1
+
+    class Slotted:
+        __slots__ = ("a",)
+
+    with pytest.raises(TypeError):
+        precompile([Slotted], omit_none=True)
+
+    # exclude_fields alone is supported for other classes
+    precompile([Slotted], ("a",))
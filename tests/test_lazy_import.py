@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+
+def run_python(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_register_imported_lazily():
+    code = (
+        "import sys, json\n"
+        "from ducktools.jsonkit import dataclass_default\n"
+        "print('ducktools.classbuilder' in sys.modules)\n"
+        "from ducktools.jsonkit import JSONRegister\n"
+        "print('ducktools.classbuilder' in sys.modules)\n"
+    )
+    assert run_python(code).split() == ["False", "True"]
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from ducktools.jsonkit import merge_defaults
 
+import pytest
+
 
 def test_metadefault():
     def path_default(pth):
@@ -29,3 +31,58 @@ def test_metadefault():
     )
 
     assert json.dumps(data, default=new_default) == result
+
+
+def test_metadefault_remembers_type():
+    calls = []
+
+    def path_default(pth):
+        calls.append("path")
+        if isinstance(pth, Path):
+            return str(pth)
+        raise TypeError()
+
+    def set_default(s):
+        calls.append("set")
+        if isinstance(s, set):
+            return sorted(s)
+        raise TypeError()
+
+    new_default = merge_defaults(path_default, set_default)
+
+    assert new_default({"b", "a"}) == ["a", "b"]
+    assert calls == ["path", "set"]
+
+    calls.clear()
+    assert new_default({"c"}) == ["c"]
+    assert calls == ["set"]
+
+    calls.clear()
+    with pytest.raises(TypeError):
+        new_default(object())
+    assert calls == ["path", "set"]
+
+
+def test_merge_defaults_bounded(monkeypatch):
+    import gc
+    import weakref
+    import ducktools.jsonkit
+
+    monkeypatch.setattr(ducktools.jsonkit, "RESOLVED_CACHE_SIZE", 2)
+
+    def name_default(o):
+        return type(o).__name__
+
+    default = merge_defaults(name_default)
+
+    temporary = type("Temporary", (), {})
+    assert default(temporary()) == "Temporary"
+    temporary_ref = weakref.ref(temporary)
+    del temporary
+
+    for i in range(3):
+        cls = type(f"C{i}", (), {})
+        assert default(cls()) == f"C{i}"
+
+    gc.collect()
+    assert temporary_ref() is None
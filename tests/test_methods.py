@@ -1,6 +1,8 @@
 import json
 from ducktools.jsonkit import method_default
 
+import pytest
+
 
 def test_methods_asdict():
     class Example:
@@ -15,3 +17,61 @@ def test_methods_asdict():
     output = '{"x": "hello", "y": "world"}'
 
     assert data == output
+
+
+def test_methods_resolution():
+    class Base:
+        def __init__(self, x):
+            self.x = x
+
+        def asdict(self):
+            return {'x': self.x}
+
+    class Child(Base):
+        pass
+
+    class Dynamic:
+        def __getattr__(self, name):
+            if name == 'asdict':
+                return lambda: {'dynamic': True}
+            raise AttributeError(name)
+
+    class Static:
+        @staticmethod
+        def asdict():
+            return {'static': True}
+
+    default = method_default('asdict')
+
+    assert default(Child(1)) == {'x': 1}
+    assert default(Dynamic()) == {'dynamic': True}
+    assert default(Static()) == {'static': True}
+
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            default(object())
+
+
+def test_methods_missing_cached():
+    class Plain:
+        pass
+
+    default = method_default('asdict')
+
+    plain = Plain()
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            default(plain)
+
+    # Classes without the method are not looked at again
+    other = Plain()
+    other.asdict = lambda: {'instance': True}
+    with pytest.raises(TypeError):
+        default(other)
+
+    Plain.asdict = lambda self: {'class': True}
+    with pytest.raises(TypeError):
+        default(plain)
+
+    # A new default looks the method up again
+    assert method_default('asdict')(plain) == {'class': True}
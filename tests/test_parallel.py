@@ -0,0 +1,35 @@
+import json
+from dataclasses import dataclass
+
+from ducktools.jsonkit import dataclass_default, parallel_dumps, threaded_dumps
+from ducktools.jsonkit import _parallel
+
+
+@dataclass
+class Row:
+    id: int
+    name: str
+
+
+def test_parallel_dumps():
+    rows = [Row(i, f"row_{i}") for i in range(105)]
+    expected = json.dumps(rows, default=dataclass_default)
+
+    result = parallel_dumps(rows, default=dataclass_default, workers=2, chunk_size=10)
+    assert result == expected
+
+    # Serial path
+    assert parallel_dumps(rows, default=dataclass_default, workers=1) == expected
+    assert parallel_dumps([], default=dataclass_default, workers=2) == "[]"
+
+
+def test_threaded_dumps(monkeypatch):
+    rows = [Row(i, f"row_{i}") for i in range(105)]
+    expected = json.dumps(rows, default=dataclass_default)
+
+    assert threaded_dumps(rows, default=dataclass_default, workers=2, chunk_size=10) == expected
+
+    # Exercise the threaded path regardless of the build
+    monkeypatch.setattr(_parallel, "_gil_enabled", lambda: False)
+    assert threaded_dumps(rows, default=dataclass_default, workers=2, chunk_size=10) == expected
+    assert threaded_dumps([], default=dataclass_default, workers=2) == "[]"
@@ -0,0 +1,86 @@
+import os
+from dataclasses import dataclass
+
+import pytest
+
+from ducktools.jsonkit import (
+    dataclass_cache,
+    field_default,
+    precompile,
+    set_code_cache_dir,
+)
+from ducktools.jsonkit import _caching_tools
+
+
+def test_precompile():
+    @dataclass
+    class Example:
+        precompile_example_a: int
+        precompile_example_b: str
+
+    precompile([Example])
+
+    before = dataclass_cache.cache_info()
+    assert dataclass_cache(Example)(Example(1, "a")) == {
+        "precompile_example_a": 1,
+        "precompile_example_b": "a",
+    }
+    assert dataclass_cache.cache_info().hits == before.hits + 1
+
+    with pytest.raises(TypeError):
+        precompile([int])
+
+
+def test_code_cache_dir(tmp_path):
+    fieldnames = ("code_cache_example_a", "code_cache_example_b")
+
+    set_code_cache_dir(tmp_path)
+    try:
+        start_count = _caching_tools._compile_count
+        first = field_default(fieldnames)
+        assert _caching_tools._compile_count == start_count + 1
+        assert len(list(tmp_path.glob("*.bin"))) == 1
+
+        # Simulate a new process by clearing the in memory cache
+        field_default.cache_clear()
+        second = field_default(fieldnames)
+        assert _caching_tools._compile_count == start_count + 1
+        assert first is not second
+    finally:
+        set_code_cache_dir(None)
+
+    class Example:
+        code_cache_example_a = 1
+        code_cache_example_b = 2
+
+    assert second(Example()) == first(Example())
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+def test_code_cache_dir_permissions(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+
+    with pytest.raises(PermissionError):
+        set_code_cache_dir(shared)
+
+    private = tmp_path / "private"
+    fieldnames = ("code_cache_perms_a", "code_cache_perms_b")
+
+    set_code_cache_dir(private)
+    try:
+        assert private.stat().st_mode & 0o777 == 0o700
+
+        field_default(fieldnames)
+        [entry] = private.glob("*.bin")
+        assert entry.stat().st_mode & 0o777 == 0o600
+
+        # An entry others could have written is compiled again instead of loaded
+        entry.chmod(0o666)
+        field_default.cache_clear()
+        start_count = _caching_tools._compile_count
+        field_default(fieldnames)
+        assert _caching_tools._compile_count == start_count + 1
+    finally:
+        set_code_cache_dir(None)
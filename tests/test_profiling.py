@@ -0,0 +1,54 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from ducktools.jsonkit import (
+    JSONRegister,
+    ProfiledDefault,
+    dataclass_default,
+    merge_defaults,
+    profile_default,
+)
+
+
+@dataclass
+class Member:
+    id: int
+
+
+def test_profile_default_disabled():
+    assert profile_default(dataclass_default, enabled=False) is dataclass_default
+
+
+def test_profile_default_counts():
+    register = JSONRegister()
+    register.register(Path, str)
+
+    default = profile_default(merge_defaults(register.default, dataclass_default))
+    assert isinstance(default, ProfiledDefault)
+
+    data = [Member(1), Member(2), Path("usr/bin")]
+    assert json.dumps(data, default=default) == json.dumps(
+        data, default=merge_defaults(register.default, dataclass_default)
+    )
+
+    with pytest.raises(TypeError):
+        json.dumps(object(), default=default)
+
+    stats = default.stats()
+    member_stats = stats[f"{Member.__module__}.{Member.__qualname__}"]
+    assert member_stats["calls"] == 2
+    assert member_stats["misses"] == 0
+    assert stats["builtins.object"] == {
+        "calls": 1,
+        "time": stats["builtins.object"]["time"],
+        "misses": 1,
+    }
+
+    table = default.table()
+    assert "builtins.object" in table
+
+    default.reset()
+    assert default.stats() == {}
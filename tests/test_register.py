@@ -5,6 +5,8 @@ import dataclasses
 from pathlib import Path
 from decimal import Decimal
 
+import pytest
+
 
 def test_json_register():
     register = JSONRegister()
@@ -49,3 +51,210 @@ def test_json_register():
     )
 
     assert json.dumps(demo, default=register.default) == output
+
+
+def test_register_subclass_and_cache():
+    register = JSONRegister()
+
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    register.register(Base, lambda o: "base")
+
+    assert json.dumps(Child(), default=register.default) == '"base"'
+    assert register._dispatch_cache[Child] is register.registry[0][1]
+
+    # New registrations invalidate earlier resolutions
+    register.register(Child, lambda o: "child")
+    assert not register._dispatch_cache
+
+    # The first registered match still wins
+    assert json.dumps(Child(), default=register.default) == '"base"'
+
+
+def test_register_unknown_type():
+    register = JSONRegister()
+    register.register(Path, str)
+
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            json.dumps(object(), default=register.default)
+
+    assert register._dispatch_cache[object] is None
+
+
+def test_register_freeze():
+    register = JSONRegister()
+    register.register(Path, str)
+
+    frozen = register.freeze()
+    register.register(Decimal, str)
+
+    pth = Path("usr/bin/python")
+    assert frozen(pth) == str(pth)
+
+    with pytest.raises(TypeError):
+        frozen(Decimal("1.0"))
+
+    assert register.default(Decimal("1.0")) == "1.0"
+
+
+def test_register_by_name():
+    register = JSONRegister()
+    register.register("decimal.Decimal", str)
+    register.register("not_a_module.Missing", str)
+
+    assert register.default(Decimal("1.5")) == "1.5"
+    with pytest.raises(TypeError):
+        register.default(object())
+
+    frozen = register.freeze()
+    assert frozen(Decimal("2.5")) == "2.5"
+
+
+class Outer:
+    class Inner:
+        pass
+
+
+def test_register_nested_by_name():
+    register = JSONRegister()
+    register.register(f"{Outer.__module__}.Outer.Inner", lambda o: "inner")
+
+    assert register.default(Outer.Inner()) == "inner"
+    assert register.freeze()(Outer.Inner()) == "inner"
+
+    with pytest.raises(ValueError):
+        register.register("Decimal", str)
+
+
+def test_register_by_name_not_a_class():
+    import datetime
+    import json.decoder
+
+    register = JSONRegister()
+    register.register("datetime.timezone.utc", str)
+    register.register("json.decoder", str)
+    register.register("json.dumps", str)
+    register.register("decimal.Decimal", str)
+
+    # Names that are not classes are skipped
+    assert register.default(Decimal("1.5")) == "1.5"
+    assert register.freeze()(Decimal("2.5")) == "2.5"
+    with pytest.raises(TypeError):
+        register.default(datetime.timezone.utc)
+
+
+def test_register_stdlib():
+    import datetime
+    import enum
+    import typing
+    import uuid
+
+    from ducktools.jsonkit import register_stdlib
+
+    class Colour(enum.Enum):
+        RED = "red"
+
+    class Pair(typing.NamedTuple):
+        a: int
+        b: int
+
+    register = register_stdlib(JSONRegister())
+
+    ident = uuid.UUID(int=1)
+    data = [
+        datetime.datetime(2024, 1, 2, 3, 4, 5),
+        datetime.date(2024, 1, 2),
+        datetime.time(3, 4, 5),
+        ident,
+        Decimal("0.1"),
+        Path("usr/bin"),
+        Colour.RED,
+        {1},
+        frozenset([2]),
+        Pair(1, 2),
+    ]
+
+    assert json.loads(json.dumps(data, default=register.default)) == [
+        "2024-01-02T03:04:05",
+        "2024-01-02",
+        "03:04:05",
+        str(ident),
+        "0.1",
+        str(Path("usr/bin")),
+        "red",
+        [1],
+        [2],
+        [1, 2],
+    ]
+
+
+def test_register_stdlib_no_imports():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, json\n"
+        "from ducktools.jsonkit import JSONRegister, register_stdlib\n"
+        "register = register_stdlib(JSONRegister())\n"
+        "json.dumps({1, 2}, default=register.default)\n"
+        "print([m for m in ('decimal', 'uuid', 'pathlib') if m in sys.modules])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_register_cache_invalidation():
+    import abc
+
+    class Marker(abc.ABC):
+        pass
+
+    class Later:
+        pass
+
+    register = JSONRegister()
+    register.register(Marker, lambda o: "marker")
+    frozen = register.freeze()
+
+    for default in [register.default, frozen]:
+        with pytest.raises(TypeError):
+            default(Later())
+
+    # Registering with the ABC is seen even though None was cached
+    Marker.register(Later)
+    assert register.default(Later()) == "marker"
+    assert frozen(Later()) == "marker"
+
+    # Direct changes to the registry need the cache to be cleared
+    with pytest.raises(TypeError):
+        register.default(1)
+    register.registry.append((int, str))
+    with pytest.raises(TypeError):
+        register.default(1)
+    register.cache_clear()
+    assert register.default(1) == "1"
+
+
+def test_register_cache_bounded(monkeypatch):
+    from ducktools.jsonkit import _register
+
+    monkeypatch.setattr(_register, "DISPATCH_CACHE_SIZE", 2)
+
+    register = JSONRegister()
+    register.register(object, lambda o: type(o).__name__)
+
+    classes = [type(f"C{i}", (), {}) for i in range(5)]
+    for cls in classes:
+        assert register.default(cls()) == cls.__name__
+
+    assert len(register._dispatch_cache) <= 2
@@ -0,0 +1,60 @@
+import io
+import json
+from dataclasses import dataclass
+from decimal import Decimal
+
+from ducktools.jsonkit import JSONRegister, Serializer, dataclass_default
+
+
+@dataclass
+class Point:
+    x: int
+    y: str
+
+
+def test_serializer_encode():
+    serializer = Serializer(dataclass_default)
+    data = [Point(1, "é"), Point(2, "b")]
+
+    assert serializer.encode(data) == json.dumps(data, default=dataclass_default)
+    assert serializer.encode(data, indent=2, sort_keys=True) == json.dumps(
+        data, default=dataclass_default, indent=2, sort_keys=True
+    )
+    assert serializer.encode_bytes(data, ensure_ascii=False) == json.dumps(
+        data, default=dataclass_default, ensure_ascii=False
+    ).encode("utf-8")
+    assert serializer.encode(data, separators=(",", ":")) == (
+        '[{"x":1,"y":"\\u00e9"},{"x":2,"y":"b"}]'
+    )
+
+
+def test_serializer_caches_encoders():
+    serializer = Serializer(dataclass_default)
+
+    encoder = serializer.encoder()
+    assert serializer.encoder() is encoder
+    assert serializer.encoder(indent=2) is not encoder
+
+    serializer.encode([1])
+    serializer.encode([1], indent=2)
+    assert len(serializer._encoders) == 2
+
+
+def test_serializer_register():
+    register = JSONRegister()
+    register.register(Decimal, str)
+
+    serializer = Serializer(register)
+    assert serializer.default == register.default
+    assert serializer.encode([Decimal("1.5")]) == '["1.5"]'
+
+
+def test_serializer_dump():
+    serializer = Serializer(dataclass_default)
+    text, binary = io.StringIO(), io.BytesIO()
+
+    serializer.dump(Point(1, "a"), text)
+    serializer.dump(Point(1, "a"), binary)
+
+    assert text.getvalue() == '{"x": 1, "y": "a"}'
+    assert binary.getvalue() == b'{"x": 1, "y": "a"}'
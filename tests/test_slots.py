@@ -0,0 +1,120 @@
+import json
+
+import pytest
+
+from ducktools.classbuilder import slotclass, SlotFields
+
+from ducktools.jsonkit import (
+    slots_default,
+    make_slots_default,
+    classbuilder_default,
+    make_classbuilder_default,
+    precompile,
+)
+from ducktools.jsonkit._caching_tools import _slots_defaultmaker
+
+
+class Base:
+    __slots__ = ("x",)
+
+    def __init__(self, x):
+        self.x = x
+
+
+class Child(Base):
+    __slots__ = ["y", "__weakref__"]
+
+    def __init__(self, x, y):
+        super().__init__(x)
+        self.y = y
+
+
+class Single:
+    __slots__ = "value"
+
+    def __init__(self, value):
+        self.value = value
+
+
+class Private:
+    __slots__ = ("__secret", "public")
+
+    def __init__(self, secret, public):
+        self.__secret = secret
+        self.public = public
+
+
+class Consumed:
+    __slots__ = iter(["a", "b"])
+
+    def __init__(self, a, b):
+        self.a, self.b = a, b
+
+
+@slotclass
+class Point:
+    __slots__ = SlotFields(x=0, y=0)
+
+
+@slotclass
+class Point3D(Point):
+    __slots__ = SlotFields(z=0)
+
+
+def test_slots_default():
+    data = [Base(1), Child(2, 3), Single("v")]
+
+    assert json.dumps(data, default=slots_default) == (
+        '[{"x": 1}, {"x": 2, "y": 3}, {"value": "v"}]'
+    )
+    assert json.dumps(Child(1, 2), default=make_slots_default(("x",))) == (
+        '{"y": 2}'
+    )
+
+
+def test_slots_default_mangled():
+    assert slots_default(Private(1, 2)) == {"_Private__secret": 1, "public": 2}
+
+
+def test_slots_default_consumed_iterator():
+    assert slots_default(Consumed(1, 2)) == {"a": 1, "b": 2}
+
+
+def test_slots_default_slotfields():
+    assert slots_default(Point3D(1, 2, 3)) == {"x": 1, "y": 2, "z": 3}
+
+
+def test_slots_default_unslotted():
+    class Plain:
+        pass
+
+    with pytest.raises(TypeError):
+        slots_default(Plain())
+
+    with pytest.raises(TypeError):
+        json.dumps(object(), default=slots_default)
+
+
+def test_classbuilder_default():
+    data = [Point(1, 2), Point3D(1, 2, 3)]
+
+    assert json.dumps(data, default=classbuilder_default) == (
+        '[{"x": 1, "y": 2}, {"x": 1, "y": 2, "z": 3}]'
+    )
+    assert json.dumps(Point3D(), default=make_classbuilder_default(("z",))) == (
+        '{"x": 0, "y": 0}'
+    )
+
+    with pytest.raises(TypeError):
+        classbuilder_default(Base(1))
+
+
+def test_precompile_slots():
+    class Precompiled:
+        __slots__ = ("a",)
+
+    precompile([Precompiled])
+
+    before = _slots_defaultmaker.cache_info()
+    _slots_defaultmaker(Precompiled)
+    assert _slots_defaultmaker.cache_info().hits == before.hits + 1
@@ -0,0 +1,198 @@
+import io
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from ducktools.jsonkit import (
+    dataclass_decoder,
+    dataclass_default,
+    dump_stream,
+    load_stream,
+    encode_into,
+    JSONLinesWriter,
+)
+
+
+@dataclass
+class Row:
+    id: int
+    name: str
+
+
+def make_rows(count):
+    for i in range(count):
+        yield Row(i, f"row_{i}")
+
+
+def test_dump_stream():
+    expected = json.dumps(list(make_rows(100)), default=dataclass_default)
+
+    for buffer_size, batch_size in [(1, 1), (50, 7), (1 << 16, 256)]:
+        fp = io.StringIO()
+        count = dump_stream(
+            make_rows(100),
+            fp,
+            default=dataclass_default,
+            buffer_size=buffer_size,
+            batch_size=batch_size,
+        )
+
+        assert count == 100
+        assert fp.getvalue() == expected
+
+
+def test_dump_stream_empty():
+    fp = io.StringIO()
+    assert dump_stream(iter([]), fp) == 0
+    assert fp.getvalue() == "[]"
+
+
+class CountingWriter(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+def test_json_lines_writer():
+    rows = list(make_rows(10))
+    expected = "".join(
+        json.dumps(row, default=dataclass_default) + "\n" for row in rows
+    )
+
+    fp = CountingWriter()
+    with JSONLinesWriter(fp, default=dataclass_default) as writer:
+        assert writer.write_many(rows) == 10
+        assert fp.writes == 0
+
+    assert fp.writes == 1
+    assert fp.getvalue() == expected
+
+
+def test_json_lines_writer_thresholds():
+    rows = list(make_rows(10))
+
+    fp = CountingWriter()
+    writer = JSONLinesWriter(fp, default=dataclass_default, max_buffer_records=3)
+    for row in rows:
+        writer.write(row)
+    assert fp.writes == 3
+    writer.flush()
+    assert fp.writes == 4
+
+    fp = CountingWriter()
+    writer = JSONLinesWriter(fp, default=dataclass_default, max_buffer_bytes=1)
+    writer.write_many(rows)
+    assert fp.writes == 10
+
+
+def test_encode_into():
+    data = {
+        "rows": list(make_rows(100)),
+        "meta": {"count": 100, 1: "é", "empty": [], "nested": {"a": (1, 2)}},
+        "none": None,
+    }
+    expected = json.dumps(data, default=dataclass_default).encode("utf-8")
+
+    for buffer_size, batch_size in [(1, 1), (50, 7), (1 << 16, 256)]:
+        buffer = bytearray()
+        written = encode_into(
+            data,
+            buffer,
+            default=dataclass_default,
+            buffer_size=buffer_size,
+            batch_size=batch_size,
+        )
+        assert buffer == expected
+        assert written == len(expected)
+
+
+def test_encode_into_sinks():
+    rows = list(make_rows(10))
+    expected = json.dumps(rows, default=dataclass_default, ensure_ascii=False)
+    expected = expected.encode("utf-8")
+
+    class Socket:
+        def __init__(self):
+            self.sent = []
+
+        def sendall(self, data):
+            self.sent.append(data)
+
+    fp, sock = io.BytesIO(), Socket()
+    encode_into(rows, fp, default=dataclass_default, ensure_ascii=False)
+    encode_into(rows, sock, default=dataclass_default, ensure_ascii=False, buffer_size=10)
+
+    assert fp.getvalue() == expected
+    assert b"".join(sock.sent) == expected
+    assert len(sock.sent) > 1
+
+    buffer = bytearray()
+    assert encode_into("é", buffer, ensure_ascii=False) == 4
+    assert buffer == '"é"'.encode("utf-8")
+
+
+def test_encode_into_circular():
+    data = {"a": []}
+    data["a"].append(data)
+    with pytest.raises(ValueError):
+        encode_into(data, bytearray())
+
+
+def test_load_stream():
+    data = [
+        12345,
+        -1.5e10,
+        "caf\u00e9 \u2603",
+        {"nested": [1, 2, {"a": None}]},
+        [],
+        {},
+        True,
+        False,
+        None,
+        "x" * 100,
+    ]
+    text = " \n[ " + " ,\n ".join(json.dumps(v, ensure_ascii=False) for v in data) + " ]\n "
+
+    # Small chunks split numbers, strings and multibyte characters
+    for chunk_size in [1, 2, 3, 7, 64, 1 << 16]:
+        assert list(load_stream(io.StringIO(text), chunk_size=chunk_size)) == data
+        assert list(
+            load_stream(io.BytesIO(text.encode("utf-8")), chunk_size=chunk_size)
+        ) == data
+
+
+def test_load_stream_decoders():
+    text = json.dumps(list(make_rows(100)), default=dataclass_default)
+    expected = list(make_rows(100))
+
+    rows = load_stream(io.StringIO(text), decoder=dataclass_decoder(Row), chunk_size=10)
+    assert list(rows) == expected
+
+    rows = load_stream(io.StringIO(text), object_hook=lambda d: Row(**d), chunk_size=10)
+    assert list(rows) == expected
+
+
+def test_load_stream_empty():
+    for text in ["[]", " [ \n ] ", "\ufeff[]"]:
+        assert list(load_stream(io.BytesIO(text.encode("utf-8")), chunk_size=1)) == []
+
+
+@pytest.mark.parametrize(
+    "text", ["", "{}", "[1, 2", "[1 2]", "[1,]", "[1] 2", '["abc', "[1,"]
+)
+def test_load_stream_invalid(text):
+    with pytest.raises(json.JSONDecodeError):
+        list(load_stream(io.StringIO(text), chunk_size=2))
+
+
+def test_load_stream_lazy():
+    fp = io.StringIO(json.dumps(list(range(100_000))))
+    stream = load_stream(fp, chunk_size=1000)
+
+    assert next(stream) == 0
+    assert fp.tell() < 10_000